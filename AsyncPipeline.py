@@ -0,0 +1,380 @@
+# General Python Imports
+from typing import Optional, Set
+import argparse
+import asyncio
+import os
+
+# Parallel Processing Imports
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from BatchProcessor import (WORKER_DIED, add_worker_arguments, list_pdf_files, process_document,
+                            worker_config_from_args, worker_initializer)
+from ResultWriters import RESULT_WRITERS, get_result_writer
+
+
+# Marks the end of the Documents on a queue
+_END_OF_QUEUE = None
+
+
+class WorkerPool(object):
+    """Pool of worker processes, each holding a warm DocumentExtractor (Refer BatchProcessor.init_worker()).
+
+    A ProcessPoolExecutor is broken for good once one of its workers dies (Eg. Killed by the OOM killer), and
+    fails every Document handed to it afterwards. The pool is then recreated (Refer replace()), unless it broke
+    <max_restarts> times in a row without processing any Document, where the pipeline is stopped instead.
+
+    The break fails every Document in flight, not only the one that killed its worker. These Documents are
+    retried once, one at a time, within a single-worker executor (Refer process()), so a Document is only
+    recorded as failed when it breaks a worker on its own.
+    """
+
+    def __init__(self, workers: int, worker_config: dict, max_restarts: int = 3):
+        """Constructor for the class WorkerPool().
+
+        Args:
+            workers (int): Number of worker processes
+            worker_config (dict): Keyword arguments of BatchProcessor.init_worker()
+            max_restarts (int): Max. number of times in a row the pool is recreated
+        """
+        self.workers = workers
+        self.worker_config = worker_config
+        self.max_restarts = max_restarts
+
+        # Times the pool was recreated since a Document was last processed
+        self.restarts = 0
+
+        self.executor = self._create_executor(self.workers)
+
+        # Runs the Documents failed by a break, one at a time. Created on the first break
+        self.retry_executor: Optional[ProcessPoolExecutor] = None
+        self.retry_lock = asyncio.Lock()
+
+    def _create_executor(self, workers: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=workers, initializer=worker_initializer(self.worker_config))
+
+    async def process(self, pdf_file: str) -> tuple:
+        """Processes the Document <pdf_file> within the pool (Refer BatchProcessor.process_document()).
+
+        Returns:
+            tuple: (pdf_file, result, error, metrics). A Document which fails (Eg. Breaks a worker on its own) is
+                   returned with the reason
+
+        Raises:
+            RuntimeError: If the pool broke <max_restarts> times in a row (Refer replace())
+        """
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+
+        try:
+            item = await loop.run_in_executor(executor, process_document, pdf_file)
+            self.restarts = 0
+
+        except BrokenProcessPool:
+
+            # Any of the Documents in flight may have broken the pool. Retry this one alone
+            self.replace(executor)
+            item = await self._retry(pdf_file)
+
+        except Exception as e:
+            item = (pdf_file, None, str(e), None)
+
+        return item
+
+    async def _retry(self, pdf_file: str) -> tuple:
+        """Processes <pdf_file> alone within the single-worker retry executor. Refer process()."""
+
+        loop = asyncio.get_running_loop()
+
+        async with self.retry_lock:
+
+            if self.retry_executor is None:
+                self.retry_executor = self._create_executor(1)
+
+            try:
+                item = await loop.run_in_executor(self.retry_executor, process_document, pdf_file)
+                self.restarts = 0
+
+            except BrokenProcessPool as e:
+                self.retry_executor.shutdown(wait=False)
+                self.retry_executor = None
+
+                item = (pdf_file, None, WORKER_DIED + ": " + (str(e) or "Worker pool broken"), None)
+
+            except Exception as e:
+                item = (pdf_file, None, str(e), None)
+
+        return item
+
+    def replace(self, broken_executor: ProcessPoolExecutor) -> None:
+        """Recreates the pool, once <broken_executor> is broken. A no-op if it was already recreated.
+
+        Raises:
+            RuntimeError: If the pool broke <max_restarts> times in a row (Eg. The workers fail to set up)
+        """
+        if broken_executor is not self.executor:
+            return
+
+        broken_executor.shutdown(wait=False)
+
+        if self.restarts >= self.max_restarts:
+            raise RuntimeError("Worker pool broke " + str(self.restarts + 1) + " times in a row, stopping")
+
+        self.restarts += 1
+        self.executor = self._create_executor(self.workers)
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False)
+
+        if self.retry_executor is not None:
+            self.retry_executor.shutdown(wait=False)
+
+
+async def discover_directory(base_path: str, ingest_queue: asyncio.Queue) -> None:
+    """Source Stage: Queues every PDF Document within the folder <base_path> (Once).
+
+    Args:
+        base_path (str): The folder containing the PDF Documents
+        ingest_queue (asyncio.Queue): Queue of the full paths of the PDF Documents to process
+    """
+    loop = asyncio.get_running_loop()
+
+    for pdf_file in await loop.run_in_executor(None, list_pdf_files, base_path):
+        await ingest_queue.put(pdf_file)
+
+
+async def watch_directory(base_path: str, ingest_queue: asyncio.Queue, poll_interval: float = 2.0) -> None:
+    """Source Stage: Watches the folder <base_path>, and queues every PDF Document that shows up. Runs forever.
+
+    A PDF is queued once its size is stable across two polls (So partially copied files are not picked up).
+
+    Args:
+        base_path (str): The folder to watch
+        ingest_queue (asyncio.Queue): Queue of the full paths of the PDF Documents to process
+        poll_interval (float): Seconds between two scans of the folder
+    """
+    loop = asyncio.get_running_loop()
+
+    seen_files: Set[str] = set()
+    file_sizes = {}
+
+    while True:
+
+        for pdf_file in await loop.run_in_executor(None, list_pdf_files, base_path):
+
+            if pdf_file in seen_files:
+                continue
+
+            try:
+                size = os.path.getsize(pdf_file)
+            except OSError:
+                continue
+
+            if file_sizes.get(pdf_file) == size:
+                seen_files.add(pdf_file)
+                file_sizes.pop(pdf_file)
+                await ingest_queue.put(pdf_file)
+
+            else:
+                file_sizes[pdf_file] = size
+
+        await asyncio.sleep(poll_interval)
+
+
+async def serve_socket(host: str, port: int, ingest_queue: asyncio.Queue) -> None:
+    """Source Stage: Accepts PDF paths over a local TCP socket (One path per line), and queues them. Runs forever.
+
+    Every accepted path is acknowledged with "queued <path>" (Or "error <reason>"). As the ingest queue is
+    bounded, a client is slowed down (Not rejected) while the pipeline is busy.
+
+    Eg. printf '/data/uploads/report.pdf\\n' | nc localhost 8765
+
+    Args:
+        host (str): Interface to listen on (Keep it local, Eg. 127.0.0.1)
+        port (int): Port to listen on
+        ingest_queue (asyncio.Queue): Queue of the full paths of the PDF Documents to process
+    """
+    async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+
+        try:
+            while True:
+
+                line = await reader.readline()
+                if not line:
+                    break
+
+                pdf_file = os.path.abspath(line.decode("utf-8").strip())
+
+                if not os.path.isfile(pdf_file):
+                    writer.write(("error file not found " + pdf_file + "\n").encode("utf-8"))
+
+                else:
+                    await ingest_queue.put(pdf_file)
+                    writer.write(("queued " + pdf_file + "\n").encode("utf-8"))
+
+                await writer.drain()
+
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle_client, host, port)
+
+    async with server:
+        await server.serve_forever()
+
+
+async def extract_documents(pool: WorkerPool,
+                            ingest_queue: asyncio.Queue,
+                            output_queue: asyncio.Queue) -> None:
+    """Extraction Stage: Processes the queued Documents within <pool> (Refer BatchProcessor.process_document()).
+
+    Runs until it reads the end of the Documents from <ingest_queue>. A Document which fails (Eg. Kills its
+    worker, once retried. Refer WorkerPool) is queued as failed, with the reason.
+
+    Args:
+        pool (WorkerPool): Pool of worker processes
+        ingest_queue (asyncio.Queue): Queue of the full paths of the PDF Documents to process
+        output_queue (asyncio.Queue): Queue of the (pdf_file, result, error, metrics) of every processed Document
+    """
+    while True:
+
+        pdf_file = await ingest_queue.get()
+
+        if pdf_file is _END_OF_QUEUE:
+            break
+
+        await output_queue.put(await pool.process(pdf_file))
+
+
+async def write_results(output_queue: asyncio.Queue, output_format: str, results_path: str) -> None:
+    """Output Stage: Writes the results of every processed Document, as they come in.
+
+    Appends to the sink of <output_format> (Refer ResultWriters), Eg. "csv" appends to the same CSVs as main . py
+    (Name_Org_Results.csv/ Target_Price_Reco_Results.csv). "csv"/ "jsonl" results show up right away, "parquet"
+    results once a row group is full (Or the pipeline stops). Runs until it reads the end of the Documents.
+
+    Args:
+        output_queue (asyncio.Queue): Queue of the (pdf_file, result, error, metrics) of every processed Document
+        output_format (str): Name of the format (Refer ResultWriters.RESULT_WRITERS)
+        results_path (str): Folder the results are written to
+    """
+    with get_result_writer(output_format, results_path, resume=True) as writer:
+
+        while True:
+
+            item = await output_queue.get()
+
+            if item is _END_OF_QUEUE:
+                break
+
+            pdf_file, result, error, metrics = item
+
+            # Recorded with the reason, in Results//Failed_Documents.csv
+            if error is not None:
+                writer.write_failure(os.path.basename(pdf_file), error)
+                continue
+
+            writer.write(os.path.basename(pdf_file), result, metrics)
+
+
+async def run_pipeline(source: str = "directory",
+                       base_path: str = "needle_pdf_docs",
+                       host: str = "127.0.0.1",
+                       port: int = 8765,
+                       workers: int = 2,
+                       queue_size: int = 64,
+                       output_format: str = "csv",
+                       results_path: str = "Results",
+                       worker_config: Optional[dict] = None) -> None:
+    """Runs the Asynchronous Document Pipeline.
+
+    Stages (Connected through bounded queues, so memory stays capped and File I/O overlaps the extraction):
+        1) Source: Discovers the Documents to process ("directory", "watch" or "socket". Refer discover_directory(),
+           watch_directory() and serve_socket())
+        2) Extraction: <workers> Documents at a time, within a pool of <workers> processes, each holding a warm
+           DocumentExtractor (Refer extract_documents())
+        3) Output: Writes the results (Refer write_results())
+
+    With the "directory" source, the pipeline stops once all the Documents are processed. The "watch" and
+    "socket" sources run until the pipeline is cancelled (Eg. Ctrl+C).
+
+    Args:
+        source (str): "directory", "watch" or "socket"
+        base_path (str): Folder containing (Or receiving) the PDF Documents, for the "directory"/ "watch" source
+        host (str): Interface to listen on, for the "socket" source
+        port (int): Port to listen on, for the "socket" source
+        workers (int): Number of worker processes
+        queue_size (int): Max. number of Documents waiting on every queue
+        output_format (str): Name of the format (Refer ResultWriters.RESULT_WRITERS)
+        results_path (str): Folder the results are written to
+        worker_config (dict): Keyword arguments of BatchProcessor.init_worker(), setting up the DocumentExtractor
+                              of every worker (Refer BatchProcessor.worker_config_from_args()). None for the
+                              defaults
+    """
+    ingest_queue = asyncio.Queue(maxsize=queue_size)
+    output_queue = asyncio.Queue(maxsize=queue_size)
+
+    pool = WorkerPool(workers, worker_config or {})
+
+    extractors = [asyncio.create_task(extract_documents(pool, ingest_queue, output_queue))
+                  for _ in range(workers)]
+    writer = asyncio.create_task(write_results(output_queue, output_format, results_path))
+
+    if source == "directory":
+        source_task = asyncio.create_task(discover_directory(base_path, ingest_queue))
+    elif source == "watch":
+        source_task = asyncio.create_task(watch_directory(base_path, ingest_queue))
+    elif source == "socket":
+        source_task = asyncio.create_task(serve_socket(host, port, ingest_queue))
+    else:
+        source_task = None
+
+    try:
+        if source_task is None:
+            raise ValueError("Unknown source: " + source)
+
+        # The Extraction/ Output Stages only stop before the end of the Documents on a failure (Eg. The pool broke
+        # too many times. Refer WorkerPool), which stops the pipeline too
+        done, _ = await asyncio.wait([source_task, writer] + extractors, return_when=asyncio.FIRST_COMPLETED)
+
+        for task in done:
+            task.result()
+
+        # All the Documents are queued. Let every Stage drain its queue, and stop
+        for _ in extractors:
+            await ingest_queue.put(_END_OF_QUEUE)
+
+        await asyncio.gather(*extractors)
+
+        await output_queue.put(_END_OF_QUEUE)
+        await writer
+
+    finally:
+        for task in extractors + [writer, source_task]:
+            if task is not None:
+                task.cancel()
+
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Processes PDFs through an Asynchronous Pipeline")
+    parser.add_argument("--source", default="directory", choices=["directory", "watch", "socket"])
+    parser.add_argument("--base_path", default="needle_pdf_docs", help="Folder containing the PDF Documents")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=2, help="Number of worker processes")
+    parser.add_argument("--queue_size", type=int, default=64, help="Max. number of Documents waiting on a queue")
+    parser.add_argument("--output_format", default="csv", choices=list(RESULT_WRITERS))
+    parser.add_argument("--results_path", default="Results")
+    parser.add_argument("--cache_path", default=None, help="SQLite file caching the Extraction Results")
+    add_worker_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run_pipeline(args.source, args.base_path, args.host, args.port, args.workers,
+                                 args.queue_size, args.output_format, args.results_path,
+                                 worker_config_from_args(args, args.cache_path)))
+    except KeyboardInterrupt:
+        pass
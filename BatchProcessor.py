@@ -0,0 +1,579 @@
+# General Python Imports
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import argparse
+import functools
+import os
+import signal
+import time
+
+# Parallel Processing Imports
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from multiprocessing.connection import Connection, wait
+
+from BlockCache import BlockCache
+from DocumentExtractor import GAZETTEER_COMPONENTS, DocumentExtractor, DocumentAnalysis, DocumentMetrics
+from PageFilter import PageFilter
+from PdfBackends import PDF_BACKENDS
+from ResultCache import ResultCache
+
+
+# Every worker process holds its own DocumentExtractor (And hence its own Spacy Model).
+# It is set up once per worker through init_worker(), and reused for every Document the worker processes.
+_worker_extractor = None
+
+# DocumentMetrics of the last Document processed by the worker (Refer DocumentExtractor.hooks)
+_worker_metrics = None
+
+# Reasons a Document fails within the supervised mode (Refer SupervisedWorker), as the prefix of its error.
+# Any other failure is reported through the Exception raised
+TIMEOUT = "timeout"
+MEMORY_LIMIT = "memory_limit"
+WORKER_DIED = "worker_died"
+
+
+def init_worker(*,
+                cache_path: Optional[str] = None,
+                cache_max_bytes: int = 512 * 1024 * 1024,
+                batch_size: int = 16,
+                n_process: int = 1,
+                pdf_backend: str = "pypdf2",
+                gazetteer: str = "entity_ruler",
+                gazetteer_before_ner: bool = False,
+                page_filter: bool = False,
+                block_cache_size: int = 0,
+                canonicalize_threshold: Optional[float] = None,
+                memory_bounded: bool = False,
+                rss_budget_mb: Optional[float] = None) -> None:
+    """Initializer for every worker process of the pool.
+
+    Sets up the worker's DocumentExtractor, and warms up Spacy's Model (train_entity_ruler()) once,
+    so the cost of loading the Model is not paid again for every Document. The settings are keyword-only, and
+    handed around as a single dict (Refer worker_config_from_args()/ worker_initializer()).
+
+    Args:
+        cache_path (str): Path to the ResultCache SQLite file. None disables the cache
+        cache_max_bytes (int): Max. size of the ResultCache
+        batch_size (int): Number of pages handed to Spacy's nlp.pipe() at a time
+        n_process (int): Number of processes used by Spacy's nlp.pipe()
+        pdf_backend (str): Name of the PDF Text Extraction Backend (Refer PdfBackends)
+        gazetteer (str): Component tagging the Person/ Company names (Refer DocumentExtractor.gazetteer)
+        gazetteer_before_ner (bool): Add the gazetteer component before "ner", instead of after it
+        page_filter (bool): Skip the NER for the pages not worth it (Refer PageFilter)
+        block_cache_size (int): Max. number of pages/ Email windows whose Spacy results are kept for reuse across
+                                the Documents of the worker (Refer BlockCache). 0 disables the reuse
+        canonicalize_threshold (float): Link the Companies found to the Company database, at this Min. Similarity
+                                        (Refer CompanyCanonicalizer). None disables the linking
+        memory_bounded (bool): Keep the memory used by a Document bounded (Refer DocumentExtractor.memory_bounded)
+        rss_budget_mb (float): RSS budget of the worker, in MB (Refer DocumentExtractor.rss_budget_mb). None
+                               disables the check
+    """
+    global _worker_extractor
+
+    result_cache = None
+    if cache_path is not None:
+        result_cache = ResultCache(cache_path, cache_max_bytes)
+
+    canonicalizer = None
+    if canonicalize_threshold is not None:
+
+        # numpy/ scipy are only needed for the linking
+        from CompanyCanonicalizer import CompanyCanonicalizer
+
+        canonicalizer = CompanyCanonicalizer(threshold=canonicalize_threshold)
+
+    _worker_extractor = DocumentExtractor(result_cache=result_cache, batch_size=batch_size, n_process=n_process,
+                                          pdf_backend=pdf_backend, hooks=[_record_metrics], gazetteer=gazetteer,
+                                          gazetteer_before_ner=gazetteer_before_ner,
+                                          page_filter=PageFilter() if page_filter else None,
+                                          block_cache=BlockCache(block_cache_size) if block_cache_size > 0 else None,
+                                          canonicalizer=canonicalizer, memory_bounded=memory_bounded,
+                                          rss_budget_mb=rss_budget_mb)
+    _worker_extractor.train_entity_ruler()
+
+
+def _record_metrics(metrics: DocumentMetrics) -> None:
+    """DocumentExtractor hook, which keeps the DocumentMetrics of the last processed Document."""
+
+    global _worker_metrics
+
+    _worker_metrics = metrics
+
+
+def process_document(pdf_file: str) -> Tuple[str, Optional[DocumentAnalysis], Optional[str], Optional[dict]]:
+    """Runs DocumentExtractor.analyze() over a single Document, within a worker process.
+
+    Any Exception raised while processing the Document is captured and returned (instead of being raised),
+    so a single bad Document does not bring down the whole batch.
+
+    Args:
+        pdf_file (str): The full path to the PDF Document
+
+    Returns:
+        pdf_file (str): The full path to the PDF Document
+        result (DocumentAnalysis): The combined results of all the Extractors. None on a failure
+        error (str): The Exception raised while processing the Document. None on a success
+        metrics (dict): The DocumentMetrics (Refer DocumentMetrics.to_dict()) of the Document, with its
+                        "content_hash" always set. None on a failure
+    """
+    global _worker_metrics
+
+    _worker_metrics = None
+
+    try:
+        result = _worker_extractor.analyze(pdf_file)
+
+    # Raised once the worker hits its memory limit (Refer SupervisedWorker)
+    except MemoryError as e:
+        return pdf_file, None, MEMORY_LIMIT + ": " + (str(e) or "Out of memory"), None
+
+    except Exception as e:
+        return pdf_file, None, str(e), None
+
+    return _processed_document(pdf_file, result)
+
+
+def process_documents(pdf_files: List[str]) -> List[Tuple[str, Optional[DocumentAnalysis], Optional[str],
+                                                          Optional[dict]]]:
+    """Runs DocumentExtractor.analyze_many() over a chunk of Documents, within a worker process.
+
+    The pages of all the Documents of the chunk go through shared nlp.pipe() calls, so Spacy's batches stay full
+    across the (Often short) Documents. An Exception stops analyze_many() for the whole chunk: The Documents not
+    yet processed are then processed again one by one (Refer process_document()), so only the bad Document fails.
+
+    Args:
+        pdf_files (List[str]): The full paths to the PDF Documents
+
+    Returns:
+        List[Tuple[str, Optional[DocumentAnalysis], Optional[str], Optional[dict]]]: (pdf_file, result, error,
+                                                                                    metrics) for every Document,
+                                                                                    in order. Refer
+                                                                                    process_document()
+    """
+    global _worker_metrics
+
+    _worker_metrics = None
+    items = []
+
+    try:
+        for pdf_file, result in zip(pdf_files, _worker_extractor.analyze_many(pdf_files)):
+            items.append(_processed_document(pdf_file, result))
+            _worker_metrics = None
+
+    except Exception:
+        items.extend(process_document(pdf_file) for pdf_file in pdf_files[len(items):])
+
+    return items
+
+
+def _processed_document(pdf_file: str,
+                        result: DocumentAnalysis) -> Tuple[str, Optional[DocumentAnalysis], Optional[str], dict]:
+    """Returns the (pdf_file, result, error, metrics) of a processed Document. Refer process_document()."""
+
+    metrics = _worker_metrics.to_dict() if _worker_metrics is not None else {}
+
+    # Hashed here (Without a ResultCache, which already hashed the PDF), so the parent never re-reads the PDF
+    if metrics.get("content_hash") is None:
+        metrics["content_hash"] = ResultCache.file_content_hash(pdf_file)
+
+    return pdf_file, result, None, metrics
+
+
+def _chunks(pdf_files: Iterable[str], chunksize: int) -> Iterator[List[str]]:
+    """Yields <pdf_files> in lists of up to <chunksize> Documents."""
+
+    chunk = []
+
+    for pdf_file in pdf_files:
+
+        chunk.append(pdf_file)
+
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def add_worker_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the command line options setting up the DocumentExtractor of every worker (Refer init_worker()) to
+    <parser>. Shared by main.py and AsyncPipeline.py; read back through worker_config_from_args()."""
+
+    parser.add_argument("--cache_max_mb", type=int, default=512, help="Max. size of the Extraction Results cache")
+    parser.add_argument("--batch_size", type=int, default=16, help="Number of pages handed to SPACY at a time")
+    parser.add_argument("--n_process", type=int, default=1,
+                        help="Number of processes used by SPACY's nlp.pipe(), within every worker")
+    parser.add_argument("--pdf_backend", default="pypdf2", choices=list(PDF_BACKENDS),
+                        help="PDF Text Extraction Backend (Refer PdfBackends.py)")
+    parser.add_argument("--gazetteer", default="entity_ruler", choices=list(GAZETTEER_COMPONENTS),
+                        help="SPACY component tagging the Indian Person/ Company names")
+    parser.add_argument("--gazetteer_before_ner", action="store_true",
+                        help="Run the gazetteer component before SPACY's NER (Its names take precedence)")
+    parser.add_argument("--page_filter", action="store_true",
+                        help="Skip SPACY's NER on low-text, numeric (Tables) and repeated pages (Refer PageFilter.py)")
+    parser.add_argument("--block_cache_size", type=int, default=0,
+                        help="Reuse SPACY's results for up to this many pages/ Email windows repeated across the "
+                             "Documents (Eg. Broker disclaimers. Refer BlockCache.py). 0 disables the reuse")
+    parser.add_argument("--canonicalize_threshold", type=float, default=None,
+                        help="Link the Companies found to Company_Names_Dataset/bse_companies.csv, at this Min. "
+                             "Similarity (0 - 1. Eg. 0.75. Refer CompanyCanonicalizer.py). Off by default")
+    parser.add_argument("--memory_bounded", action="store_true",
+                        help="Keep the memory used by a PDF bounded, whatever its number of pages: Pages are "
+                             "extracted/ parsed in fixed-size windows, and long pages are split at sentence boundaries")
+    parser.add_argument("--rss_budget_mb", type=float, default=None,
+                        help="RSS budget of every worker, in MB. A worker over it reloads its SPACY Model before "
+                             "its next PDF. Off by default")
+
+
+def worker_config_from_args(args: argparse.Namespace, cache_path: Optional[str]) -> dict:
+    """Returns the keyword arguments of init_worker() set through the options of add_worker_arguments().
+
+    Args:
+        args (argparse.Namespace): The parsed command line
+        cache_path (str): Path to the ResultCache SQLite file. None disables the cache
+    """
+    return {"cache_path": cache_path,
+            "cache_max_bytes": args.cache_max_mb * 1024 * 1024,
+            "batch_size": args.batch_size,
+            "n_process": args.n_process,
+            "pdf_backend": args.pdf_backend,
+            "gazetteer": args.gazetteer,
+            "gazetteer_before_ner": args.gazetteer_before_ner,
+            "page_filter": args.page_filter,
+            "block_cache_size": args.block_cache_size,
+            "canonicalize_threshold": args.canonicalize_threshold,
+            "memory_bounded": args.memory_bounded,
+            "rss_budget_mb": args.rss_budget_mb}
+
+
+def worker_initializer(worker_config: dict) -> functools.partial:
+    """Returns the initializer of a ProcessPoolExecutor, running init_worker(**<worker_config>) in every worker."""
+
+    return functools.partial(init_worker, **worker_config)
+
+
+def _supervised_worker_main(connection: Connection, worker_config: dict, memory_limit_mb: Optional[float]) -> None:
+    """Entry point of a SupervisedWorker process: Processes the Documents sent over <connection>, one at a time.
+
+    Sends back "ready" once init_worker(**<worker_config>) is done, then the result of process_document() for every
+    Document received, until it receives None (Or the supervisor goes away).
+    """
+    # A process group of its own, so killing the worker also kills the processes it started (Eg. Spacy's
+    # nlp.pipe(n_process > 1) workers. Refer SupervisedWorker.stop())
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+
+    init_worker(**worker_config)
+
+    if memory_limit_mb is not None:
+
+        # The limit is on top of the memory the worker holds once set up (Mostly the Spacy Model)
+        import resource
+
+        with open("/proc/self/statm") as statm:
+            address_space = int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+
+        limit = address_space + int(memory_limit_mb * 1024 * 1024)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    connection.send("ready")
+
+    while True:
+
+        try:
+            pdf_file = connection.recv()
+        except EOFError:
+            return
+
+        if pdf_file is None:
+            return
+
+        connection.send(process_document(pdf_file))
+
+
+class SupervisedWorker(object):
+    """A worker process of process_batch()'s supervised mode, which can be killed and replaced at any time.
+
+    The worker processes a single Document at a time. The supervisor (Refer _process_supervised()) kills it once
+    the Document runs over its wall-clock limit, and replaces it after <max_tasks> Documents, or after it hits
+    its memory limit/ dies.
+
+    The worker is not a daemon process, as it may start processes of its own (Spacy's nlp.pipe() with
+    n_process > 1), which daemon processes are not allowed to. It is always stopped explicitly instead (Refer
+    stop(); _process_supervised() stops all its workers on the way out).
+    """
+
+    def __init__(self, worker_config: dict, memory_limit_mb: Optional[float] = None):
+        """Constructor for the class SupervisedWorker(). Starts the worker process.
+
+        Args:
+            worker_config (dict): Keyword arguments of init_worker()
+            memory_limit_mb (float): Memory (Address space, in MB) the worker may add over the one held once set
+                                     up, through RLIMIT_AS (Linux only). None for no limit
+        """
+        self.connection, worker_connection = multiprocessing.Pipe()
+
+        self.process = multiprocessing.Process(target=_supervised_worker_main,
+                                               args=(worker_connection, worker_config, memory_limit_mb),
+                                               daemon=False)
+        self.process.start()
+        worker_connection.close()
+
+        # Whether init_worker() is done; the Document (And its index) being processed, and since when
+        self.ready = False
+        self.pdf_file = None
+        self.index = None
+        self.start_time = None
+
+        # Number of Documents processed so far
+        self.tasks = 0
+
+    def submit(self, index: int, pdf_file: str) -> None:
+        """Sends a Document to the (Ready, idle) worker."""
+
+        self.index, self.pdf_file, self.start_time = index, pdf_file, time.monotonic()
+        self.connection.send(pdf_file)
+
+    def stop(self, kill: bool = False) -> None:
+        """Stops the worker: Asks it to exit (Or kills it, with <kill>) and waits for it."""
+
+        if kill or not self.process.is_alive():
+            self.kill()
+
+        else:
+            try:
+                self.connection.send(None)
+            except OSError:
+                self.kill()
+
+        self.process.join()
+        self.connection.close()
+
+    def kill(self) -> None:
+        """Kills the worker, along with the processes it started (Its process group, where available)."""
+
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(self.process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+        self.process.kill()
+
+
+def _process_supervised(pdf_files: Iterable[str],
+                        workers: int,
+                        worker_config: dict,
+                        timeout: Optional[float],
+                        memory_limit_mb: Optional[float],
+                        max_tasks_per_worker: Optional[int]) -> Iterator[Tuple[str,
+                                                                              Optional[DocumentAnalysis],
+                                                                              Optional[str],
+                                                                              Optional[dict]]]:
+    """The supervised mode of process_batch(): Every Document runs within a SupervisedWorker, under <timeout>.
+
+    A Document running over <timeout> Seconds has its worker killed (And replaced), and is reported with the
+    error "timeout: ...". A worker hitting its memory limit ("memory_limit: ...") or dying while processing a
+    Document ("worker_died: ...") is replaced too. Workers are also replaced after <max_tasks_per_worker>
+    Documents, so leaks within a worker stay bounded.
+
+    Returns:
+        Iterator[Tuple[str, Optional[DocumentAnalysis], Optional[str], Optional[dict]]]: Refer process_batch()
+    """
+    pdf_files = iter(pdf_files)
+    pool = [SupervisedWorker(worker_config, memory_limit_mb) for _ in range(max(workers, 1))]
+
+    # Results not yet yielded (Results are yielded in the order of <pdf_files>), by index
+    results: Dict[int, tuple] = {}
+    next_index, submitted = 0, 0
+    exhausted = False
+
+    try:
+        while True:
+
+            for worker in pool:
+                if worker.ready and worker.pdf_file is None and not exhausted:
+
+                    pdf_file = next(pdf_files, None)
+
+                    if pdf_file is None:
+                        exhausted = True
+                    else:
+                        worker.submit(submitted, pdf_file)
+                        submitted += 1
+
+            while next_index in results:
+                yield results.pop(next_index)
+                next_index += 1
+
+            if exhausted and next_index == submitted:
+                return
+
+            # Wait for a worker to get ready/ report back, or for the earliest deadline of the busy ones
+            wait_time = None
+            if timeout is not None:
+                deadlines = [worker.start_time + timeout for worker in pool if worker.pdf_file is not None]
+
+                if deadlines:
+                    wait_time = max(min(deadlines) - time.monotonic(), 0)
+
+            ready_connections = wait([worker.connection for worker in pool], wait_time)
+
+            for slot, worker in enumerate(pool):
+
+                replace, error = False, None
+
+                if worker.connection in ready_connections:
+
+                    try:
+                        message = worker.connection.recv()
+
+                    except (EOFError, OSError):
+                        if not worker.ready:
+                            raise RuntimeError("Worker process failed to start (Exit code: %s)"
+                                               % worker.process.exitcode)
+
+                        worker.process.join()
+                        replace = True
+
+                        if worker.pdf_file is not None:
+                            error = WORKER_DIED + ": Exit code %s" % worker.process.exitcode
+
+                    else:
+                        if message == "ready":
+                            worker.ready = True
+                            continue
+
+                        results[worker.index] = message
+                        worker.tasks += 1
+
+                        replace = (message[2] is not None and message[2].startswith(MEMORY_LIMIT) or
+                                   max_tasks_per_worker is not None and worker.tasks >= max_tasks_per_worker)
+
+                elif (timeout is not None and worker.pdf_file is not None and
+                      time.monotonic() - worker.start_time >= timeout):
+                    replace, error = True, TIMEOUT + ": Exceeded the %ss limit" % timeout
+
+                if error is not None:
+                    results[worker.index] = (worker.pdf_file, None, error, None)
+
+                if replace:
+                    worker.stop(kill=error is not None)
+                    pool[slot] = SupervisedWorker(worker_config, memory_limit_mb)
+
+                elif worker.connection in ready_connections:
+                    worker.pdf_file = None
+
+    finally:
+        for worker in pool:
+            worker.stop(kill=worker.pdf_file is not None)
+
+
+def list_pdf_files(base_path: str) -> List[str]:
+    """Lists the full path of every PDF Document within the folder <base_path>.
+
+    Args:
+        base_path (str): The folder containing the PDF Documents
+
+    Returns:
+        List[str]: Full path of every PDF Document in the folder
+    """
+    pdf_files = []
+
+    for filename in os.listdir(base_path):
+        if filename.endswith(".pdf"):
+            pdf_files.append(os.path.abspath(base_path + "//" + filename))
+
+    return pdf_files
+
+
+def process_batch(pdf_files: Iterable[str],
+                  workers: int = 1,
+                  chunksize: int = 1,
+                  cache_path: Optional[str] = None,
+                  cache_max_bytes: int = 512 * 1024 * 1024,
+                  batch_size: int = 16,
+                  n_process: int = 1,
+                  pdf_backend: str = "pypdf2",
+                  gazetteer: str = "entity_ruler",
+                  gazetteer_before_ner: bool = False,
+                  page_filter: bool = False,
+                  block_cache_size: int = 0,
+                  canonicalize_threshold: Optional[float] = None,
+                  memory_bounded: bool = False,
+                  rss_budget_mb: Optional[float] = None,
+                  timeout: Optional[float] = None,
+                  memory_limit_mb: Optional[float] = None,
+                  max_tasks_per_worker: Optional[int] = None) -> Iterator[Tuple[str,
+                                                                 Optional[DocumentAnalysis],
+                                                                 Optional[str],
+                                                                 Optional[dict]]]:
+    """Processes a batch of Documents, fanning them out to a pool of <workers> processes.
+
+    Results are yielded back as soon as they are available, in the same order as <pdf_files>.
+    With workers <= 1, the Documents are processed serially within the calling process.
+
+    Setting any of <timeout>, <memory_limit_mb> or <max_tasks_per_worker> turns on the supervised mode
+    (Refer _process_supervised()): Every Document is processed within a worker process which is killed and
+    replaced when the Document hangs/ runs out of memory, so a pathological PDF only fails itself. The failure
+    is reported as the error of the Document ("timeout: ...", "memory_limit: ...", "worker_died: ...").
+    Documents are then handed to the workers one at a time (<chunksize> does not apply).
+
+    Args:
+        pdf_files (Iterable[str]): The full paths to the PDF Documents
+        workers (int): Number of worker processes
+        chunksize (int): Number of Documents handed to a worker at a time, whose pages share Spacy's batches
+                         (Refer process_documents()). Also applies with workers <= 1
+        cache_path (str): Path to the ResultCache SQLite file, shared by all the workers. None disables the cache
+        cache_max_bytes (int): Max. size of the ResultCache
+        batch_size (int): Number of pages handed to Spacy's nlp.pipe() at a time, within every worker
+        n_process (int): Number of processes used by Spacy's nlp.pipe(), within every worker
+        pdf_backend (str): Name of the PDF Text Extraction Backend (Refer PdfBackends)
+        gazetteer (str): Component tagging the Person/ Company names (Refer DocumentExtractor.gazetteer)
+        gazetteer_before_ner (bool): Add the gazetteer component before "ner", instead of after it
+        page_filter (bool): Skip the NER for the pages not worth it (Refer PageFilter)
+        block_cache_size (int): Max. number of pages/ Email windows whose Spacy results are reused across the
+                                Documents of every worker (Refer BlockCache). 0 disables the reuse
+        canonicalize_threshold (float): Link the Companies found to the Company database, at this Min. Similarity
+                                        (Refer CompanyCanonicalizer). None disables the linking
+        memory_bounded (bool): Keep the memory used by a Document bounded (Refer DocumentExtractor.memory_bounded)
+        rss_budget_mb (float): RSS budget of every worker, in MB (Refer DocumentExtractor.rss_budget_mb). None
+                               disables the check
+        timeout (float): Wall-clock limit per Document, in Seconds. None for no limit
+        memory_limit_mb (float): Memory a worker may use for a Document, in MB, over the one it holds once set up
+                                 (Refer SupervisedWorker). None for no limit
+        max_tasks_per_worker (int): Replace every worker after this many Documents. None keeps the workers
+
+    Returns:
+        Iterator[Tuple[str, Optional[DocumentAnalysis], Optional[str], Optional[dict]]]: (pdf_file, result, error,
+                                                                                        metrics) for every
+                                                                                        Document.
+                                                                                        Refer process_document()
+    """
+    worker_config = {"cache_path": cache_path, "cache_max_bytes": cache_max_bytes, "batch_size": batch_size,
+                     "n_process": n_process, "pdf_backend": pdf_backend, "gazetteer": gazetteer,
+                     "gazetteer_before_ner": gazetteer_before_ner, "page_filter": page_filter,
+                     "block_cache_size": block_cache_size, "canonicalize_threshold": canonicalize_threshold,
+                     "memory_bounded": memory_bounded, "rss_budget_mb": rss_budget_mb}
+
+    if timeout is not None or memory_limit_mb is not None or max_tasks_per_worker is not None:
+        yield from _process_supervised(pdf_files, workers, worker_config, timeout, memory_limit_mb,
+                                       max_tasks_per_worker)
+        return
+
+    if workers <= 1:
+
+        init_worker(**worker_config)
+
+        for chunk in _chunks(pdf_files, chunksize):
+            yield from process_documents(chunk)
+
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=worker_initializer(worker_config)) as executor:
+
+        # executor.map() yields the results in order, while the workers keep processing the Documents ahead.
+        # Every chunk goes through a single analyze_many() call (Refer process_documents())
+        for items in executor.map(process_documents, _chunks(pdf_files, chunksize)):
+            yield from items
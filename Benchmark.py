@@ -0,0 +1,463 @@
+# General Python Imports
+from typing import Callable, Dict, List, Optional
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from BatchProcessor import list_pdf_files
+from DocumentExtractor import GAZETTEER_COMPONENTS, DocumentAnalysis, DocumentExtractor, current_rss_mb
+from PdfBackends import PDF_BACKENDS
+
+
+# All the Stages that can be benchmarked, in the order they are run
+STAGES = ["startup", "extraction", "ner", "email", "target_price", "gazetteer", "memory"]
+
+# Stages run when none are picked. "gazetteer" builds every gazetteer component from scratch, and "memory" runs
+# over a synthetic Document (Refer write_synthetic_pdf()); both are opt-in
+DEFAULT_STAGES = ["startup", "extraction", "ner", "email", "target_price"]
+
+# Metrics where a higher value is better
+HIGHER_IS_BETTER = ["docs_per_sec", "pages_per_sec"]
+
+# Metrics where a lower value is better (Latencies, Memory)
+LOWER_IS_BETTER = ["p50_ms", "p99_ms", "build_sec", "peak_rss_mb"]
+
+# Stages which work on the (upfront extracted) Text of the sampled Documents
+TEXT_STAGES = ["extraction", "ner", "email", "target_price", "gazetteer"]
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Returns the <percent>th percentile (Nearest Rank) of <values>.
+
+    Args:
+        values (List[float]): The values
+        percent (float): The percentile of interest (0 - 100)
+
+    Returns:
+        float: The percentile. 0 if <values> is empty
+    """
+    if len(values) == 0:
+        return 0.0
+
+    sorted_values = sorted(values)
+    rank = max(int(round(percent / 100.0 * len(sorted_values))) - 1, 0)
+
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def write_synthetic_pdf(path: str, num_pages: int, long_page_every: int = 100, lines_per_page: int = 60) -> None:
+    """Writes a synthetic broker-report like PDF of <num_pages> pages (Names, Email-Id's, Target Prices).
+
+    Every page is filled with <lines_per_page> lines of Text, and every <long_page_every>th page carries a long
+    (Multi-page worth) paragraph, so the splitting of long pages is exercised too. The PDF is written by hand
+    (Plain Helvetica text, no compression), with no dependency.
+
+    Args:
+        path (str): Path of the PDF file
+        num_pages (int): Number of pages
+        long_page_every (int): Every how many pages a long page comes up. 0 for none
+        lines_per_page (int): Lines of Text on every page
+    """
+    def page_lines(page: int) -> List[str]:
+
+        lines = ["Company Update - IndusInd Bank Ltd. (Page %d)" % (page + 1),
+                 "Analyst: Rahul Sharma  rahul.sharma%d@broker.com  +91 22 4000 %04d" % (page % 50, page),
+                 "Target Price: Rs %d  Recommendation: BUY" % (1000 + page),
+                 "Reliance Industries Limited and Tata Consultancy Services Ltd. were also covered."]
+
+        lines += ["Segment %d of page %d: Loan growth, deposit mobilisation and margins were in line with estimates."
+                  % (line, page + 1) for line in range(lines_per_page - len(lines))]
+
+        if long_page_every > 0 and page % long_page_every == long_page_every - 1:
+            lines += ["Net interest income grew %d per cent over the quarter. Asset quality held steady." % word
+                      for word in range(400)]
+
+        return lines
+
+    def escape(line: str) -> str:
+        return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    # Objects 1 (Catalog), 2 (Pages), 3 (Font), then (Page, Content Stream) per page
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>",
+               ("<< /Type /Pages /Count %d /Kids [%s] >>" %
+                (num_pages, " ".join("%d 0 R" % (4 + 2 * page) for page in range(num_pages)))).encode("latin-1"),
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+
+    for page in range(num_pages):
+
+        content = ("BT /F1 10 Tf 12 TL 40 800 Td " +
+                   " ".join("(%s) Tj T*" % escape(line) for line in page_lines(page)) + " ET").encode("latin-1")
+
+        objects.append(("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Resources << /Font << /F1 3 0 R >> "
+                        ">> /Contents %d 0 R >>" % (5 + 2 * page)).encode("latin-1"))
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+
+    with open(path, "wb") as pdf_file:
+
+        pdf_file.write(b"%PDF-1.4\n")
+        offsets = []
+
+        for number, body in enumerate(objects, 1):
+            offsets.append(pdf_file.tell())
+            pdf_file.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+
+        xref_offset = pdf_file.tell()
+
+        pdf_file.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        for offset in offsets:
+            pdf_file.write(b"%010d 00000 n \n" % offset)
+
+        pdf_file.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1,
+                                                                                          xref_offset))
+
+
+class RssSampler(object):
+    """Samples the RSS of the process (Refer current_rss_mb()) every <interval> seconds, on a background thread,
+    keeping the max. It only covers the time it runs for (A single Stage), unlike the Peak RSS of the process."""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_rss_mb = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while True:
+            self.peak_rss_mb = max(self.peak_rss_mb, current_rss_mb())
+
+            if self._stop.wait(self.interval):
+                return
+
+    def __enter__(self) -> "RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak_rss_mb = max(self.peak_rss_mb, current_rss_mb())
+
+
+def summarize(latencies: List[float], num_pages: int, peak_rss_mb: float) -> Dict[str, float]:
+    """Summarizes the per-document <latencies> of a Stage.
+
+    Args:
+        latencies (List[float]): Time (in Seconds) taken by the Stage for every Document
+        num_pages (int): Total number of pages processed by the Stage
+        peak_rss_mb (float): Peak RSS (MB) while the Stage ran (Refer RssSampler)
+
+    Returns:
+        Dict[str, float]: docs/sec, pages/sec, p50/p99 per-document latency (ms) and Peak RSS (MB)
+    """
+    total_time = sum(latencies)
+
+    return {"docs": len(latencies),
+            "pages": num_pages,
+            "total_sec": round(total_time, 4),
+            "docs_per_sec": round(len(latencies) / total_time, 4) if total_time > 0 else 0.0,
+            "pages_per_sec": round(num_pages / total_time, 4) if total_time > 0 else 0.0,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+            "peak_rss_mb": round(peak_rss_mb, 1)}
+
+
+def time_per_document(page_texts: Dict[str, List[str]], process: Callable[[List[str]], None]) -> Dict[str, float]:
+    """Times <process> over the (already extracted) pages of every Document.
+
+    Args:
+        page_texts (Dict[str, List[str]]): Page wise Contents of every Document
+        process (Callable[[List[str]], None]): The Stage, run over the pages of a single Document
+
+    Returns:
+        Dict[str, float]: Refer summarize()
+    """
+    latencies = []
+
+    with RssSampler() as sampler:
+        for texts in page_texts.values():
+
+            start_time = time.perf_counter()
+            process(texts)
+            latencies.append(time.perf_counter() - start_time)
+
+    return summarize(latencies, sum(len(texts) for texts in page_texts.values()), sampler.peak_rss_mb)
+
+
+def run_benchmark(pdf_files: List[str],
+                  stages: List[str],
+                  pdf_backend: str = "pypdf2",
+                  cold_start: bool = False,
+                  gazetteer: str = "entity_ruler",
+                  rss_budget_mb: float = 1024.0,
+                  synthetic_pages: int = 1000) -> Dict[str, dict]:
+    """Benchmarks every Stage in <stages> separately, over the Documents <pdf_files>.
+
+    Stages:
+        startup: train_entity_ruler() (From the on-disk Pipeline cache, unless <cold_start>)
+        extraction: PDF Text Extraction (Through <pdf_backend>)
+        ner: Spacy NER of extract_name_and_org_from_pdf()
+        email: POS Tagging of extract_name_around_email()
+        target_price: Reg-Exp search of get_target_price_and_recommendation()
+        gazetteer: Every gazetteer component (Refer GAZETTEER_COMPONENTS) on its own, reported as
+                   "gazetteer_<component>": The time to build its patterns (build_sec), and the cost of matching
+                   them over the (already tokenized) pages
+        memory: analyze() of a synthetic PDF of <synthetic_pages> pages (Refer write_synthetic_pdf()), in the
+                bounded-memory mode (Refer DocumentExtractor.memory_bounded). Reports the Peak RSS during the
+                run, and whether it stayed within <rss_budget_mb> ("within_budget")
+
+    The Text of every Document is extracted once upfront (Only if a Stage of TEXT_STAGES is picked), so the
+    Stages after "extraction" only measure their own cost. The Peak RSS of a Stage is sampled while it runs.
+    No ResultCache is used.
+
+    Args:
+        pdf_files (List[str]): Full paths to the PDF Documents
+        stages (List[str]): The Stages of interest (Refer STAGES)
+        pdf_backend (str): Name of the PDF Text Extraction Backend (Refer PdfBackends)
+        cold_start (bool): Build the Spacy Pipeline from scratch, instead of loading it from the on-disk cache
+        gazetteer (str): Gazetteer component of the Spacy Pipeline, for the "startup"/ "ner" Stages
+        rss_budget_mb (float): RSS budget of the "memory" Stage, in MB
+        synthetic_pages (int): Number of pages of the synthetic PDF of the "memory" Stage
+
+    Returns:
+        Dict[str, dict]: Metrics of every Stage (Refer summarize())
+    """
+    extractor = DocumentExtractor(pdf_backend=pdf_backend, gazetteer=gazetteer)
+    report = {}
+
+    if "startup" in stages:
+
+        # Spacy is imported within train_entity_ruler(), so its import is part of the Stage
+        with RssSampler() as sampler:
+            start_time = time.perf_counter()
+            extractor.train_entity_ruler(use_cache=not cold_start)
+            latency = time.perf_counter() - start_time
+
+        report["startup"] = summarize([latency], 0, sampler.peak_rss_mb)
+
+    # The Text of every Document is needed by the Stages of TEXT_STAGES
+    page_texts = {}
+
+    if any(stage in stages for stage in TEXT_STAGES):
+
+        latencies = []
+
+        with RssSampler() as sampler:
+            for pdf_file in pdf_files:
+
+                start_time = time.perf_counter()
+
+                try:
+                    page_texts[pdf_file] = extractor.pdfreader_generate_text(pdf_file)
+                except Exception as e:
+                    print("Exception processing File", pdf_file, "\n Excepton: ", e, file=sys.stderr)
+                    continue
+
+                latencies.append(time.perf_counter() - start_time)
+
+        if "extraction" in stages:
+            report["extraction"] = summarize(latencies, sum(len(texts) for texts in page_texts.values()),
+                                             sampler.peak_rss_mb)
+
+    # Make sure the Model load is not counted within the first Document of a Stage
+    if "ner" in stages or "email" in stages:
+        extractor.entity_model
+
+    if "ner" in stages:
+
+        def ner(texts: List[str]) -> None:
+            result = DocumentAnalysis()
+            docs = extractor.entity_model.pipe(texts, batch_size=extractor.batch_size,
+                                               disable=extractor.ner_disabled_pipes)
+
+            for index, doc in enumerate(docs):
+                extractor.collect_name_and_org_from_doc(doc, index, result)
+
+        report["ner"] = time_per_document(page_texts, ner)
+
+    if "email" in stages:
+
+        def email(texts: List[str]) -> None:
+            email_windows = []
+
+            for text in texts:
+                extractor._collect_email_windows(text, email_windows)
+
+            extractor._collect_names_around_email(email_windows, [])
+
+        report["email"] = time_per_document(page_texts, email)
+
+    if "target_price" in stages:
+
+        def target_price(texts: List[str]) -> None:
+            result = DocumentAnalysis()
+
+            for text in texts:
+                extractor._collect_target_price_and_recommendation(text, result.price_reco_mapping,
+                                                                   result.target_prices, result.recommendations)
+
+        report["target_price"] = time_per_document(page_texts, target_price)
+
+    if "gazetteer" in stages:
+
+        import spacy
+
+        # Both components are built over the same (bare) base Model. The pages are tokenized outside the
+        # timings (Afresh for every component, so the entities set by one are not seen by the other)
+        nlp = spacy.load(extractor.base_model)
+
+        for component_name in GAZETTEER_COMPONENTS:
+
+            latencies = []
+
+            with RssSampler() as sampler:
+
+                start_time = time.perf_counter()
+                component = DocumentExtractor(gazetteer=component_name).build_gazetteer_component(nlp)
+                build_time = time.perf_counter() - start_time
+
+                for texts in page_texts.values():
+
+                    docs = list(nlp.tokenizer.pipe(texts))
+
+                    start_time = time.perf_counter()
+                    for doc in docs:
+                        component(doc)
+                    latencies.append(time.perf_counter() - start_time)
+
+            report["gazetteer_" + component_name] = summarize(latencies, sum(len(texts) for texts in
+                                                                             page_texts.values()),
+                                                              sampler.peak_rss_mb)
+            report["gazetteer_" + component_name]["build_sec"] = round(build_time, 4)
+
+    if "memory" in stages:
+
+        memory_extractor = DocumentExtractor(pdf_backend=pdf_backend, gazetteer=gazetteer, memory_bounded=True,
+                                             rss_budget_mb=rss_budget_mb)
+        memory_extractor.entity_model
+
+        with tempfile.TemporaryDirectory() as temp_path:
+
+            pdf_file = os.path.join(temp_path, "synthetic.pdf")
+            write_synthetic_pdf(pdf_file, synthetic_pages)
+
+            metrics = []
+            memory_extractor.hooks.append(metrics.append)
+
+            with RssSampler() as sampler:
+
+                start_time = time.perf_counter()
+                memory_extractor.analyze(pdf_file)
+                latency = time.perf_counter() - start_time
+
+        report["memory"] = summarize([latency], metrics[0].pages, sampler.peak_rss_mb)
+        report["memory"].update({"split_pages": metrics[0].split_pages,
+                                 "rss_budget_mb": rss_budget_mb,
+                                 "within_budget": sampler.peak_rss_mb <= rss_budget_mb})
+
+    return report
+
+
+def find_regressions(report: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Compares <report> against <baseline>, and lists every metric worse by more than <threshold>.
+
+    Args:
+        report (Dict[str, dict]): The current metrics (Refer run_benchmark())
+        baseline (Dict[str, dict]): The baseline metrics (Refer run_benchmark())
+        threshold (float): Allowed relative change (Eg. 0.1 --> 10% slower is allowed)
+
+    Returns:
+        List[str]: Description of every Regression
+    """
+    regressions = []
+
+    for stage, metrics in report.items():
+
+        for metric in HIGHER_IS_BETTER + LOWER_IS_BETTER:
+
+            baseline_value = baseline.get(stage, {}).get(metric)
+            value = metrics.get(metric)
+
+            if not baseline_value or value is None:
+                continue
+
+            if metric in HIGHER_IS_BETTER:
+                regressed = value < baseline_value * (1 - threshold)
+            else:
+                regressed = value > baseline_value * (1 + threshold)
+
+            if regressed:
+                regressions.append("%s.%s: %s (baseline: %s)" % (stage, metric, value, baseline_value))
+
+    return regressions
+
+
+def sample_pdf_files(base_path: str, sample: Optional[int], seed: int) -> List[str]:
+    """Picks a (reproducible) random sample of <sample> PDF Documents from the folder <base_path>.
+
+    Args:
+        base_path (str): The folder containing the PDF Documents
+        sample (int): Number of Documents to pick. None picks all of them
+        seed (int): Seed of the random sample
+
+    Returns:
+        List[str]: Full paths of the sampled Documents
+    """
+    pdf_files = sorted(list_pdf_files(base_path))
+
+    if sample is not None and sample < len(pdf_files):
+        pdf_files = random.Random(seed).sample(pdf_files, sample)
+
+    return pdf_files
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Benchmarks every Stage of DocumentExtractor over a set of PDFs")
+    parser.add_argument("--base_path", default="needle_pdf_docs", help="Folder containing the PDF Documents")
+    parser.add_argument("--sample", type=int, default=50, help="Number of PDFs to benchmark (Random sample)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random sample")
+    parser.add_argument("--stages", nargs="+", default=DEFAULT_STAGES, choices=STAGES)
+    parser.add_argument("--pdf_backend", default="pypdf2", choices=list(PDF_BACKENDS))
+    parser.add_argument("--cold_start", action="store_true",
+                        help="Benchmark the startup Stage without the on-disk Pipeline cache")
+    parser.add_argument("--gazetteer", default="entity_ruler", choices=list(GAZETTEER_COMPONENTS),
+                        help="Gazetteer component of the Spacy Pipeline, for the startup/ ner Stages")
+    parser.add_argument("--rss_budget_mb", type=float, default=1024.0,
+                        help="RSS budget of the memory Stage, in MB. Exceeding it fails the run")
+    parser.add_argument("--synthetic_pages", type=int, default=1000,
+                        help="Number of pages of the synthetic PDF of the memory Stage")
+    parser.add_argument("--save_baseline", default=None, help="Save the results as the baseline (JSON)")
+    parser.add_argument("--baseline", default=None, help="Compare the results against this baseline (JSON)")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="Relative change beyond which a metric is flagged as a regression")
+    args = parser.parse_args()
+
+    report = run_benchmark(sample_pdf_files(args.base_path, args.sample, args.seed), args.stages, args.pdf_backend,
+                           args.cold_start, args.gazetteer, args.rss_budget_mb, args.synthetic_pages)
+
+    print(json.dumps(report, indent=4))
+
+    if args.save_baseline is not None:
+        with open(args.save_baseline, "w") as baseline_file:
+            json.dump(report, baseline_file, indent=4)
+
+    if args.baseline is not None:
+
+        with open(args.baseline) as baseline_file:
+            regressions = find_regressions(report, json.load(baseline_file), args.threshold)
+
+        for regression in regressions:
+            print("REGRESSION", regression)
+
+        if len(regressions) > 0:
+            sys.exit(1)
+
+    if not report.get("memory", {}).get("within_budget", True):
+        print("OVER BUDGET memory.peak_rss_mb: %s (budget: %s)" % (report["memory"]["peak_rss_mb"],
+                                                                   args.rss_budget_mb))
+        sys.exit(1)
@@ -0,0 +1,77 @@
+# General Python Imports
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+import hashlib
+
+
+class BlockCache(object):
+    """In-memory cache of the Spacy results of Text blocks, shared by all the Documents processed by an Extractor.
+
+    Broker reports from the same house repeat the same disclaimer/ analyst-contact pages. Every block of Text
+    (A page for the NER, the Text before an Email-Id for the POS Tagging) is fingerprinted, and its results are
+    reused when the same block shows up again, in any Document; only new blocks go through Spacy.
+
+    Blocks are fingerprinted on their Text with the whitespace collapsed. The cache holds at most
+    <max_entries> blocks per layer, evicting the least recently used ones. The blocks served from the cache are
+    counted per Document, by the Extractor (Refer DocumentMetrics.block_cache_hits).
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        """Constructor for the class BlockCache().
+
+        Args:
+            max_entries (int): Max. number of blocks kept per layer
+        """
+        self.max_entries = max_entries
+
+        # Layer --> (Fingerprint --> Results), in least recently used order
+        self._layers: Dict[str, OrderedDict] = {}
+
+    @staticmethod
+    def fingerprint(text: str) -> str:
+        """Hashes a block of Text, with the whitespace collapsed.
+
+        Args:
+            text (str): The block of Text
+
+        Returns:
+            str: The fingerprint
+        """
+        return hashlib.sha1(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+    def get(self, layer: str, fingerprint: str) -> Optional[Any]:
+        """Returns the cached results of a block. None if not found.
+
+        Args:
+            layer (str): The kind of results (Eg. "entities", "email_names")
+            fingerprint (str): The fingerprint of the block (Refer fingerprint())
+        """
+        entries = self._layers.get(layer)
+
+        if entries is None or fingerprint not in entries:
+            return None
+
+        entries.move_to_end(fingerprint)
+
+        return entries[fingerprint]
+
+    def put(self, layer: str, fingerprint: str, value: Any) -> None:
+        """Caches the results of a block, evicting the least recently used block of <layer> if full.
+
+        Args:
+            layer (str): The kind of results (Eg. "entities", "email_names")
+            fingerprint (str): The fingerprint of the block (Refer fingerprint())
+            value (Any): The results
+        """
+        entries = self._layers.setdefault(layer, OrderedDict())
+
+        entries[fingerprint] = value
+        entries.move_to_end(fingerprint)
+
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drops all the cached blocks (Eg. when the Spacy Pipeline changes)."""
+
+        self._layers.clear()
@@ -0,0 +1,255 @@
+# General Python Imports
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional
+import csv
+import hashlib
+import json
+import math
+
+# Regex Import
+import re
+
+# Vectorized Similarity Imports
+import numpy as np
+from scipy import sparse
+
+
+class CompanyCanonicalizer(object):
+    """Links the Company names extracted from a Document to the rows of the BSE Company database.
+
+    Variants of the same Company (Eg. "indusind bank ltd" / "indusind bank limited") are linked to a single row
+    (Eg. "IndusInd Bank Ltd."), through the Cosine Similarity of their Character n-gram TF-IDF vectors:
+        - The TF-IDF matrix of all the Company names of the database is computed once (At construction)
+        - All the names of a Document are vectorized together, and scored against every Company in a single
+          sparse matrix product (Refer link())
+        - A name is linked to its best scoring Company, if the score is at least <threshold>
+
+    Names already linked are kept in an LRU cache (Of <cache_size> names), and are not scored again.
+    """
+
+    # Legal suffixes, reduced to a single form before vectorizing (Both the database and the extracted names)
+    SUFFIXES = {"limited": "ltd", "private": "pvt", "corporation": "corp", "company": "co",
+                "incorporated": "inc", "industries": "inds", "india": "ind"}
+
+    def __init__(self, csv_file: str = "Company_Names_Dataset/bse_companies.csv",
+                 threshold: float = 0.75,
+                 ngram_size: int = 3,
+                 cache_size: int = 10000,
+                 name_column: str = "Company Name",
+                 code_column: str = "Accord Code",
+                 encoding: str = "ISO-8859-1"):
+        """Constructor for the class CompanyCanonicalizer().
+
+        Args:
+            csv_file (str): Path to the Company database (CSV)
+            threshold (float): Min. Cosine Similarity (0 - 1) for a name to be linked to a Company
+            ngram_size (int): Number of characters per n-gram
+            cache_size (int): Max. number of names kept in the LRU cache
+            name_column (str): Column of the CSV holding the Company names
+            code_column (str): Column of the CSV holding the (Unique) Company codes
+            encoding (str): Encoding of the CSV file
+        """
+        self.threshold = threshold
+        self.ngram_size = ngram_size
+        self.cache_size = cache_size
+
+        # Name --> Link (Refer link()), in least recently used order
+        self._cache: OrderedDict = OrderedDict()
+
+        self.companies: List[str] = []
+        self.codes: List[str] = []
+
+        # Hash of the database (And of how it is read), for cache_key()
+        hasher = hashlib.sha256(json.dumps([name_column, code_column, encoding]).encode("utf-8"))
+
+        with open(csv_file, "rb") as file:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                hasher.update(block)
+
+        self.database_hash = hasher.hexdigest()
+
+        with open(csv_file, newline="", encoding=encoding) as file:
+            for row in csv.DictReader(file):
+
+                name = (row.get(name_column) or "").strip()
+
+                if len(self.normalize(name)) > 0:
+                    self.companies.append(name)
+                    self.codes.append((row.get(code_column) or "").strip())
+
+        # n-gram --> Column of the TF-IDF matrix
+        self.vocabulary: Dict[str, int] = {}
+
+        term_counts = self._term_counts([self.normalize(name) for name in self.companies], grow_vocabulary=True)
+
+        # Smoothed IDF. n-grams which are not in the database get the IDF of a n-gram found in no Company
+        num_companies = len(self.companies)
+        document_frequency = np.bincount(term_counts.indices, minlength=len(self.vocabulary))
+
+        self.idf = np.log((1.0 + num_companies) / (1.0 + document_frequency)) + 1.0
+        self.unknown_idf = math.log(1.0 + num_companies) + 1.0
+
+        # (n-grams x Companies), so the names of a Document are scored through a single (names x n-grams) product
+        self.company_matrix = self._l2_normalize(term_counts.multiply(self.idf).tocsr()).T.tocsr()
+
+    def cache_key(self) -> str:
+        """Returns a key identifying the settings and the Company database of the canonicalizer (The results of a
+        Document depend on them)."""
+
+        return "cc-%s-%d-%s" % (self.threshold, self.ngram_size, self.database_hash)
+
+    @classmethod
+    def normalize(cls, name: str) -> str:
+        """Normalizes a Company name: Lower-cased, Alpha-numeric only, with the legal suffixes reduced.
+
+        Eg. "IndusInd Bank Limited." --> "indusind bank ltd"
+        """
+        words = re.sub(r'[^a-z0-9 ]+', '', name.lower()).split()
+
+        return " ".join(cls.SUFFIXES.get(word, word) for word in words)
+
+    def ngrams(self, name: str) -> List[str]:
+        """Returns the Character n-grams of a (Normalized) name, padded with a space on either side."""
+
+        padded = " " + name + " "
+
+        return [padded[ind: ind + self.ngram_size] for ind in range(len(padded) - self.ngram_size + 1)]
+
+    def _term_counts(self, names: List[str], grow_vocabulary: bool = False) -> sparse.csr_matrix:
+        """Builds the (names x n-grams) matrix of n-gram counts.
+
+        Args:
+            names (List[str]): The (Normalized) names
+            grow_vocabulary (bool): Add unseen n-grams to self.vocabulary. Otherwise they are dropped
+
+        Returns:
+            sparse.csr_matrix: The counts
+        """
+        indices, data, indptr = [], [], [0]
+
+        for name in names:
+
+            for gram, count in Counter(self.ngrams(name)).items():
+
+                column = self.vocabulary.get(gram)
+
+                if column is None and grow_vocabulary:
+                    column = self.vocabulary[gram] = len(self.vocabulary)
+
+                if column is not None:
+                    indices.append(column)
+                    data.append(count)
+
+            indptr.append(len(indices))
+
+        return sparse.csr_matrix((np.array(data, dtype=np.float32), np.array(indices, dtype=np.int32), indptr),
+                                 shape=(len(names), len(self.vocabulary)))
+
+    @staticmethod
+    def _l2_normalize(matrix: sparse.csr_matrix, extra_norms: Optional[np.ndarray] = None) -> sparse.csr_matrix:
+        """Scales every row of <matrix> to unit length. <extra_norms> adds squared weights not within the matrix."""
+
+        squared_norms = np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel()
+
+        if extra_norms is not None:
+            squared_norms = squared_norms + extra_norms
+
+        norms = np.sqrt(squared_norms)
+        norms[norms == 0] = 1.0
+
+        return sparse.diags(1.0 / norms).dot(matrix).tocsr()
+
+    def _vectorize(self, names: List[str]) -> sparse.csr_matrix:
+        """Builds the (L2 normalized) TF-IDF vectors of (Normalized) names, against self.vocabulary.
+
+        n-grams which are not in the database can not match any Company, but still count towards the length of
+        the vector (So a name with many unknown n-grams scores lower).
+        """
+        counts = self._term_counts(names)
+
+        unknown_norms = np.zeros(len(names))
+
+        for ind, name in enumerate(names):
+            for gram, count in Counter(self.ngrams(name)).items():
+                if gram not in self.vocabulary:
+                    unknown_norms[ind] += (count * self.unknown_idf) ** 2
+
+        return self._l2_normalize(counts.multiply(self.idf).tocsr(), unknown_norms)
+
+    def link(self, names: List[str]) -> List[Optional[dict]]:
+        """Links every name to its best matching Company of the database.
+
+        All the names not in the LRU cache are scored together, in a single sparse matrix product.
+
+        Args:
+            names (List[str]): The extracted Company names (Eg. DocumentAnalysis.all_companies)
+
+        Returns:
+            List[Optional[dict]]: {"company": Company Name, "code": Company Code, "score": Cosine Similarity} per
+                                  name. None for the names with no Company scoring at least self.threshold
+        """
+        links = {}
+        new_names = []
+
+        for name in names:
+
+            if name in links:
+                continue
+
+            if name in self._cache:
+                self._cache.move_to_end(name)
+                links[name] = self._cache[name]
+
+            else:
+                links[name] = None
+                new_names.append(name)
+
+        normalized_names = [self.normalize(name) for name in new_names]
+        scored_names = [ind for ind, name in enumerate(normalized_names) if len(name) > 0]
+
+        if len(scored_names) > 0 and len(self.companies) > 0:
+
+            # (names x Companies) Cosine Similarities
+            scores = self._vectorize([normalized_names[ind] for ind in scored_names]).dot(self.company_matrix).tocsr()
+
+            best_companies = np.asarray(scores.argmax(axis=1)).ravel()
+            best_scores = np.asarray(scores.max(axis=1).todense()).ravel()
+
+            for ind, company, score in zip(scored_names, best_companies, best_scores):
+                if score >= self.threshold:
+                    links[new_names[ind]] = {"company": self.companies[company],
+                                             "code": self.codes[company],
+                                             "score": round(float(score), 4)}
+
+        for name in new_names:
+
+            self._cache[name] = links[name]
+
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return [links[name] for name in names]
+
+    def canonicalize(self, names: List[str], links: Optional[List[Optional[dict]]] = None) -> List[str]:
+        """Maps every name to its Company (Refer link()), without Duplicates. Names not linked are kept as is.
+
+        Args:
+            names (List[str]): The extracted Company names
+            links (List[Optional[dict]]): The links of <names>, if already known (Refer link()). None links them
+
+        Returns:
+            List[str]: The canonical Company names, in the order they were first found
+        """
+        if links is None:
+            links = self.link(names)
+
+        canonical_names = []
+
+        for name, link in zip(names, links):
+
+            canonical_name = link["company"] if link is not None else name
+
+            if canonical_name not in canonical_names:
+                canonical_names.append(canonical_name)
+
+        return canonical_names
@@ -0,0 +1,321 @@
+# General Python Imports
+from typing import Iterable, List, Optional, Tuple
+import argparse
+import json
+import os
+import re
+import time
+
+# Persistent Store Import
+import sqlite3
+
+
+# Kinds of entities within the index (Refer DocumentAnalysis.entity_pages)
+ENTITY_KINDS = ["company", "author", "email_author"]
+
+
+class CorpusIndex(object):
+    """Incremental, on-disk Inverted Index of the Companies/ Authors found across all the processed Documents.
+
+    Maps every (Normalized) entity to the Documents it occurs in, with the page numbers and counts
+    (Refer DocumentAnalysis.entity_pages), backed by a single SQLite file. Documents are added/ replaced one at a
+    time (Refer add_document()), so the index grows with every run, without a full rebuild.
+
+    Eg. Which reports mention IndusInd Bank:
+        CorpusIndex().documents("IndusInd Bank")
+    """
+
+    def __init__(self, path: str = ".corpus_index.sqlite"):
+        """Constructor for the class CorpusIndex().
+
+        Args:
+            path (str): Path to the SQLite file
+        """
+        self.path = path
+
+        # The connection is opened lazily (Refer ResultCache)
+        self._connection = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The SQLite connection (Opened on first use)."""
+
+        if self._connection is None:
+
+            self._connection = sqlite3.connect(self.path, timeout=60)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS documents ("
+                                     "doc_id INTEGER PRIMARY KEY, "
+                                     "file_name TEXT NOT NULL UNIQUE, "
+                                     "content_hash TEXT, "
+                                     "indexed_at REAL NOT NULL)")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS entities ("
+                                     "entity_id INTEGER PRIMARY KEY, "
+                                     "kind TEXT NOT NULL, "
+                                     "name TEXT NOT NULL, "
+                                     "UNIQUE (kind, name))")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS entities_name ON entities (name)")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS occurrences ("
+                                     "entity_id INTEGER NOT NULL, "
+                                     "doc_id INTEGER NOT NULL, "
+                                     "page INTEGER NOT NULL, "
+                                     "count INTEGER NOT NULL, "
+                                     "PRIMARY KEY (entity_id, doc_id, page))")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS occurrences_doc ON occurrences (doc_id)")
+            self._connection.commit()
+
+        return self._connection
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Normalizes an entity name the way the Extractors do: Lower-cased, Alpha-numeric characters only.
+
+        Eg. "IndusInd Bank Ltd." --> "indusind bank ltd"
+        """
+        return " ".join(re.sub(r'[^a-z0-9 ]+', '', name.lower()).split())
+
+    def add_document(self, file_name: str,
+                     entity_pages: Iterable[Tuple[str, str, int, int]],
+                     content_hash: Optional[str] = None) -> None:
+        """Adds a Document to the index. An earlier entry of the same Document is replaced.
+
+        Args:
+            file_name (str): Name of the Document. main.py passes the full path, so same-named PDFs of different
+                             folders are kept apart
+            entity_pages (Iterable[Tuple[str, str, int, int]]): The (Kind, Name, Page Number, Count) of every
+                                                                occurrence (Refer DocumentAnalysis.entity_pages)
+            content_hash (str): Hash of the PDF contents (Refer ResultCache.file_content_hash()). Optional
+        """
+        connection = self.connection
+
+        with connection:
+
+            connection.execute("INSERT INTO documents (file_name, content_hash, indexed_at) VALUES (?, ?, ?) "
+                               "ON CONFLICT (file_name) DO UPDATE SET content_hash = excluded.content_hash, "
+                               "indexed_at = excluded.indexed_at",
+                               (file_name, content_hash, time.time()))
+
+            doc_id, = connection.execute("SELECT doc_id FROM documents WHERE file_name = ?", (file_name,)).fetchone()
+
+            connection.execute("DELETE FROM occurrences WHERE doc_id = ?", (doc_id,))
+
+            for kind, name, page, count in entity_pages:
+
+                name = self.normalize(name)
+                if len(name) == 0:
+                    continue
+
+                connection.execute("INSERT OR IGNORE INTO entities (kind, name) VALUES (?, ?)", (kind, name))
+                entity_id, = connection.execute("SELECT entity_id FROM entities WHERE kind = ? AND name = ?",
+                                                (kind, name)).fetchone()
+
+                connection.execute("INSERT INTO occurrences (entity_id, doc_id, page, count) VALUES (?, ?, ?, ?) "
+                                   "ON CONFLICT (entity_id, doc_id, page) DO UPDATE SET count = count + excluded.count",
+                                   (entity_id, doc_id, page, count))
+
+    def remove_document(self, file_name: str) -> None:
+        """Drops a Document (And its occurrences) from the index."""
+
+        connection = self.connection
+
+        with connection:
+            connection.execute("DELETE FROM occurrences WHERE doc_id IN "
+                               "(SELECT doc_id FROM documents WHERE file_name = ?)", (file_name,))
+            connection.execute("DELETE FROM documents WHERE file_name = ?", (file_name,))
+
+    def content_hash(self, file_name: str) -> Optional[str]:
+        """Returns the content hash the Document was indexed with. None if not indexed (Or indexed without one)."""
+
+        row = self.connection.execute("SELECT content_hash FROM documents WHERE file_name = ?",
+                                      (file_name,)).fetchone()
+
+        return row[0] if row is not None else None
+
+    def documents(self, name: str, kind: Optional[str] = None, prefix: bool = False) -> List[dict]:
+        """Lists the Documents an entity occurs in, the most frequent first.
+
+        The entity is looked up by its exact (Normalized) name: "IndusInd Bank" does not find "IndusInd Bank Ltd."
+        (Refer search() for the names starting with a prefix). With <prefix>, the names starting with the words of
+        <name> are looked up too, and counted together.
+
+        Args:
+            name (str): The entity (Normalized before the lookup. Refer normalize())
+            kind (str): Only this kind of entity (Refer ENTITY_KINDS). None looks up all the kinds
+            prefix (bool): Also look up the names starting with the (Whole) words of <name>. Eg. "IndusInd Bank"
+                           finds "indusind bank ltd", but not "indusind bankers"
+
+        Returns:
+            List[dict]: {"file_name", "kind", "count", "pages": [Page Number, ...]} per Document/ kind
+        """
+        name = self.normalize(name)
+
+        query = ("SELECT d.file_name, e.kind, SUM(o.count), GROUP_CONCAT(o.page) "
+                 "FROM entities e JOIN occurrences o ON o.entity_id = e.entity_id "
+                 "JOIN documents d ON d.doc_id = o.doc_id ")
+
+        # Entity names are alpha-numeric words (Refer normalize()), so the range [name + " ", name + " ~") covers
+        # the names starting with the words of <name>
+        if prefix:
+            query += "WHERE (e.name = ? OR (e.name >= ? AND e.name < ?))"
+            params = [name, name + " ", name + " ~"]
+        else:
+            query += "WHERE e.name = ?"
+            params = [name]
+
+        if kind is not None:
+            query += " AND e.kind = ?"
+            params.append(kind)
+
+        query += " GROUP BY d.doc_id, e.kind ORDER BY SUM(o.count) DESC, d.file_name"
+
+        return [{"file_name": file_name, "kind": kind, "count": count,
+                 "pages": sorted(int(page) for page in pages.split(","))}
+                for file_name, kind, count, pages in self.connection.execute(query, params)]
+
+    def search(self, prefix: str, kind: Optional[str] = None, limit: int = 20) -> List[dict]:
+        """Lists the entities starting with <prefix>, the ones in most Documents first.
+
+        Args:
+            prefix (str): Start of the entity name (Normalized before the lookup)
+            kind (str): Only this kind of entity. None looks up all the kinds
+            limit (int): Max. number of entities
+
+        Returns:
+            List[dict]: {"name", "kind", "documents", "count"} per entity
+        """
+        prefix = self.normalize(prefix)
+
+        # Entity names are alpha-numeric (Refer normalize()), so the range [prefix, prefix + "~") covers the prefix
+        query = ("SELECT e.name, e.kind, COUNT(DISTINCT o.doc_id), SUM(o.count) "
+                 "FROM entities e JOIN occurrences o ON o.entity_id = e.entity_id "
+                 "WHERE e.name >= ? AND e.name < ?")
+        params = [prefix, prefix + "~"]
+
+        if kind is not None:
+            query += " AND e.kind = ?"
+            params.append(kind)
+
+        query += " GROUP BY e.entity_id ORDER BY COUNT(DISTINCT o.doc_id) DESC, e.name LIMIT ?"
+        params.append(limit)
+
+        return [{"name": name, "kind": kind, "documents": documents, "count": count}
+                for name, kind, documents, count in self.connection.execute(query, params)]
+
+    def resolve(self, file_name: str) -> str:
+        """Returns the name a Document is indexed under, given that name or its base name (main.py indexes the
+        Documents under their full path. Eg. "AR032012.pdf" --> "/data/needle_pdf_docs/AR032012.pdf").
+
+        Args:
+            file_name (str): Name (Or base name) of the Document
+
+        Returns:
+            str: The indexed name. <file_name> itself if no Document matches
+
+        Raises:
+            ValueError: If <file_name> is the base name of several Documents (The full path is needed then)
+        """
+        if self.connection.execute("SELECT 1 FROM documents WHERE file_name = ?", (file_name,)).fetchone():
+            return file_name
+
+        # Paths ending with "/<file_name>" (Or "\<file_name>"). "!" escapes the wildcards of LIKE
+        escaped = re.sub(r'([!%_])', r'!\1', file_name)
+        matches = [row[0] for row in
+                   self.connection.execute("SELECT file_name FROM documents "
+                                           "WHERE file_name LIKE ? ESCAPE '!' OR file_name LIKE ? ESCAPE '!'",
+                                           ("%/" + escaped, "%\\" + escaped))
+                   if os.path.basename(row[0].replace("\\", "/")) == file_name]
+
+        if len(matches) > 1:
+            raise ValueError("Several Documents are named " + file_name + ", pass the full path: " +
+                             ", ".join(sorted(matches)))
+
+        return matches[0] if matches else file_name
+
+    def entities(self, file_name: str, kind: Optional[str] = None) -> List[dict]:
+        """Lists the entities of a Document, the most frequent first.
+
+        Args:
+            file_name (str): Name of the Document, or its base name (Refer resolve())
+            kind (str): Only this kind of entity. None lists all the kinds
+
+        Returns:
+            List[dict]: {"name", "kind", "count", "pages": [Page Number, ...]} per entity
+        """
+        query = ("SELECT e.name, e.kind, SUM(o.count), GROUP_CONCAT(o.page) "
+                 "FROM documents d JOIN occurrences o ON o.doc_id = d.doc_id "
+                 "JOIN entities e ON e.entity_id = o.entity_id "
+                 "WHERE d.file_name = ?")
+        params = [self.resolve(file_name)]
+
+        if kind is not None:
+            query += " AND e.kind = ?"
+            params.append(kind)
+
+        query += " GROUP BY e.entity_id ORDER BY SUM(o.count) DESC, e.name"
+
+        return [{"name": name, "kind": kind, "count": count, "pages": sorted(int(page) for page in pages.split(","))}
+                for name, kind, count, pages in self.connection.execute(query, params)]
+
+    def top(self, kind: str = "company", limit: int = 20) -> List[dict]:
+        """Lists the entities of <kind> found in the most Documents (Refer search())."""
+
+        return self.search("", kind, limit)
+
+    def stats(self) -> dict:
+        """Returns the number of Documents, entities and occurrences within the index."""
+
+        return {table: self.connection.execute("SELECT COUNT(*) FROM " + table).fetchone()[0]
+                for table in ["documents", "entities", "occurrences"]}
+
+    def close(self) -> None:
+        """Closes the SQLite connection."""
+
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Queries the Index of the Companies/ Authors of the processed PDFs "
+                                                 "(Built through main.py --index_path)")
+    parser.add_argument("--index_path", default=".corpus_index.sqlite", help="SQLite file of the Index")
+
+    # The options of the commands, given after the command (Eg. search indus --kind company)
+    kind_option = argparse.ArgumentParser(add_help=False)
+    kind_option.add_argument("--kind", default=None, choices=ENTITY_KINDS, help="Only this kind of entity")
+    limit_option = argparse.ArgumentParser(add_help=False)
+    limit_option.add_argument("--limit", type=int, default=20, help="Max. number of entities")
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    documents_parser = commands.add_parser("documents", parents=[kind_option], help="Documents mentioning an entity")
+    documents_parser.add_argument("name")
+    documents_parser.add_argument("--prefix", action="store_true",
+                                  help="Also the names starting with the words of <name> (Eg. IndusInd Bank Ltd.)")
+
+    commands.add_parser("search", parents=[kind_option, limit_option],
+                        help="Entities starting with a prefix").add_argument("prefix")
+    commands.add_parser("entities", parents=[kind_option],
+                        help="Entities of a Document (Its full path, or its file name)").add_argument("file_name")
+    commands.add_parser("top", parents=[kind_option, limit_option], help="Entities found in the most Documents")
+    commands.add_parser("stats", help="Size of the Index")
+    args = parser.parse_args()
+
+    index = CorpusIndex(args.index_path)
+
+    if args.command == "documents":
+        output = index.documents(args.name, args.kind, args.prefix)
+    elif args.command == "search":
+        output = index.search(args.prefix, args.kind, args.limit)
+    elif args.command == "entities":
+        try:
+            output = index.entities(args.file_name, args.kind)
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.command == "top":
+        output = index.top(args.kind or "company", args.limit)
+    else:
+        output = index.stats()
+
+    print(json.dumps(output, indent=4))
@@ -1,26 +1,234 @@
 # General Python Imports
-from typing import List, Tuple, Union
-import shutil
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+from collections import deque
+import gc
+import hashlib
+import sys
+import time
 import os
 
 # Regex Import
 import re
 
-# PDF Processing Imports
-import pandas as pd
-import PyPDF2
+# Spacy (And the GazetteerMatcher, built on it) is imported lazily, on the first use of the Spacy Pipeline (Refer
+# train_entity_ruler()), so the Reg-Exp based Extractors do not pay for its import
 
-# Spacy Language Model Import
-import spacy
-from spacy.lang.en import English
-from spacy.pipeline import EntityRuler
+from Gazetteer import Gazetteer
+from BlockCache import BlockCache
+from PageFilter import PageFilter
+from PdfBackends import PdfTextBackend, get_pdf_backend
+from ResultCache import ResultCache
+
+# The Target Price/ Recommendation search (Its tags/ TagMatcher are kept importable from here too)
+from TargetPriceExtractor import (DEFAULT_RECOMMENDATION_TAGS, DEFAULT_TARGET_PRICE_TAGS, TagMatcher,
+                                  TargetPriceExtractor)
+
+
+# The public names of the module, including the ones re-exported from TargetPriceExtractor
+__all__ = ["EXTRACTOR_VERSION", "PIPELINE_BUILDER_VERSION", "GAZETTEER_COMPONENTS", "MEMORY_BOUNDED_PAGE_WINDOW", "MEMORY_BOUNDED_BATCH_SIZE",
+           "MEMORY_BOUNDED_MAX_PAGE_CHARS", "DEFAULT_TARGET_PRICE_TAGS", "DEFAULT_RECOMMENDATION_TAGS", "TagMatcher",
+           "current_rss_mb", "DocumentAnalysis", "DocumentMetrics", "DocumentExtractor"]
+
+# Version of the Extraction logic. Bump this whenever the outputs of the Extractors change,
+# so results cached by an older version (Refer ResultCache) are not reused.
+EXTRACTOR_VERSION = "2"
+
+# Version of the way the Spacy Pipeline is built from the Name/ Company databases (Refer
+# DocumentExtractor.train_entity_ruler()). Bump this whenever the built patterns change, so patterns cached by an
+# older version (Refer DocumentExtractor.entity_ruler_cache_key()) are not reused.
+PIPELINE_BUILDER_VERSION = "2"
+
+# Components tagging the names of the Name/ Company databases (Refer DocumentExtractor.build_gazetteer_component()),
+# by the name of their Pipeline component (Refer GazetteerMatcher.name)
+GAZETTEER_COMPONENTS = {"entity_ruler": "entity_ruler", "phrase_matcher": "gazetteer_matcher"}
+
+# Bounded-memory mode (Refer DocumentExtractor(memory_bounded=True)): Pages extracted per window (The PDF is
+# re-opened for every window, which costs about as much as extracting a few pages), max. number of pages handed
+# to Spacy at a time, and max. characters per Spacy Doc
+MEMORY_BOUNDED_PAGE_WINDOW = 128
+MEMORY_BOUNDED_BATCH_SIZE = 16
+MEMORY_BOUNDED_MAX_PAGE_CHARS = 20000
+
+
+def current_rss_mb() -> float:
+    """Returns the current Resident Set Size (RSS) of the process, in MB.
+
+    Read from /proc (Linux). Elsewhere, falls back to the Peak RSS (0 where that is not available either).
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024.0 * 1024.0)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is in Bytes on macOS, and in KB on Linux
+    return peak_rss / (1024.0 * 1024.0) if sys.platform == "darwin" else peak_rss / 1024.0
+
+
+class DocumentAnalysis(object):
+    """Combined results of all the Extractors, for a single Document (Refer DocumentExtractor.analyze())."""
+
+    def __init__(self):
+        """Constructor for the class DocumentAnalysis()."""
+
+        # Through Spacy's NER (Refer DocumentExtractor.extract_name_and_org_from_pdf())
+        self.author_name = []
+        self.author_company = []
+        self.all_companies = []
+
+        # Through the Text around E-Mail IDs (Refer DocumentExtractor.extract_name_around_email())
+        self.email_author_names = []
+
+        # Through Reg-Exp Search (Refer DocumentExtractor.get_target_price_and_recommendation())
+        self.price_reco_mapping = []
+        self.target_prices = []
+        self.recommendations = []
+
+        # all_companies, linked to the Company database (Refer DocumentExtractor.canonicalizer/ CompanyCanonicalizer).
+        # canonical_companies holds the linked Company names (And the names not linked), without Duplicates;
+        # company_links holds [Name, Company Name, Company Code, Score] for every linked name
+        self.canonical_companies = []
+        self.company_links = []
+
+        # Page wise occurrences of the Companies/ Authors found above: [[Kind, Name, Page Number (1 based), Count]]
+        # Kind is "company" (all_companies), "author" (author_name) or "email_author" (email_author_names).
+        # Refer CorpusIndex
+        self.entity_pages = []
+
+    def to_dict(self) -> dict:
+        """Returns the results as a (JSON serializable) dict."""
+
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, values: dict) -> "DocumentAnalysis":
+        """Builds a DocumentAnalysis from a dict generated through to_dict()."""
+
+        result = cls()
+        result.__dict__.update(values)
+
+        return result
+
+
+class DocumentMetrics(object):
+    """Timings/ Counters collected while processing a single Document (Refer DocumentExtractor.hooks)."""
+
+    def __init__(self, pdf_path: str):
+        """Constructor for the class DocumentMetrics().
+
+        Args:
+            pdf_path (str): The full path to the PDF Document
+        """
+        self.pdf_path = pdf_path
+
+        # Whether the results were served from the ResultCache
+        self.cached = False
+
+        # Hash of the PDF contents (Refer ResultCache.file_content_hash()). Only set with a ResultCache
+        self.content_hash = None
+
+        # Wall time (In Seconds) spent in every step of DocumentExtractor.analyze_many()
+        self.timings = {"pdf_extraction": 0.0,
+                        "ner": 0.0,
+                        "name_and_org": 0.0,
+                        "email_windows": 0.0,
+                        "email_pos_tagging": 0.0,
+                        "target_price": 0.0,
+                        "canonicalization": 0.0,
+                        "total": 0.0}
+
+        self.pages = 0
+        self.characters = 0
+        self.entities = 0
+        self.email_windows = 0
+        self.regex_hits = 0
+
+        # Pages the NER was skipped for, by reason (Refer PageFilter)
+        self.skipped_pages = {reason: 0 for reason in PageFilter.REASONS}
+
+        # Pages/ Email windows whose Spacy results were reused from the BlockCache
+        self.block_cache_hits = {"pages": 0, "email_windows": 0}
+
+        # Pages split into several Spacy Docs (Refer DocumentExtractor.max_page_chars)
+        self.split_pages = 0
+
+        # RSS of the process once the Document is processed (Only with DocumentExtractor.rss_budget_mb set), and
+        # whether it was over the budget (The Spacy Pipeline is then reloaded before the next Document)
+        self.rss_mb = 0.0
+        self.over_rss_budget = False
+
+        self.start_time = time.perf_counter()
+
+    def to_dict(self) -> dict:
+        """Returns the metrics as a (JSON serializable) dict."""
+
+        values = dict(self.__dict__)
+        values.pop("start_time")
+        values["timings"] = {step: round(seconds, 6) for step, seconds in self.timings.items()}
+
+        return values
 
 
 class DocumentExtractor(object):
     """Class with set of functionalities to extract certain Info. from Financial Documents."""
 
-    def __init__(self):
-        """Constructor for the class DocumentExtractor()."""
+    def __init__(self, result_cache: Optional[ResultCache] = None,
+                 batch_size: int = 16,
+                 n_process: int = 1,
+                 target_price_tags: Optional[List[str]] = None,
+                 recommendation_tags: Optional[List[str]] = None,
+                 pdf_backend: Union[str, PdfTextBackend] = "pypdf2",
+                 hooks: Optional[List[Callable[[DocumentMetrics], None]]] = None,
+                 gazetteer: str = "entity_ruler",
+                 gazetteer_before_ner: bool = False,
+                 page_filter: Optional[PageFilter] = None,
+                 block_cache: Optional[BlockCache] = None,
+                 canonicalizer=None,
+                 memory_bounded: bool = False,
+                 rss_budget_mb: Optional[float] = None):
+        """Constructor for the class DocumentExtractor().
+
+        Args:
+            result_cache (ResultCache): Optional persistent cache of the extracted PDF Text/ Extractor outputs.
+                                        When set, unchanged Documents are never reprocessed.
+            batch_size (int): Number of pages handed to Spacy's nlp.pipe() at a time
+            n_process (int): Number of processes used by Spacy's nlp.pipe()
+            target_price_tags (List[str]): Text around which Target Prices/ Recommendations are searched for.
+                                           Defaults to DEFAULT_TARGET_PRICE_TAGS
+            recommendation_tags (List[str]): Recommendations to search for. Defaults to DEFAULT_RECOMMENDATION_TAGS
+            pdf_backend (Union[str, PdfTextBackend]): The PDF Text Extraction Backend (Or its name). Refer PdfBackends
+            hooks (List[Callable[[DocumentMetrics], None]]): Called with the DocumentMetrics of every Document,
+                                                             once it is processed
+            gazetteer (str): Component tagging the Person/ Company names of the databases: "entity_ruler" (Spacy's
+                             EntityRuler, with plain-string patterns) or "phrase_matcher" (GazetteerMatcher,
+                             case-insensitive). Refer GAZETTEER_COMPONENTS
+            gazetteer_before_ner (bool): Add the gazetteer component before "ner" (Its names take precedence),
+                                         instead of after it (It only fills in where "ner" found nothing)
+            page_filter (PageFilter): Skips the NER for the pages not worth it (Eg. Financial Tables, repeated
+                                      disclaimers). None runs the NER on every page
+            block_cache (BlockCache): Reuses the Spacy results of pages/ Email windows already seen in an earlier
+                                      Document (Eg. Disclaimers of the same Broker). None disables the reuse
+            canonicalizer (CompanyCanonicalizer): Links the Companies found (all_companies) to the Company database
+                                                  (Refer DocumentAnalysis.canonical_companies). None disables it
+            memory_bounded (bool): Keep the memory used by a Document bounded, whatever its number of pages:
+                                   Pages are extracted in windows of MEMORY_BOUNDED_PAGE_WINDOW pages, at most
+                                   MEMORY_BOUNDED_BATCH_SIZE pages are handed to Spacy at a time, and pages are
+                                   split (At sentence boundaries) into Docs of at most
+                                   MEMORY_BOUNDED_MAX_PAGE_CHARS characters
+            rss_budget_mb (float): RSS budget of the process. Once a Document leaves the process over it, the Spacy
+                                   Pipeline (Whose Vocab grows with every new word) is reloaded before the next one.
+                                   None disables the check
+        """
+        if gazetteer not in GAZETTEER_COMPONENTS:
+            raise ValueError("Unknown gazetteer component: " + gazetteer + ". Available: " +
+                             ", ".join(GAZETTEER_COMPONENTS))
 
         # Dabases with Indian Names/ Indian-Centric Company Names.
         # The names within this database will be used to improve
@@ -33,39 +241,145 @@ class DocumentExtractor(object):
 
         self.company_database = "Company_Names_Dataset/bse_companies.csv"
 
+        # Spacy's base English-Language Model, on top of which the EntityRuler is added
+        self.base_model = "en_core_web_sm"
+
+        # The component tagging the names of the databases, and its position relative to "ner"
+        # (Refer build_gazetteer_component())
+        self.gazetteer = gazetteer
+        self.gazetteer_before_ner = gazetteer_before_ner
+
+        # The compiled patterns of the EntityRuler (Refer load_phrase_patterns()) are cached at this folder,
+        # so they are not rebuilt for every process.
+        self.pipeline_cache_dir = ".entity_ruler_cache"
+        self._entity_ruler_cache_key = None
+
+        # Spacy's Language Model, set through train_entity_ruler().
+        # Loaded lazily, on the first access of self.entity_model
+        self._entity_model = None
+
+        # Refer ResultCache. None disables caching
+        self.result_cache = result_cache
+
+        # Extracts the Text of the PDF Documents (Refer PdfBackends)
+        if isinstance(pdf_backend, str):
+            pdf_backend = get_pdf_backend(pdf_backend)
+
+        self.pdf_backend = pdf_backend
+
+        # Time taken to extract every page, by the last call to pdfreader_iter_pages()
+        self.page_extraction_times = []
+
+        # Instrumentation. Every hook is called with the DocumentMetrics of every processed Document
+        self.hooks = list(hooks or [])
+
+        # Pages are batched through Spacy's nlp.pipe() (Refer analyze_many())
+        self.batch_size = batch_size
+        self.n_process = n_process
+
+        # Refer PageFilter. None disables the filter
+        self.page_filter = page_filter
+
+        # Refer BlockCache. None disables the cache
+        self.block_cache = block_cache
+
+        # Refer CompanyCanonicalizer. None disables the linking
+        self.canonicalizer = canonicalizer
+
+        # Bounded-memory mode. Pages are extracted <self.page_window> pages at a time (The PDF is re-opened for
+        # every window, so the state of the PDF parser does not grow with the Document), and pages longer than
+        # <self.max_page_chars> are split before NER (Refer split_page_text()). None disables either
+        self.page_window = MEMORY_BOUNDED_PAGE_WINDOW if memory_bounded else None
+        self.max_page_chars = MEMORY_BOUNDED_MAX_PAGE_CHARS if memory_bounded else None
+
+        if memory_bounded:
+            self.batch_size = min(self.batch_size, MEMORY_BOUNDED_BATCH_SIZE)
+
+        self.rss_budget_mb = rss_budget_mb
+
+        # Set once a Document leaves the process over self.rss_budget_mb (Refer _check_rss_budget())
+        self._reload_entity_model = False
+
+        # The NER based Extractor only reads doc.ents. These components are not needed for it, and are disabled.
+        # (The "ner" and gazetteer components do not depend on them)
+        self.ner_disabled_pipes = ["tagger", "parser"]
+
+        # The Email based Extractor only reads the POS Tags (And the lexical is_stop), which come from the tagger
+        self.pos_disabled_pipes = ["parser", "ner", GAZETTEER_COMPONENTS[gazetteer]]
+
+        # The Target Price/ Recommendation search (Refer get_target_price_and_recommendation()). Refer
+        # TargetPriceExtractor
+        self.target_price_extractor = TargetPriceExtractor(target_price_tags, recommendation_tags)
+
+        self.target_price_tags = self.target_price_extractor.target_price_tags
+        self.recommendation_tags = self.target_price_extractor.recommendation_tags
+
+    @property
+    def entity_model(self):
+        """Spacy's Language Model (With the EntityRuler). Built/ Loaded through train_entity_ruler() on first use."""
+
+        if self._entity_model is None:
+            self.train_entity_ruler()
+
+        return self._entity_model
+
+    @entity_model.setter
+    def entity_model(self, nlp) -> None:
+        self._entity_model = nlp
+
+        # Results of the earlier Pipeline do not apply to the new one
+        if self.block_cache is not None:
+            self.block_cache.clear()
+
+    def gazetteer_sources(self) -> List[Tuple[str, str, str]]:
+        """Returns the (Label, CSV file, Column) of every Name/ Company database (Refer Gazetteer.from_sources())."""
+
+        sources = [("PERSON", file, "name") for file in self.name_databases]
+        sources.append(("ORG", self.company_database, "Company Name"))
+
+        return sources
+
+    def load_gazetteer(self) -> Gazetteer:
+        """Loads the (De-duplicated) Person/ Company names of the databases into a Gazetteer.
+
+        The Gazetteer is built from the CSV-files once, and saved in its binary form within
+        self.pipeline_cache_dir; later calls load the binary form directly.
+
+        Returns:
+            Gazetteer: Names under the labels PERSON (self.name_databases) and ORG (self.company_database)
+        """
+        return Gazetteer.from_sources(self.gazetteer_sources(), self.pipeline_cache_dir)
+
     def get_person_names_from_dataset(self) -> List[str]:
         """Reads the Name's from the CSV-files defined in self.name_databases.
 
         Returns:
-            List[str]: A list of names read from the self.name_databases files
+            List[str]: A list of (De-duplicated) names read from the self.name_databases files
         """
-
-        name_list = []
+        gazetteer = Gazetteer()
 
         for file in self.name_databases:
-            pd_data_frame = pd.read_csv(file, encoding="ISO-8859-1")
+            gazetteer.add_csv("PERSON", file, "name")
 
-            name_list.extend(list(pd_data_frame['name']))
-
-        return name_list
+        return list(gazetteer.names("PERSON"))
 
     def get_company_names_from_dataset(self) -> List[str]:
         """Reads the Name's from the CSV-files defined in self.company_database.
 
         Returns:
-            List[str]: A list of names read from the self.company_database file
+            List[str]: A list of (De-duplicated) names read from the self.company_database file
         """
+        gazetteer = Gazetteer()
+        gazetteer.add_csv("ORG", self.company_database, "Company Name")
 
-        pd_data_frame = pd.read_csv(self.company_database, encoding="ISO-8859-1")
-
-        return list(pd_data_frame['Company Name'])
+        return list(gazetteer.names("ORG"))
 
-    def generate_entity_ruler_train_list(self, name_list: List[str], tag: str = "PERSON") -> List[dict]:
+    def generate_entity_ruler_train_list(self, name_list: Iterable[str], tag: str = "PERSON") -> List[dict]:
         """Sets up the "Train Data" of names of Persons/ Companies into the format required by Spacy's EntityRuler.
            Refer: https://spacy.io/usage/rule-based-matching
 
         Args:
-            name_list (List[str]): List of Names belonging to a particular "tag"
+            name_list (Iterable[str]): Names belonging to a particular "tag"
             tag (int): The "type" of Names (PERSON/ ORG) provided in name_list
 
         Returns:
@@ -88,163 +402,827 @@ class DocumentExtractor(object):
             List[dict]: Training Data List (Of Person + Company Names), which can be inputted to Spacy's EntityRuler.
         """
 
-        person_name_list = self.get_person_names_from_dataset()
-        person_train_data = self.generate_entity_ruler_train_list(person_name_list, "PERSON")
-
-        company_name_list = self.get_company_names_from_dataset()
-        company_train_data = self.generate_entity_ruler_train_list(company_name_list, "ORG")
+        gazetteer = self.load_gazetteer()
 
-        train_list = person_train_data
-        train_list.extend(company_train_data)
+        train_list = self.generate_entity_ruler_train_list(gazetteer.names("PERSON"), "PERSON")
+        train_list.extend(self.generate_entity_ruler_train_list(gazetteer.names("ORG"), "ORG"))
 
         return train_list
 
-    def train_entity_ruler(self) -> None:
+    def entity_ruler_cache_key(self) -> str:
+        """Generates the key of the cached Spacy Pipeline (Refer train_entity_ruler()).
+
+        The key is a hash of the contents of the Name/ Company databases, the Spacy/ base Model versions, the
+        gazetteer component (And its position) and PIPELINE_BUILDER_VERSION, so the cache is invalidated whenever
+        any of these change.
+
+        Returns:
+            str: The cache key
+        """
+        if self._entity_ruler_cache_key is not None:
+            return self._entity_ruler_cache_key
+
+        import spacy
+        from importlib import metadata
+
+        hasher = hashlib.sha256()
+
+        for file in self.name_databases + [self.company_database]:
+            with open(file, 'rb') as database_file:
+                hasher.update(database_file.read())
+
+        try:
+            model_version = metadata.version(self.base_model)
+        except metadata.PackageNotFoundError:
+            model_version = "unknown"
+
+        hasher.update(spacy.__version__.encode())
+        hasher.update(self.base_model.encode())
+        hasher.update(model_version.encode())
+        hasher.update((self.gazetteer + (":before_ner" if self.gazetteer_before_ner else ":after_ner")).encode())
+        hasher.update(PIPELINE_BUILDER_VERSION.encode())
+
+        self._entity_ruler_cache_key = hasher.hexdigest()[:16]
+
+        return self._entity_ruler_cache_key
+
+    def load_phrase_patterns(self, nlp, use_cache: bool = True):
+        """Returns the Name/ Company patterns of the gazetteer component, compiled for <nlp> (Refer PhrasePatterns).
+
+        The patterns are built from the Gazetteer through the Tokenizer only, and saved within
+        self.pipeline_cache_dir; later calls load them directly, as long as the cache key is unchanged (Refer
+        entity_ruler_cache_key()).
+
+        Args:
+            nlp (Language): The Spacy Pipeline the patterns are matched within
+            use_cache (bool): Load/ Save the patterns from/ to the on-disk cache
+
+        Returns:
+            PhrasePatterns: The patterns, matched on ORTH for the EntityRuler, and on LOWER for the GazetteerMatcher
+        """
+        from GazetteerMatcher import GazetteerMatcher, PhrasePatterns
+
+        cache_path = os.path.join(self.pipeline_cache_dir, "patterns-" + self.entity_ruler_cache_key() + ".bin")
+
+        if use_cache and os.path.isfile(cache_path):
+            return PhrasePatterns.load(cache_path)
+
+        attr = GazetteerMatcher.attr if self.gazetteer == "phrase_matcher" else "ORTH"
+        patterns = PhrasePatterns.from_gazetteer(nlp, self.load_gazetteer(), attr)
+
+        if use_cache:
+            os.makedirs(self.pipeline_cache_dir, exist_ok=True)
+            patterns.save(cache_path)
+
+        return patterns
+
+    def build_gazetteer_component(self, nlp, use_cache: bool = True):
+        """Builds the Pipeline component tagging the Person/ Company names of the databases (Refer self.gazetteer).
+
+            - "entity_ruler": Spacy's EntityRuler, with a plain-string (Phrase) pattern per name. The patterns are
+              added to its PhraseMatcher already compiled (Refer load_phrase_patterns()), instead of through
+              EntityRuler.add_patterns(), which builds a Doc per name through <nlp>
+            - "phrase_matcher": GazetteerMatcher, with the patterns built through the Tokenizer only (Cached the
+              same way), and matched case-insensitively
+
+        Args:
+            nlp (Language): The Spacy Pipeline the component is built for
+            use_cache (bool): Load/ Save the compiled patterns from/ to the on-disk cache
+
+        Returns:
+            The component (Not yet added to <nlp>)
+        """
+        if self.gazetteer == "phrase_matcher":
+            from GazetteerMatcher import GazetteerMatcher
+
+            return GazetteerMatcher(nlp, patterns=self.load_phrase_patterns(nlp, use_cache))
+
+        from spacy.pipeline import EntityRuler
+
+        ruler = EntityRuler(nlp)
+        self.load_phrase_patterns(nlp, use_cache).add_to(ruler.phrase_matcher)
+
+        return ruler
+
+    def train_entity_ruler(self, use_cache: bool = True) -> None:
         """Initializes Spacy's EntityRuler module, and sets self.entity_model
 
         In addition, updates Spacy's EntityRuler with the Train Data available
+        (Or the GazetteerMatcher, with self.gazetteer == "phrase_matcher". Refer build_gazetteer_component())
+
+        The base Model is loaded through spacy.load(), and the EntityRuler (Or GazetteerMatcher) is restored from
+        its compiled patterns (Cached on disk. Refer load_phrase_patterns()), which creates no Doc per pattern. (Saving the whole
+        Pipeline through nlp.to_disk() does not help: spacy.load() re-adds every pattern through
+        EntityRuler.add_patterns(), running the full Pipeline over each of them.)
+
+        Args:
+            use_cache (bool): Load/ Save the compiled patterns from/ to the on-disk cache
         """
+        import spacy
 
-        nlp = spacy.load("en_core_web_sm")
+        nlp = spacy.load(self.base_model)
 
-        ruler = EntityRuler(nlp)
-        patterns = self.generate_entity_train_data()
-        ruler.add_patterns(patterns)
-        nlp.add_pipe(ruler)
+        if self.gazetteer_before_ner:
+            nlp.add_pipe(self.build_gazetteer_component(nlp, use_cache), before="ner")
+        else:
+            nlp.add_pipe(self.build_gazetteer_component(nlp, use_cache), after="ner")
 
         self.entity_model = nlp
 
-    def pdfreader_generate_text(self, PDF_file: str) -> List[str]:
+    def pdfreader_generate_text(self, PDF_file: str,
+                                content_hash: Optional[str] = None,
+                                max_pages: Optional[int] = None) -> List[str]:
         """Extracts Text from the <PDF_file> Document Specified.
 
         Returns a List of Text(str), where each element's contents
         correspond to the PDFs page contents.
 
+        When self.result_cache is set, the Text is looked up from/ saved to the cache ("page_texts" layer),
+        keyed on the contents of the PDF.
+
         Args:
             PDF_file (str): The full path to the PDF Document
+            content_hash (str): Hash of the PDF contents, if already known (Refer ResultCache.file_content_hash())
+            max_pages (int): Extract only the first <max_pages> pages. None extracts all the pages
 
         Returns:
             List[str]: Page wise Contents of the PDF of interest.
         """
+        return list(self._iter_page_texts(PDF_file, content_hash, max_pages))
+
+    def pdfreader_iter_pages(self, PDF_file: str,
+                             first_page: int = 0,
+                             max_pages: Optional[int] = None) -> Iterator[str]:
+        """Lazily extracts Text from the <PDF_file> Document Specified, one page at a time.
+
+        The Text is extracted through self.pdf_backend (Refer PdfBackends). A page's Text is only extracted
+        when it is asked for. Stopping the iteration early (Or setting <max_pages>) skips the remaining pages
+        entirely, so the memory used does not grow with the size of the Document.
+
+        With self.page_window set, the pages are extracted in windows of self.page_window pages, re-opening
+        the PDF for every window.
+
+        The time taken to extract every page is recorded at self.page_extraction_times (Reset on every call).
+
+        Args:
+            PDF_file (str): The full path to the PDF Document
+            first_page (int): Index (0 based) of the first page to extract
+            max_pages (int): Extract at most <max_pages> pages. None extracts upto the last page
+
+        Returns:
+            Iterator[str]: Page wise Contents of the PDF of interest.
+        """
+        self.page_extraction_times = []
+
+        if self.page_window is None:
+            windows = [(first_page, max_pages)]
+        else:
+            windows = self._page_windows(first_page, max_pages)
+
+        for window_first_page, window_pages in windows:
+
+            num_pages = 0
+
+            for text, page_time in self.pdf_backend.iter_timed_pages(PDF_file, window_first_page, window_pages):
+
+                self.page_extraction_times.append(page_time)
+                num_pages += 1
+
+                yield text
+
+            # A short window is the last one
+            if window_pages is None or num_pages < window_pages:
+                return
+
+    def _page_windows(self, first_page: int, max_pages: Optional[int]) -> Iterator[Tuple[int, int]]:
+        """Yields (First Page, Number of Pages) of every window of self.page_window pages, from <first_page>."""
+
+        last_page = None if max_pages is None else first_page + max_pages
+
+        while last_page is None or first_page < last_page:
+
+            window_pages = self.page_window if last_page is None else min(self.page_window, last_page - first_page)
+            yield first_page, window_pages
+
+            first_page += window_pages
+
+    def _iter_page_texts(self, PDF_file: str,
+                         content_hash: Optional[str] = None,
+                         max_pages: Optional[int] = None) -> Iterator[str]:
+        """Lazily extracts Text from the <PDF_file> Document Specified, through self.result_cache if set.
+
+        Only the Text of complete Documents is saved to the cache. A cached Document serves any <max_pages>.
+
+        Args:
+            PDF_file (str): The full path to the PDF Document
+            content_hash (str): Hash of the PDF contents, if already known (Refer ResultCache.file_content_hash())
+            max_pages (int): Extract only the first <max_pages> pages. None extracts all the pages
+
+        Returns:
+            Iterator[str]: Page wise Contents of the PDF of interest.
+        """
+        if self.result_cache is None:
+            yield from self.pdfreader_iter_pages(PDF_file, max_pages=max_pages)
+            return
+
+        if content_hash is None:
+            content_hash = self.result_cache.file_content_hash(PDF_file)
+
+        cache_key = content_hash + ":" + self.pdf_backend.version()
+
+        page_contents = self.result_cache.get("page_texts", cache_key)
+
+        if page_contents is not None:
+            yield from page_contents[:max_pages]
+            return
+
+        # In the bounded-memory mode, the Text of a whole Document is never held (Nor cached)
+        if max_pages is not None or self.page_window is not None:
+            yield from self.pdfreader_iter_pages(PDF_file, max_pages=max_pages)
+            return
+
         page_contents = []
 
-        pdfFileObj = open(PDF_file, 'rb')
-        pdfReader = PyPDF2.PdfFileReader(pdfFileObj)
+        for text in self.pdfreader_iter_pages(PDF_file):
+            page_contents.append(text)
+            yield text
+
+        self.result_cache.put("page_texts", cache_key, page_contents)
+
+    def analyze(self, pdf_path: str,
+                name_and_org: bool = True,
+                email_names: bool = True,
+                target_price: bool = True,
+                max_pages: Optional[int] = None) -> DocumentAnalysis:
+        """Runs all the Extractors over a Document in a single pass.
+
+        The PDF is read (and text extracted) only once, and every page goes through Spacy's NER only once.
+        The page Text is shared by all the Extractors of interest. The Spacy Doc of a page is only used by the
+        NER based Extractor: The Email based Extractor POS Tags the (Short) Text before every Email-Id
+        separately, all of them in a single batch once the Document is read (Refer _finish_analysis()), as the
+        NER pass runs without the tagger.
+
+        Algorithm:
+            1) Lazily extract the Text of the pages of the PDF, one page at a time
+            2) For every page, build a single Spacy Doc (Only if the NER based Extractor is requested)
+            3) Feed the page (Doc/ Text) to every requested Extractor, which accumulates its results
+            4) POS Tag the Text before every Email-Id of the Document (Only if the Email based Extractor is
+               requested)
+
+        Args:
+            pdf_path (str): The full path to the PDF Document
+            name_and_org (bool): Run the NER based Author Name/ Company Author Name/ All Companies extraction
+            email_names (bool): Run the Email based Person Name extraction
+            target_price (bool): Run the Target Price/ Recommendation extraction
+            max_pages (int): Process only the first <max_pages> pages of the Document. None processes all the pages.
+                             The remaining pages are never extracted from the PDF.
+
+        Returns:
+            DocumentAnalysis: The combined results of all the Extractors. The fields belonging to an Extractor
+                              which was not requested are left empty.
+        """
+        return next(self.analyze_many([pdf_path], name_and_org, email_names, target_price, max_pages))
+
+    def analyze_many(self, pdf_paths: Iterable[str],
+                     name_and_org: bool = True,
+                     email_names: bool = True,
+                     target_price: bool = True,
+                     max_pages: Optional[int] = None) -> Iterator[DocumentAnalysis]:
+        """Runs all the Extractors over several Documents, batching the pages of all of them through Spacy.
+
+        The pages of all the Documents are streamed through a single nlp.pipe() call (In batches of
+        self.batch_size pages, over self.n_process processes), with the Spacy components not needed for
+        NER disabled (Refer self.ner_disabled_pipes). Refer analyze() for the details of every Document.
+
+        An Exception raised while processing any of the Documents stops the whole batch. Use analyze()
+        per Document, when a bad Document should not affect the others.
+
+        Args:
+            pdf_paths (Iterable[str]): The full paths to the PDF Documents
+            name_and_org (bool): Run the NER based Author Name/ Company Author Name/ All Companies extraction
+            email_names (bool): Run the Email based Person Name extraction
+            target_price (bool): Run the Target Price/ Recommendation extraction
+            max_pages (int): Process only the first <max_pages> pages of every Document
+
+        Returns:
+            Iterator[DocumentAnalysis]: The combined results of all the Extractors, in the order of <pdf_paths>
+        """
+        # A Document which left the process over its RSS budget drops the Spacy Pipeline (Refer _check_rss_budget())
+        if self._reload_entity_model:
+            self._reload_entity_model = False
+            self.entity_model = None
+            gc.collect()
+
+        # Documents whose pages have been handed over to Spacy, but not yet yielded back. Every entry is
+        # (DocumentAnalysis, Result Cache Key, Text before every Email-Id of the Document, Page Index of every
+        # Email-Id, DocumentMetrics)
+        pending = deque()
+
+        # Time spent extracting PDF Text, since it was last reset. Pages are extracted from within nlp.pipe(),
+        # and this is used to separate the Text Extraction time from the NER time
+        extraction_clock = [0.0]
+
+        def page_stream():
+            """Yields (NER Text, (Pending Entry, Page Index, Page Text, Block Fingerprint, Cached Entities)) for every
+            page of every (Not cached) Document.
+
+            The NER Text is the Page Text, or "" for the pages skipped by self.page_filter/ whose entities are
+            served from self.block_cache (Cached Entities; None otherwise). Pages longer than self.max_page_chars
+            are yielded once per chunk, with the Page Text on the first chunk only ("" on the others).
+            """
+
+            for pdf_path in pdf_paths:
+
+                metrics = DocumentMetrics(pdf_path)
+
+                content_hash, cache_key, cached_result = self._lookup_analysis(pdf_path, name_and_org, email_names,
+                                                                               target_price, max_pages)
+                metrics.content_hash = content_hash
+
+                if cached_result is not None:
+                    metrics.cached = True
+                    pending.append((cached_result, None, None, None, metrics))
+                    continue
 
-        numPages = pdfReader.numPages
+                entry = (DocumentAnalysis(), cache_key, [], [], metrics)
+                pending.append(entry)
 
-        for page in range(0, numPages):
-            pageObj = pdfReader.getPage(page)
+                page_texts = self._iter_page_texts(pdf_path, content_hash, max_pages)
+                index = 0
 
-            page_contents.append(pageObj.extractText())
+                # Fingerprints of the pages seen so far (Refer PageFilter.classify())
+                seen_fingerprints = set()
 
-        pdfFileObj.close()
+                while True:
 
-        return page_contents
+                    start_time = time.perf_counter()
 
-    def extract_name_around_email(self, pdf_path: str) -> List[str]:
+                    try:
+                        text = next(page_texts)
+                    except StopIteration:
+                        break
+
+                    page_time = time.perf_counter() - start_time
+                    metrics.timings["pdf_extraction"] += page_time
+                    extraction_clock[0] += page_time
+
+                    metrics.pages += 1
+                    metrics.characters += len(text)
+
+                    skip_reason = None
+                    if name_and_org and self.page_filter is not None:
+                        skip_reason = self.page_filter.classify(text, index, seen_fingerprints)
+
+                    if skip_reason is not None:
+                        metrics.skipped_pages[skip_reason] += 1
+
+                    # Long pages go through Spacy as several Docs (Refer split_page_text())
+                    chunks = [text]
+                    if name_and_org and skip_reason is None and self.max_page_chars is not None:
+                        chunks = self.split_page_text(text, self.max_page_chars)
+
+                        if len(chunks) > 1:
+                            metrics.split_pages += 1
+
+                    for chunk_index, chunk in enumerate(chunks):
+
+                        block_fingerprint, cached_entities = None, None
+
+                        if name_and_org and skip_reason is None and self.block_cache is not None:
+                            block_fingerprint = BlockCache.fingerprint(chunk)
+                            cached_entities = self.block_cache.get("entities", block_fingerprint)
+
+                            if cached_entities is not None:
+                                metrics.block_cache_hits["pages"] += 1
+
+                        ner_text = chunk if skip_reason is None and cached_entities is None else ""
+
+                        # The other Extractors get the whole Page Text once (With the first chunk)
+                        page_text = text if chunk_index == 0 else ""
+
+                        yield ner_text, (entry, index, page_text, block_fingerprint, cached_entities)
+
+                    index += 1
+
+        if name_and_org:
+
+            # Using Spacy's NLP Model, get the Document Entities, which can be accessd through "doc"
+            # The other Extractors get the Page Text (Which differs from doc.text for the pages skipped by
+            # self.page_filter/ served from self.block_cache; those go through Spacy as an empty Doc, which keeps
+            # the pages in order)
+            pages = self.entity_model.pipe(page_stream(), as_tuples=True,
+                                           batch_size=self.batch_size,
+                                           n_process=self.n_process,
+                                           disable=self.ner_disabled_pipes)
+
+        else:
+            pages = ((None, context) for _, context in page_stream())
+
+        # Cycle through all the Pages
+        while True:
+
+            extraction_clock[0] = 0.0
+            start_time = time.perf_counter()
+
+            try:
+                doc, (entry, index, text, block_fingerprint, entities) = next(pages)
+            except StopIteration:
+                break
+
+            # Pages come back in order. So, every Document pending before the current one is complete
+            while pending[0] is not entry:
+                yield self._finish_analysis(*pending.popleft())
+
+            result, _, email_windows, email_window_pages, metrics = entry
+
+            if name_and_org:
+
+                # With batching, a batch of pages is parsed when its first page is asked for. The NER time of
+                # the whole batch is accounted to the Document of that page
+                metrics.timings["ner"] += time.perf_counter() - start_time - extraction_clock[0]
+
+                start_time = time.perf_counter()
+
+                if entities is None:
+                    entities = self.collect_name_and_org_from_doc(doc, index, result)
+
+                    if block_fingerprint is not None:
+                        self.block_cache.put("entities", block_fingerprint, entities)
+
+                else:
+                    self._collect_name_and_org_from_entities(entities, index, result.author_name,
+                                                             result.author_company, result.all_companies,
+                                                             result.entity_pages)
+
+                metrics.entities += len(entities)
+
+                # Only the entities are kept. The Doc (And its Tokens) is released right away
+                doc = None
+
+                metrics.timings["name_and_org"] += time.perf_counter() - start_time
+
+            if email_names:
+
+                start_time = time.perf_counter()
+                self._collect_email_windows(text, email_windows)
+                email_window_pages.extend([index] * (len(email_windows) - len(email_window_pages)))
+                metrics.timings["email_windows"] += time.perf_counter() - start_time
+
+            if target_price:
+
+                start_time = time.perf_counter()
+                metrics.regex_hits += self._collect_target_price_and_recommendation(text, result.price_reco_mapping,
+                                                                                    result.target_prices,
+                                                                                    result.recommendations)
+                metrics.timings["target_price"] += time.perf_counter() - start_time
+
+        while pending:
+            yield self._finish_analysis(*pending.popleft())
+
+    def _lookup_analysis(self, pdf_path: str,
+                         name_and_org: bool,
+                         email_names: bool,
+                         target_price: bool,
+                         max_pages: Optional[int]) -> Tuple[Optional[str],
+                                                            Optional[str],
+                                                            Optional[DocumentAnalysis]]:
+        """Looks up the results of analyze() from self.result_cache.
+
+        Returns:
+            content_hash (str): Hash of the PDF contents. None if self.result_cache is not set
+            cache_key (str): Key of the results within self.result_cache. None if self.result_cache is not set
+            cached_result (DocumentAnalysis): The cached results. None if not found
+        """
+        if self.result_cache is None:
+            return None, None, None
+
+        # The results depend on the PDF contents, the PDF Text Extraction Backend, the Extraction logic, the
+        # Extractors requested, and (For the Spacy based Extractors) the Spacy Pipeline
+        content_hash = self.result_cache.file_content_hash(pdf_path)
+
+        cache_key = ":".join([content_hash, self.pdf_backend.version(), EXTRACTOR_VERSION,
+                              str(int(name_and_org)), str(int(email_names)), str(int(target_price)),
+                              str(max_pages)])
+
+        if name_and_org or email_names:
+            cache_key += ":" + self.entity_ruler_cache_key()
+
+        if name_and_org and self.page_filter is not None:
+            cache_key += ":" + self.page_filter.cache_key()
+
+        if name_and_org and self.canonicalizer is not None:
+            cache_key += ":" + self.canonicalizer.cache_key()
+
+        # Long pages are split before the NER in the bounded-memory mode (Refer split_page_text())
+        if name_and_org and self.max_page_chars is not None:
+            cache_key += ":bounded-%d" % self.max_page_chars
+
+        if target_price:
+            cache_key += ":" + self.target_price_extractor.cache_key()
+
+        cached_result = self.result_cache.get("results", cache_key)
+
+        if cached_result is not None:
+            return content_hash, cache_key, DocumentAnalysis.from_dict(cached_result)
+
+        return content_hash, cache_key, None
+
+    def _finish_analysis(self, result: DocumentAnalysis,
+                         cache_key: Optional[str],
+                         email_windows: Optional[List[str]],
+                         email_window_pages: Optional[List[int]],
+                         metrics: DocumentMetrics) -> DocumentAnalysis:
+        """Completes the results of a Document, once all its pages are processed.
+
+        Extracts the Names around the Email-Id's of the Document (All of them in a single batch), totals the
+        page wise occurrences (result.entity_pages), saves the results to self.result_cache (If <cache_key>
+        is set), and reports the Document's metrics to self.hooks.
+        """
+        if email_windows:
+
+            start_time = time.perf_counter()
+            metrics.block_cache_hits["email_windows"] += self._collect_names_around_email(email_windows,
+                                                                                          result.email_author_names,
+                                                                                          email_window_pages,
+                                                                                          result.entity_pages)
+            metrics.timings["email_pos_tagging"] += time.perf_counter() - start_time
+
+            metrics.email_windows += len(email_windows)
+
+        # One [Kind, Name, Page Number, Count] per (Kind, Name, Page), in the order they were first found
+        # (Cached results are already totalled)
+        if email_window_pages is not None:
+
+            counts = {}
+            for kind, name, page, count in result.entity_pages:
+                counts[(kind, name, page)] = counts.get((kind, name, page), 0) + count
+
+            result.entity_pages = [[kind, name, page, count] for (kind, name, page), count in counts.items()]
+
+            # All the Companies of the Document are linked at once (A single matrix product)
+            if self.canonicalizer is not None and result.all_companies:
+
+                start_time = time.perf_counter()
+
+                links = self.canonicalizer.link(result.all_companies)
+
+                result.company_links = [[name, link["company"], link["code"], link["score"]]
+                                        for name, link in zip(result.all_companies, links) if link is not None]
+
+                result.canonical_companies = self.canonicalizer.canonicalize(result.all_companies, links)
+
+                metrics.timings["canonicalization"] += time.perf_counter() - start_time
+
+        if cache_key is not None:
+            self.result_cache.put("results", cache_key, result.to_dict())
+
+        if self.rss_budget_mb is not None:
+            self._check_rss_budget(metrics)
+
+        metrics.timings["total"] = time.perf_counter() - metrics.start_time
+
+        for hook in self.hooks:
+            hook(metrics)
+
+        return result
+
+    def _check_rss_budget(self, metrics: DocumentMetrics) -> None:
+        """Records the RSS of the process once a Document is processed (metrics.rss_mb), against self.rss_budget_mb.
+
+        Over the budget, garbage is collected first. If that is not enough, the Spacy Pipeline is reloaded (From
+        the disk cache. Refer train_entity_ruler()) before the next Document, as its Vocab/ StringStore grow with
+        every new word seen.
+        """
+        metrics.rss_mb = current_rss_mb()
+
+        if metrics.rss_mb <= self.rss_budget_mb:
+            return
+
+        gc.collect()
+        metrics.rss_mb = current_rss_mb()
+
+        if metrics.rss_mb > self.rss_budget_mb:
+            metrics.over_rss_budget = True
+            self._reload_entity_model = True
+
+    @staticmethod
+    def split_page_text(text: str, max_chars: int) -> List[str]:
+        """Splits the Text of a page into chunks of at most <max_chars> characters, for Spacy.
+
+        Every chunk ends at the last sentence boundary (". ", "? ", "! " or a new line) within its
+        <max_chars> characters; failing that, at the last space, or else right at <max_chars>. Spacy's
+        nlp.max_length is never hit, and the memory used by a Doc stays bounded.
+
+        Args:
+            text (str): The Text of the page
+            max_chars (int): Max. number of characters per chunk
+
+        Returns:
+            List[str]: The chunks, in order. Together, they make up <text>
+        """
+        chunks = []
+
+        while len(text) > max_chars:
+
+            window = text[:max_chars]
+
+            end = max(window.rfind(". "), window.rfind("? "), window.rfind("! "), window.rfind("\n"))
+
+            if end > 0:
+                end += 1
+            else:
+                end = window.rfind(" ")
+
+            if end <= 0:
+                end = max_chars
+
+            chunks.append(text[:end])
+            text = text[end:]
+
+        chunks.append(text)
+
+        return chunks
+
+    def extract_name_around_email(self, pdf_path: str, max_pages: Optional[int] = None) -> List[str]:
         """Extracts Names of Person's around an Email-Id in a Document
 
         As Spacy's Named Entity Recognition (NER) does not work well for Person's Name (Indian Person),
         this method is an alternate approach to finding a Person's name from a document.
 
         This method relies on the Person's Name to be around the Email-Id of the Person.
-
-        Algorithm:
-            1) Do a Reg-Exp Search, to Isolate where E-Mails Occur in the Document (Get the Email-Span)
-            2) Search for a Person's name from the Text near the found E-mail (100 Characters before the Email)
-            3) Using Spacy's Parts of Speech Tagging (POS Tagging), Classify 2 or more
-               consecutive words with POS == PROPN (AKA Proper Noun) as a Name
+        Thin wrapper around analyze(). Refer _collect_email_windows()/ _collect_names_around_email() for the Algorithm.
 
         Args:
             PDF_file (str): The full path to the PDF Document
+            max_pages (int): Search only the first <max_pages> pages. None searches all the pages
 
         Returns:
             List[str]: Possible List of Persons Names
         """
-        text_contents = self.pdfreader_generate_text(pdf_path)
+        result = self.analyze(pdf_path, name_and_org=False, email_names=True, target_price=False,
+                              max_pages=max_pages)
+
+        return result.email_author_names
+
+    def _collect_email_windows(self, text: str, email_windows: List[str]) -> None:
+        """Collects the Text before every Email-Id in a single page of a Document.
 
-        # Initialize names_through_email, which will store the names of every person
-        names_through_email = []
+        The collected Text is POS Tagged later (Once per Document) through _collect_names_around_email().
 
-        # Cycle Through all the Pages
-        for text in text_contents:
+        Algorithm:
+            1) Do a Reg-Exp Search, to Isolate where E-Mails Occur in the Document (Get the Email-Span)
+            2) Collect the Text near the found E-mail (100 Characters before the Email)
 
-            # Try to Isolate the Text around Emails
-            # r'[\w\.-]+@[\w\.-]+' is the Reg-Exp used to match Email Patterns
-            for match in re.finditer(r'[\w\.-]+@[\w\.-]+', text):
+        Args:
+            text (str): Text of the page of interest
+            email_windows (List[str]): List to which the Text before every Email-Id is appended
+        """
+        # Try to Isolate the Text around Emails
+        # r'[\w\.-]+@[\w\.-]+' is the Reg-Exp used to match Email Patterns
+        for match in re.finditer(r'[\w\.-]+@[\w\.-]+', text):
 
-                # Find the Span of the Emails using match.span().
+            # Find the Span of the Emails using match.span().
 
-                # Through the Email Span, find the Text "Around" the
-                # Email which may contain the corresponding Author's Name
+            # Through the Email Span, find the Text "Around" the
+            # Email which may contain the corresponding Author's Name
 
-                # For our Usecase, we observed the Author's Name is most
-                # likely to occur, within 100 characters before the "Email String"
-                search_start_ind = max(match.span()[0] - 100, 0)
-                search_end_ind = match.span()[0]
+            # For our Usecase, we observed the Author's Name is most
+            # likely to occur, within 100 characters before the "Email String"
+            search_start_ind = max(match.span()[0] - 100, 0)
+            search_end_ind = match.span()[0]
 
-                possible_name = text[search_start_ind: search_end_ind]
+            email_windows.append(text[search_start_ind: search_end_ind])
 
-                filtered_sent = []
+    def _collect_names_around_email(self, email_windows: List[str],
+                                    names_through_email: List[str],
+                                    window_pages: Optional[List[int]] = None,
+                                    entity_pages: Optional[List[list]] = None) -> int:
+        """Extracts Names of Person's from the Text collected before the Email-Id's of a Document
 
-                name_doc = self.entity_model(possible_name)
-                for word in name_doc:
+        Algorithm:
+            1) POS Tag all the Text windows (Refer _collect_email_windows()) in a single nlp.pipe() call,
+               with only the Tagger enabled (Refer self.pos_disabled_pipes). Windows already seen (In any
+               Document) are served from self.block_cache instead, and repeated windows are tagged once
+            2) Using Spacy's Parts of Speech Tagging (POS Tagging), Classify 2 or more
+               consecutive words with POS == PROPN (AKA Proper Noun) as a Name (Refer _names_in_email_window())
 
-                    # Filter Out Stop Words
-                    if word.is_stop == False:
-                        filtered_sent.append(word)
+        Args:
+            email_windows (List[str]): The Text before every Email-Id of the Document
+            names_through_email (List[str]): List to which newly found Names are appended (Without Duplicates)
+            window_pages (List[int]): The page index (0 based) of every window. Needed for <entity_pages>
+            entity_pages (List[list]): List to which every Name found is appended as ["email_author", Name,
+                                       Page Number, 1] (Refer DocumentAnalysis.entity_pages)
 
-                # LOGIC to Extract Person Name from "possible_name/ filtered_sent"
-                # Use Spacy's Parts Of Speech Tagger (POS Tagger)
-                # Check for 2 Consecutive words of type: PROPN (Proper Nound)
-                # Any set of words that Satisfy This Criteria will be considered a Author/ Person Name
+        Returns:
+            int: Number of windows served from self.block_cache
+        """
+        # Fingerprint of every window --> The Names found within it. Without a BlockCache, the windows are keyed
+        # on their own Text (So repeated windows are still tagged once)
+        window_names = {}
+        fingerprints = [BlockCache.fingerprint(window) if self.block_cache is not None else window
+                        for window in email_windows]
+        cache_hits = 0
 
-                # We don't use Spacy's Entity Tagger, as this Method is an alternative to
-                # Spacy's Entity Tagger based Search (Done through
+        if self.block_cache is not None:
+            for fingerprint in set(fingerprints):
+                cached_names = self.block_cache.get("email_names", fingerprint)
 
-                # Temporary Variables
-                temp_name_list = []
-                ind = 0
+                if cached_names is not None:
+                    window_names[fingerprint] = cached_names
+                    cache_hits += fingerprints.count(fingerprint)
 
-                while ind < len(filtered_sent) - 1:
+        new_windows = {}
+        for fingerprint, window in zip(fingerprints, email_windows):
+            if fingerprint not in window_names:
+                new_windows.setdefault(fingerprint, window)
 
-                    if filtered_sent[ind].pos_ != 'PROPN':
+        name_docs = self.entity_model.pipe(list(new_windows.values()), disable=self.pos_disabled_pipes)
+
+        for fingerprint, name_doc in zip(new_windows, name_docs):
+
+            window_names[fingerprint] = self._names_in_email_window(name_doc)
+
+            if self.block_cache is not None:
+                self.block_cache.put("email_names", fingerprint, window_names[fingerprint])
+
+        for window_ind, fingerprint in enumerate(fingerprints):
+            for name in window_names[fingerprint]:
+
+                if name not in names_through_email:
+                    names_through_email.append(name)
+
+                if entity_pages is not None:
+                    entity_pages.append(["email_author", name, window_pages[window_ind] + 1, 1])
+
+        return cache_hits
+
+    def _names_in_email_window(self, name_doc) -> List[str]:
+        """Extracts the Names of Person's from a single POS Tagged window (Refer _collect_names_around_email()).
+
+        Args:
+            name_doc (spacy.tokens.Doc): The POS Tagged Text before an Email-Id
+
+        Returns:
+            List[str]: The (Lower-cased) Names found, without Duplicates
+        """
+        window_names = []
 
-                        # Not a PROPN, Save any valid "Name" if we found any so far!
+        filtered_sent = []
 
-                        # We assume atleast 2 consecutive PROPN Words will be considered a valid "Name"
-                        if len(temp_name_list) > 1:
+        for word in name_doc:
 
-                            name_to_append = " ".join(temp_name_list)
+            # Filter Out Stop Words
+            if word.is_stop == False:
+                filtered_sent.append(word)
 
-                            if name_to_append.lower() not in names_through_email:
-                                names_through_email.append(name_to_append.lower())
+        # LOGIC to Extract Person Name from "possible_name/ filtered_sent"
+        # Use Spacy's Parts Of Speech Tagger (POS Tagger)
+        # Check for 2 Consecutive words of type: PROPN (Proper Nound)
+        # Any set of words that Satisfy This Criteria will be considered a Author/ Person Name
 
-                        temp_name_list = []
+        # We don't use Spacy's Entity Tagger, as this Method is an alternative to
+        # Spacy's Entity Tagger based Search (Done through
 
-                    else:
+        # Temporary Variables
+        temp_name_list = []
+        ind = 0
 
-                        # Else it is a 'PROPN'. Add the Word to temp_name_list
+        while ind < len(filtered_sent) - 1:
 
-                        temp_name_list.append(filtered_sent[ind].text)
+            if filtered_sent[ind].pos_ != 'PROPN':
 
-                    ind += 1
+                # Not a PROPN, Save any valid "Name" if we found any so far!
 
-                # Save if any Valid Name is still to be added to the list
+                # We assume atleast 2 consecutive PROPN Words will be considered a valid "Name"
                 if len(temp_name_list) > 1:
 
                     name_to_append = " ".join(temp_name_list)
 
-                    if name_to_append.lower() not in names_through_email:
-                        names_through_email.append(name_to_append.lower())
+                    if name_to_append.lower() not in window_names:
+                        window_names.append(name_to_append.lower())
+
+                temp_name_list = []
+
+            else:
+
+                # Else it is a 'PROPN'. Add the Word to temp_name_list
+
+                temp_name_list.append(filtered_sent[ind].text)
 
-        return names_through_email
+            ind += 1
 
-    def extract_name_and_org_from_pdf(self, pdf_path: str) -> Union[bool,
-                                                                    Tuple[List[str],
-                                                                          List[str],
-                                                                          List[str]]]:
+        # Save if any Valid Name is still to be added to the list
+        if len(temp_name_list) > 1:
+
+            name_to_append = " ".join(temp_name_list)
+
+            if name_to_append.lower() not in window_names:
+                window_names.append(name_to_append.lower())
+
+        return window_names
+
+    def extract_name_and_org_from_pdf(self, pdf_path: str,
+                                      max_pages: Optional[int] = None) -> Tuple[List[str], List[str], List[str]]:
         """Extracts possible Author Name(s), Company Author Name(s), All Companies mentioned in the document.
 
         Uses Spacy's Named Entity Recognition (NER) to find a Persons Name (doc.ents_ == PERSON) and a
@@ -261,28 +1239,68 @@ class DocumentExtractor(object):
             2) For Extracting All companies mentioned in the doc, search all the pages of the PDF.
                Any Entity matching: ORG will be considered a valid Company Name.
 
+        Thin wrapper around analyze(). Refer collect_name_and_org_from_doc() for the per-page logic.
+
         Args:
             PDF_file (str): The full path to the PDF Document
+            max_pages (int): Search only the first <max_pages> pages. None searches all the pages.
+                             As the Authors are only searched for within the first 3 pages, max_pages=3 is enough
+                             when only the Author Name(s)/ Company Author Name(s) are of interest.
 
         Returns:
             possible_author_name (List[str]): Possible Person Author Names of the Document
             possible_author_comp (List[str]): Possible Company Author Names of the Document
             all_companies (List[str]): All companies mentioned in the document
+        """
+        result = self.analyze(pdf_path, name_and_org=True, email_names=False, target_price=False,
+                              max_pages=max_pages)
 
-            False: On a failure
+        return result.author_name, result.author_company, result.all_companies
+
+    def collect_name_and_org_from_doc(self, doc, index: int, result: DocumentAnalysis) -> List[Tuple[str, str]]:
+        """Collects possible Author Name(s), Company Author Name(s), All Companies from a single parsed page.
+
+        Refer _collect_name_and_org_from_entities(). Used by analyze() for every page parsed by Spacy.
+
+        Args:
+            doc (spacy.tokens.Doc): The Spacy Doc of the page of interest
+            index (int): The page index (0 based) of the page within the Document
+            result (DocumentAnalysis): The results of the Document, to which the names found are added
+                                       (author_name, author_company, all_companies, entity_pages)
+
+        Returns:
+            List[Tuple[str, str]]: The (Label, Text) of every entity of the page
         """
-        if self.entity_model == None:
-            print("Initialize the Model first")
-            return False
+        entities = self._doc_entities(doc)
 
-        text_contents = self.pdfreader_generate_text(pdf_path)
+        self._collect_name_and_org_from_entities(entities, index, result.author_name, result.author_company,
+                                                 result.all_companies, result.entity_pages)
 
-        # Initializing Different List's.
+        return entities
 
-        # all_companies --> Names of Companies (Spacy Tag: ORG) extracted from all pages
-        # possible_author_name --> Name's of Authors (Spacy Tag: PERSON) extracted from 1st to 3rd page
-        # possible_author_comp --> Name's of Companies (Spacy Tag: ORG) extracted from the 1st to 3rd page
+    @staticmethod
+    def _doc_entities(doc) -> List[Tuple[str, str]]:
+        """Returns the (Label, Text) of every entity of a Spacy Doc."""
 
+        return [(ent.label_, ent.text) for ent in doc.ents]
+
+    def _collect_name_and_org_from_entities(self, entities: List[Tuple[str, str]], index: int,
+                                            possible_author_name: List[str],
+                                            possible_author_comp: List[str],
+                                            all_companies: List[str],
+                                            entity_pages: Optional[List[list]] = None) -> None:
+        """Collects possible Author Name(s), Company Author Name(s), All Companies from the entities of a single page.
+
+        Args:
+            entities (List[Tuple[str, str]]): The (Label, Text) of every entity of the page of interest
+                                              (Refer _doc_entities())
+            index (int): The page index (0 based) of the page within the Document
+            possible_author_name (List[str]): Name's of Authors (Spacy Tag: PERSON) extracted from 1st to 3rd page
+            possible_author_comp (List[str]): Name's of Companies (Spacy Tag: ORG) extracted from the 1st to 3rd page
+            all_companies (List[str]): Names of Companies (Spacy Tag: ORG) extracted from all pages
+            entity_pages (List[list]): List to which every occurrence of a Company/ Author is appended as
+                                       [Kind, Name, Page Number, 1] (Refer DocumentAnalysis.entity_pages)
+        """
         # We work with an assumption that Author Name/ Company Author Name will come up within
         # the first 3 pages, and hope one of the names extracted would be the actual company name, author name
 
@@ -290,78 +1308,67 @@ class DocumentExtractor(object):
         # 1) If we know which section of the page Author/Company Name comes up, We could only parse portion of the text
         #    This can be done through OpenCV/PyTesseract Libraries (Parse only a Region of Interest)
 
-        all_companies = []
-        possible_author_name = []
-        possible_author_comp = []
-
         # For Author Person Name, and Author Company Name,
         # search the pages <first_page_ind> to <last_page_ind - 1> only!!
         last_page_ind = 3
         first_page_ind = 0
 
-        # Current Page Index
-        index = 0
+        # Label == PERSON --> Implies it is a Person
+        # Label == ORG --> Implies it is an Organisation
+        for label, ent_text in entities:
 
-        # Iterate through all the Pages
-        for text in text_contents:
+            # Perform some additional String Processing to ensure we have clean Text
 
-            # Using Spacy's NLP Model, get the Document Entities, which can be accessd through "doc"
-            # doc.ents_ == PERSON --> Implies it is a Person
-            # doc.ents_ == ORG --> Implies it is an Organisation
-            doc = self.entity_model(text)
+            # A Company/ Organisation can be composed of AlphaNumeric Characters
+            organisation_name_text = re.sub(r'[^A-Za-z0-9 ]+', '', ent_text).strip().lower()
 
-            for ent in doc.ents:
+            # A person will have only Alpha Characters (A-Z). Should generally not have any Numeric Characters
+            person_name_text = re.sub(r'[^A-Za-z ]+', '', ent_text).strip().lower()
 
-                # Perform some additional String Processing to ensure we have clean Text
+            # An Organization/ Person Name will generally have 2 or more words.
+            # We also Put a Limit on the Max Number of Words for an Organisation Name. Person Name.
 
-                # A Company/ Organisation can be composed of AlphaNumeric Characters
-                organisation_name_text = re.sub(r'[^A-Za-z0-9 ]+', '', ent.text).strip().lower()
+            # Unfortunately the Results from the Label produces a lot of False-Positives.
+            # This is one way of filtering out a lot of False Positives, with little probability
+            # of loosing out on Real Companies/ Real Person Names
 
-                # A person will have only Alpha Characters (A-Z). Should generally not have any Numeric Characters
-                person_name_text = re.sub(r'[^A-Za-z ]+', '', ent.text).strip().lower()
+            if label == "ORG" and \
+                    1 < len(organisation_name_text.split()) < 7:
 
-                # An Organization/ Person Name will generally have 2 or more words.
-                # We also Put a Limit on the Max Number of Words for an Organisation Name. Person Name.
+                # all_companies will have entries from all pages
+                if organisation_name_text not in all_companies:
+                    all_companies.append(organisation_name_text)
 
-                # Unfortunately the Results from ent.label_ produces a lot of False-Positives.
-                # This is one way of filtering out a lot of False Positives, with little probability
-                # of loosing out on Real Companies/ Real Person Names
+                if entity_pages is not None:
+                    entity_pages.append(["company", organisation_name_text, index + 1, 1])
 
-                if ent.label_ == "ORG" and \
-                        1 < len(organisation_name_text.split()) < 7:
-
-                    # all_companies will have entries from all pages
-                    if organisation_name_text not in all_companies:
-                        all_companies.append(organisation_name_text)
-
-                    # The Company Author of the Document is assumed to be within:
-                    # [<first_page_ind>, last_page_ind)
-                    if first_page_ind <= index < last_page_ind and \
-                            organisation_name_text not in possible_author_comp:
-                        possible_author_comp.append(organisation_name_text)
+                # The Company Author of the Document is assumed to be within:
+                # [<first_page_ind>, last_page_ind)
+                if first_page_ind <= index < last_page_ind and \
+                        organisation_name_text not in possible_author_comp:
+                    possible_author_comp.append(organisation_name_text)
 
 
-                # Author's will have ent.label_ as PERSON
+            # Author's will have the Label PERSON
 
-                # A person's name is expected to be within (1, 5) Words
+            # A person's name is expected to be within (1, 5) Words
 
-                # The Author Name of the Document is assumed to be within:
-                # [<first_page_ind>, last_page_ind)
-                elif ent.label_ == "PERSON" and \
-                        1 < len(person_name_text.split()) < 5 and \
-                        first_page_ind <= index < last_page_ind and \
-                        person_name_text not in possible_author_name:
+            # The Author Name of the Document is assumed to be within:
+            # [<first_page_ind>, last_page_ind)
+            elif label == "PERSON" and \
+                    1 < len(person_name_text.split()) < 5 and \
+                    first_page_ind <= index < last_page_ind:
 
+                if person_name_text not in possible_author_name:
                     possible_author_name.append(person_name_text)
 
-            # Increment the Page Counter
-            index += 1
-
-        return possible_author_name, possible_author_comp, all_companies
+                if entity_pages is not None:
+                    entity_pages.append(["author", person_name_text, index + 1, 1])
 
-    def get_target_price_and_recommendation(self, pdf_path: str) -> Union[List[dict],
-                                                                     List[str],
-                                                                     List[str]]:
+    def get_target_price_and_recommendation(self, pdf_path: str,
+                                            max_pages: Optional[int] = None) -> Union[List[dict],
+                                                                                      List[str],
+                                                                                      List[str]]:
         """Searches for a Target Price/ Recommendations in a Document (Financial Doc)
 
         Algorithm:
@@ -369,8 +1376,11 @@ class DocumentExtractor(object):
             2) Get the Text in the vicinity of "Target Price"/ "Price Target"
             3) Do RegExp Search of the text in step (2) to get the Target Price/ Recommendations
 
+        Thin wrapper around analyze(). Refer _collect_target_price_and_recommendation() for the per-page logic.
+
         Args:
             PDF_file (str): The full path to the PDF Document
+            max_pages (int): Search only the first <max_pages> pages. None searches all the pages
 
         Returns:
             price_recommendations_list (List[dict]) : A mapping between the Target Price and
@@ -378,127 +1388,28 @@ class DocumentExtractor(object):
             target_price_list (List[str]) : All Extracted Target Price from the Document
             recommendation_list (List[str]) : All Extracted Recommendations from the Documenr
         """
-        # We search for the Target Price/ Recommendation "around" target price/ price target text
-        target_price_tags = ['target price', 'price target']
-
-        text_contents = self.pdfreader_generate_text(pdf_path)
-
-        # A dictionary storing the Mapping between Price Recommendation, and Corresponding Recommendations
-        price_recommendations_list = []
-
-        # A list of Valid Target Prices Extracted
-        target_price_list = []
-
-        # A list of Valid Recommendations Extracted
-        recommendation_list = []
-
-        # Cycle through all the Pages
-        for text in text_contents:
-
-            # Remove \n literals to help with text processing
-            filtered_text = text.lower().replace('\n', '')
-
-            # Check all Possible Target Price Tags (target price/ price target)
-            for target_str in target_price_tags:
-
-                # Search the Document for possible search hits on "target price/ price target"
-                for match in re.finditer(target_str, filtered_text, re.MULTILINE | re.DOTALL):
-
-                    span = match.span()
-
-                    # For Target Price, search the Text upto 15 Characters "Right" of "target price/ price target"
-                    target_price_search_start_ind = span[0]
-                    target_price_search_end_ind = span[1] + 15
-
-                    # For Recommendations, search the Text upto 50 Characters "Right" and "Left of
-                    # "target price/ price target"
-                    reco_search_start_ind = max(span[0] - 50, 0)
-                    reco_search_end_ind = span[1] + 50
-
-                    target_price_search_str = filtered_text[target_price_search_start_ind:
-                                                            target_price_search_end_ind + 1]
-                    reco_search_str = filtered_text[reco_search_start_ind: reco_search_end_ind + 1]
-
-                    # Get the Target Price and Recommendations
-
-                    # target_price is a single "str"
-                    target_price = self.extract_target_prices_from_text(target_price_search_str)
-
-                    # recommendations is a List[str]
-                    recommendations = self.extract_recommendations_from_text(reco_search_str)
-
-                    # Store the Target-Price
-                    if len(target_price) > 0 and target_price not in target_price_list:
-                        target_price_list.append(target_price)
-
-                    # Store the Recommendations
-                    for recommendation in recommendations:
+        result = self.analyze(pdf_path, name_and_org=False, email_names=False, target_price=True,
+                              max_pages=max_pages)
 
-                        if recommendation not in recommendation_list:
-                            recommendation_list.append(recommendation)
+        return result.price_reco_mapping, result.target_prices, result.recommendations
 
-                    # If we Found a valid Target Price; add Target Price and Recommendation Mapping to the list
-                    if len(target_price) > 0:
+    def _collect_target_price_and_recommendation(self, text: str,
+                                                 price_recommendations_list: List[dict],
+                                                 target_price_list: List[str],
+                                                 recommendation_list: List[str]) -> int:
+        """Searches for a Target Price/ Recommendations in a single page of a Document.
 
-                        price_recom_dict = {target_price: recommendations}
-                        if price_recom_dict not in price_recommendations_list:
-
-                            price_recommendations_list.append(price_recom_dict)
-
-        return price_recommendations_list, target_price_list, recommendation_list
-
-    def extract_target_prices_from_text(self, text: str) -> str:
-        """Searches for Target Price from the <text> of interest
-
-            Does a Reg-Exp search to obtain the Target Price
-
-        Args:
-            text (str): Text to Extract Target Prices from
-
-        Returns:
-            price_filtered[0] (str): The Target Price
+        Refer TargetPriceExtractor.collect().
         """
-        # If the text is something like: "target price rs.1,1000 (24 %)"
-        # OP will be like ['target price rs.1,100', '(24']
-        prices = re.findall(r' \(*[a-zA-Z \`\~]*\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{3})*', text)
-
-        if len(prices) == 0:
-            return ""
-
-        # Work with 'target price rs.1,100' only (i.e. Text closest to "target price")
-        price = prices[0]
-
-        price_text = price.strip()
+        return self.target_price_extractor.collect(text, price_recommendations_list, target_price_list,
+                                                   recommendation_list)
 
-        # Do one more level of Text Filtration, to obtain the Raw Number (1,100)
-        price_filtered = re.findall(r'\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{2})*', price_text)
+    def extract_target_prices_from_text(self, text: str) -> str:
+        """Searches for Target Price from the <text> of interest. Refer TargetPriceExtractor."""
 
-        return price_filtered[0]
+        return self.target_price_extractor.extract_target_prices_from_text(text)
 
     def extract_recommendations_from_text(self, text: str) -> List[str]:
-        """Searches for Financial Recommendations from the <text> of interest
-
-            Does a Reg-Exp search to obtain the Financial Recommendations, and returns any
-            word that matches any of the words in <recommendation_tags> below
-
-        Args:
-            text (str): Text to Extract Recommendations from
-
-        Returns:
-            reco_list (List[str]): The Recommendations
-        """
-        # These are Potential Recommendation Tags
-        recommendation_tags = ['buy', 'sell', 'neutral', 'add', 'reduce', 'hold', 'outperform', 'maintain',
-                               'peer perform', 'mkt perform', 'recomm list', 'equal weight']
-
-        reco_list = []
-
-        # Get Any text that match with a String in recommendation_tags
-        recommendations = [x for x in recommendation_tags if len(re.findall(x, text)) > 0]
-
-        for recommendation in recommendations:
-
-            if recommendation not in reco_list:
-                reco_list.append(recommendation)
+        """Searches for Financial Recommendations from the <text> of interest. Refer TargetPriceExtractor."""
 
-        return reco_list
+        return self.target_price_extractor.extract_recommendations_from_text(text)
@@ -0,0 +1,290 @@
+# General Python Imports
+from typing import List, Optional
+import argparse
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+
+# HTTP Server Imports
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from DocumentExtractor import DocumentExtractor
+from PdfBackends import PDF_BACKENDS
+from ResultCache import ResultCache
+
+
+class ExtractionRequest(object):
+    """A single Document waiting to be processed by the MicroBatcher."""
+
+    def __init__(self, pdf_file: str, file_name: str):
+        """Constructor for the class ExtractionRequest().
+
+        Args:
+            pdf_file (str): The full path to the PDF Document
+            file_name (str): Name of the Document, as reported back in the response
+        """
+        self.pdf_file = pdf_file
+        self.file_name = file_name
+
+        # Set once the Document is processed
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class MicroBatcher(object):
+    """Groups concurrent ExtractionRequests into batches, processed by a single warm DocumentExtractor.
+
+    The pages of all the Documents of a batch go through shared nlp.pipe() calls (Refer
+    DocumentExtractor.analyze_many()). A batch is closed once it holds <max_batch_size> Documents, or
+    <max_wait> seconds after its first Document came in; whichever comes first.
+    """
+
+    def __init__(self, extractor: DocumentExtractor, max_batch_size: int = 8, max_wait: float = 0.05):
+        """Constructor for the class MicroBatcher().
+
+        Args:
+            extractor (DocumentExtractor): The (warm) DocumentExtractor. Only used from the batching thread
+            max_batch_size (int): Max. number of Documents within a batch
+            max_wait (float): Max. seconds a Document waits for the rest of its batch
+        """
+        self.extractor = extractor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+
+        self.requests = queue.Queue()
+
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, pdf_file: str, file_name: str) -> ExtractionRequest:
+        """Queues a Document, and waits until it is processed.
+
+        Args:
+            pdf_file (str): The full path to the PDF Document
+            file_name (str): Name of the Document, as reported back in the response
+
+        Returns:
+            ExtractionRequest: The processed request (With either the response or the error set)
+        """
+        request = ExtractionRequest(pdf_file, file_name)
+
+        self.requests.put(request)
+        request.done.wait()
+
+        return request
+
+    def next_batch(self) -> List[ExtractionRequest]:
+        """Waits for the next batch of requests. Refer MicroBatcher."""
+
+        batch = [self.requests.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            try:
+                batch.append(self.requests.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def run(self) -> None:
+        """Processes the batches of requests, forever (Runs within the batching thread)."""
+
+        while True:
+
+            batch = self.next_batch()
+
+            try:
+                results = list(self.extractor.analyze_many([request.pdf_file for request in batch]))
+
+                for request, result in zip(batch, results):
+                    request.response = build_response(request.file_name, result)
+
+            except Exception:
+
+                # A single bad Document stops the whole batch. Process the Documents one by one, so the error
+                # is reported against the bad Document only
+                for request in batch:
+                    try:
+                        request.response = build_response(request.file_name,
+                                                          self.extractor.analyze(request.pdf_file))
+                    except Exception as e:
+                        request.error = str(e)
+
+            for request in batch:
+                request.done.set()
+
+
+def build_response(file_name: str, result) -> dict:
+    """Builds the response of a processed Document, with the same fields main . py writes to the CSVs.
+
+    Args:
+        file_name (str): Name of the Document
+        result (DocumentAnalysis): The results of the Document
+
+    Returns:
+        dict: The response
+    """
+    return {'File Name': file_name,
+            'Author Name - Through Email': result.email_author_names,
+            'Author Name - Through Spacy Model': result.author_name,
+            'Author Institution Through Spacy Model': result.author_company,
+            'All Companies Through Spacy Model': result.all_companies,
+            'Target Price': result.target_prices,
+            'Recommendation': result.recommendations,
+            'Price - Recommendation Mapping': result.price_reco_mapping}
+
+
+class ExtractionRequestHandler(BaseHTTPRequestHandler):
+    """HTTP API of the ExtractionServer.
+
+    GET  /health   --> {"status": "ok"}
+    POST /extract  --> Body: {"path": "<Path to a PDF on this machine>"} (Content-Type: application/json), or
+                       the PDF itself (Content-Type: application/pdf; the name can be passed as X-File-Name).
+                       Responds with the fields of build_response(). A missing Content-Length is answered with
+                       411, an invalid (Eg. Negative) one with 400
+    """
+
+    # Set by serve()
+    batcher: Optional[MicroBatcher] = None
+
+    def send_json(self, status: int, body: dict) -> None:
+        """Sends <body> as a JSON response."""
+
+        payload = json.dumps(body).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+
+        if self.path == "/health":
+            self.send_json(200, {"status": "ok"})
+        else:
+            self.send_json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+
+        if self.path != "/extract":
+            self.send_json(404, {"error": "not found"})
+            return
+
+        content_length = self.headers.get("Content-Length")
+
+        if content_length is None:
+            self.send_json(411, {"error": "Content-Length required"})
+            return
+
+        # A negative length (Accepted by int()) would read until the client closes the connection
+        content_length = content_length.strip()
+
+        if not (content_length.isascii() and content_length.isdigit()):
+            self.send_json(400, {"error": "invalid Content-Length: " + content_length})
+            return
+
+        body = self.rfile.read(int(content_length))
+        temp_file = None
+
+        try:
+            if self.headers.get("Content-Type", "").startswith("application/pdf"):
+
+                # The upload is processed from a temporary file, removed once the response is built
+                with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as upload:
+                    upload.write(body)
+                    temp_file = upload.name
+
+                pdf_file = temp_file
+                file_name = self.headers.get("X-File-Name", "upload.pdf")
+
+            else:
+                payload = json.loads(body.decode("utf-8"))
+
+                # Eg. A JSON list/ string, or a non-string path, would otherwise fail with a TypeError
+                if not isinstance(payload, dict) or not isinstance(payload.get("path"), str):
+                    raise ValueError("expected a JSON object with a string path")
+
+                pdf_file = os.path.abspath(payload["path"])
+                file_name = os.path.basename(pdf_file)
+
+                if not os.path.isfile(pdf_file):
+                    self.send_json(404, {"error": "file not found: " + pdf_file})
+                    return
+
+        except ValueError:
+            self.send_json(400, {"error": "expected a JSON body {\"path\": ...} or an application/pdf upload"})
+            return
+
+        try:
+            request = self.batcher.submit(pdf_file, file_name)
+        finally:
+            if temp_file is not None:
+                os.remove(temp_file)
+
+        if request.error is not None:
+            self.send_json(500, {'File Name': file_name, "error": request.error})
+        else:
+            self.send_json(200, request.response)
+
+
+def serve(host: str = "127.0.0.1",
+          port: int = 8080,
+          max_batch_size: int = 8,
+          max_wait: float = 0.05,
+          cache_path: Optional[str] = None,
+          pdf_backend: str = "pypdf2") -> None:
+    """Runs the ExtractionServer: A long-lived HTTP server holding a single warm DocumentExtractor.
+
+    The Spacy Model is loaded once at startup, so a request only pays for the extraction itself.
+    Concurrent requests are micro-batched (Refer MicroBatcher).
+
+    Args:
+        host (str): Interface to listen on (Keep it local, Eg. 127.0.0.1)
+        port (int): Port to listen on
+        max_batch_size (int): Max. number of Documents within a batch
+        max_wait (float): Max. seconds a Document waits for the rest of its batch
+        cache_path (str): Path to the ResultCache SQLite file. None disables the cache
+        pdf_backend (str): Name of the PDF Text Extraction Backend (Refer PdfBackends)
+    """
+    extractor = DocumentExtractor(result_cache=ResultCache(cache_path) if cache_path is not None else None,
+                                  pdf_backend=pdf_backend)
+    extractor.train_entity_ruler()
+
+    ExtractionRequestHandler.batcher = MicroBatcher(extractor, max_batch_size, max_wait)
+
+    server = ThreadingHTTPServer((host, port), ExtractionRequestHandler)
+    print("Serving on http://%s:%d" % (host, port))
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Serves DocumentExtractor over HTTP, with a warm Spacy Model")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max_batch_size", type=int, default=8, help="Max. number of Documents within a batch")
+    parser.add_argument("--max_wait", type=float, default=0.05,
+                        help="Max. seconds a Document waits for the rest of its batch")
+    parser.add_argument("--cache_path", default=None, help="SQLite file caching the Extraction Results")
+    parser.add_argument("--pdf_backend", default="pypdf2", choices=list(PDF_BACKENDS))
+    args = parser.parse_args()
+
+    try:
+        serve(args.host, args.port, args.max_batch_size, args.max_wait, args.cache_path, args.pdf_backend)
+    except KeyboardInterrupt:
+        pass
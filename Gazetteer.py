@@ -0,0 +1,216 @@
+# General Python Imports
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import csv
+import hashlib
+import json
+import os
+import struct
+import sys
+
+
+class Gazetteer(object):
+    """Compact, De-duplicated store of Person/ Company names (By label: PERSON/ ORG).
+
+    The names of every label are kept as a single UTF-8 blob, plus an array of offsets into it (Instead of
+    one Python str per name), which keeps the memory per worker process small. A Gazetteer can be saved to/
+    loaded from a binary file (Refer save()/ load()), which skips parsing the CSVs altogether.
+    """
+
+    # Header of the binary file: Magic + Length of the JSON index that follows
+    MAGIC = b"GAZ1"
+
+    def __init__(self):
+        """Constructor for the class Gazetteer()."""
+
+        # Label --> UTF-8 blob of all its names
+        self._blobs: Dict[str, bytes] = {}
+
+        # Label --> Offset of every name within the blob (Plus the end of the blob)
+        self._offsets: Dict[str, array] = {}
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Normalizes a name: Collapses all whitespace (Including new-lines) into single spaces. Case is kept.
+
+        Args:
+            name (str): The name
+
+        Returns:
+            str: The normalized name ("" for a missing name)
+        """
+        return " ".join(name.split())
+
+    def add_names(self, label: str, names: Iterable[str]) -> None:
+        """Adds <names> under <label>. Names are normalized, and missing/ duplicate names are dropped.
+
+        Args:
+            label (str): The "type" of the names (PERSON/ ORG)
+            names (Iterable[str]): The names
+        """
+        seen = set(self.names(label))
+        blob = bytearray(self._blobs.get(label, b""))
+        offsets = self._offsets.get(label, array("I", [0]))
+
+        for name in names:
+
+            name = self.normalize(name)
+
+            if len(name) == 0 or name in seen:
+                continue
+
+            seen.add(name)
+            blob.extend(name.encode("utf-8"))
+            offsets.append(len(blob))
+
+        self._blobs[label] = bytes(blob)
+        self._offsets[label] = offsets
+
+    def add_csv(self, label: str, csv_file: str, column: str, encoding: str = "ISO-8859-1") -> None:
+        """Streams the names of the column <column> of <csv_file> into the Gazetteer, under <label>.
+
+        Args:
+            label (str): The "type" of the names (PERSON/ ORG)
+            csv_file (str): Path to the CSV file
+            column (str): Name of the column holding the names
+            encoding (str): Encoding of the CSV file
+        """
+        with open(csv_file, newline="", encoding=encoding) as file:
+            self.add_names(label, (row.get(column) or "" for row in csv.DictReader(file)))
+
+    def labels(self) -> List[str]:
+        """Returns the labels within the Gazetteer."""
+
+        return list(self._blobs)
+
+    def names(self, label: str) -> Iterator[str]:
+        """Yields the names under <label>, in the order they were added.
+
+        Args:
+            label (str): The "type" of the names (PERSON/ ORG)
+
+        Returns:
+            Iterator[str]: The names
+        """
+        blob = self._blobs.get(label, b"")
+        offsets = self._offsets.get(label, array("I", [0]))
+
+        for ind in range(len(offsets) - 1):
+            yield blob[offsets[ind]: offsets[ind + 1]].decode("utf-8")
+
+    def count(self, label: str) -> int:
+        """Returns the number of names under <label>."""
+
+        return max(len(self._offsets.get(label, ())) - 1, 0)
+
+    def __len__(self) -> int:
+        return sum(self.count(label) for label in self._blobs)
+
+    def patterns(self) -> Iterator[dict]:
+        """Yields every name as a pattern for Spacy's EntityRuler ({'label': <label>, 'pattern': <name>})."""
+
+        for label in self._blobs:
+            for name in self.names(label):
+                yield {'label': label, "pattern": name}
+
+    def save(self, path: str) -> None:
+        """Saves the Gazetteer to the binary file <path>.
+
+        Layout: MAGIC, Length of the index (uint32), JSON index [[label, number of offsets, blob length], ...],
+        followed by the offsets (uint32) and the blob of every label.
+
+        Args:
+            path (str): Path to the binary file
+        """
+        index = [[label, len(self._offsets[label]), len(self._blobs[label])] for label in self._blobs]
+        index_bytes = json.dumps(index).encode("utf-8")
+
+        # Write to a temporary file first, and then move it in place (Several processes may build it at once)
+        temp_path = path + ".tmp-" + str(os.getpid())
+
+        with open(temp_path, "wb") as file:
+
+            file.write(self.MAGIC)
+            file.write(struct.pack("<I", len(index_bytes)))
+            file.write(index_bytes)
+
+            for label in self._blobs:
+                # The offsets are stored Little-Endian
+                offsets = array("I", self._offsets[label])
+                if sys.byteorder == "big":
+                    offsets.byteswap()
+
+                file.write(offsets.tobytes())
+                file.write(self._blobs[label])
+
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "Gazetteer":
+        """Loads a Gazetteer from the binary file <path> (Refer save()).
+
+        Args:
+            path (str): Path to the binary file
+
+        Returns:
+            Gazetteer: The loaded Gazetteer
+        """
+        gazetteer = cls()
+
+        with open(path, "rb") as file:
+
+            if file.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError("Not a Gazetteer file: " + path)
+
+            index_length, = struct.unpack("<I", file.read(4))
+
+            for label, num_offsets, blob_length in json.loads(file.read(index_length).decode("utf-8")):
+
+                offsets = array("I")
+                offsets.frombytes(file.read(num_offsets * offsets.itemsize))
+                if sys.byteorder == "big":
+                    offsets.byteswap()
+
+                gazetteer._offsets[label] = offsets
+                gazetteer._blobs[label] = file.read(blob_length)
+
+        return gazetteer
+
+    @classmethod
+    def from_sources(cls, sources: List[Tuple[str, str, str]], cache_dir: Optional[str] = None) -> "Gazetteer":
+        """Builds a Gazetteer from CSV files, going through the binary file cached at <cache_dir> if available.
+
+        The binary file is keyed on a hash of the contents of the CSV files (And the <sources> themselves).
+
+        Args:
+            sources (List[Tuple[str, str, str]]): (Label, CSV file, Column) of every source of names
+            cache_dir (str): Folder holding the binary Gazetteer files. None disables the cache
+
+        Returns:
+            Gazetteer: The Gazetteer
+        """
+        cache_path = None
+
+        if cache_dir is not None:
+
+            hasher = hashlib.sha256(json.dumps(sources).encode("utf-8"))
+
+            for _, csv_file, _ in sources:
+                with open(csv_file, "rb") as file:
+                    hasher.update(file.read())
+
+            cache_path = os.path.join(cache_dir, "gazetteer-" + hasher.hexdigest()[:16] + ".bin")
+
+            if os.path.isfile(cache_path):
+                return cls.load(cache_path)
+
+        gazetteer = cls()
+
+        for label, csv_file, column in sources:
+            gazetteer.add_csv(label, csv_file, column)
+
+        if cache_path is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            gazetteer.save(cache_path)
+
+        return gazetteer
@@ -0,0 +1,269 @@
+# General Python Imports
+from array import array
+from typing import Dict, List, Optional, Tuple
+import json
+import os
+import struct
+import sys
+
+# Spacy Imports
+from spacy.language import Language
+from spacy.matcher import PhraseMatcher
+from spacy.tokens import Span
+from spacy.util import filter_spans
+
+from Gazetteer import Gazetteer
+
+
+class PhrasePatterns(object):
+    """The names of a Gazetteer, compiled into PhraseMatcher patterns (By label).
+
+    A pattern is kept as its PhraseMatcher key: The <attr> hash (Eg. ORTH/ LOWER) of every token of the name,
+    which PhraseMatcher.add() takes in place of a Doc. Building the patterns tokenizes every name into a Spacy Doc
+    (Refer from_gazetteer()), which dominates the startup of the Pipeline. The keys are saved to/ loaded from a
+    binary file (Refer save()/ load()), so a warm start builds no Doc at all.
+    """
+
+    # Header of the binary file: Magic + Length of the JSON index that follows
+    MAGIC = b"PHP1"
+
+    def __init__(self, attr: str = "ORTH"):
+        """Constructor for the class PhrasePatterns().
+
+        Args:
+            attr (str): The Token attribute the patterns are matched on (Refer PhraseMatcher(attr=...))
+        """
+        self.attr = attr
+
+        # Label --> Key of every pattern (Token hashes)
+        self._keys: Dict[str, List[Tuple[int, ...]]] = {}
+
+    @classmethod
+    def from_gazetteer(cls, nlp, gazetteer: Gazetteer, attr: str = "ORTH",
+                       batch_size: int = 1000) -> "PhrasePatterns":
+        """Compiles the names of <gazetteer>, through the Tokenizer of <nlp> only (No other Pipeline component).
+
+        Args:
+            nlp (Language): The Spacy Pipeline the patterns are matched within
+            gazetteer (Gazetteer): The names (By label)
+            attr (str): The Token attribute the patterns are matched on
+            batch_size (int): Number of names tokenized at a time
+
+        Returns:
+            PhrasePatterns: The patterns
+        """
+        patterns = cls(attr)
+
+        for label in gazetteer.labels():
+            patterns._keys[label] = [tuple(doc.to_array(attr).tolist())
+                                     for doc in nlp.tokenizer.pipe(gazetteer.names(label), batch_size=batch_size)
+                                     if len(doc) > 0]
+
+        return patterns
+
+    def labels(self) -> List[str]:
+        """Returns the labels of the patterns."""
+
+        return list(self._keys)
+
+    def keys(self, label: str) -> List[Tuple[int, ...]]:
+        """Returns the keys of the patterns under <label> (Refer PhrasePatterns)."""
+
+        return self._keys.get(label, [])
+
+    def __len__(self) -> int:
+        return sum(len(keys) for keys in self._keys.values())
+
+    def add_to(self, matcher: PhraseMatcher) -> None:
+        """Adds all the patterns to <matcher> (Whose attr must be self.attr), under their labels."""
+
+        for label, keys in self._keys.items():
+            matcher.add(label, keys)
+
+    def save(self, path: str) -> None:
+        """Saves the patterns to the binary file <path>.
+
+        Layout: MAGIC, Length of the index (uint32), JSON index {"attr": ..., "labels": [[label, number of
+        patterns, number of hashes], ...]}, followed by the pattern lengths (uint32) and the hashes (uint64) of
+        every label.
+
+        Args:
+            path (str): Path to the binary file
+        """
+        index = {"attr": self.attr,
+                 "labels": [[label, len(keys), sum(len(key) for key in keys)] for label, keys in self._keys.items()]}
+        index_bytes = json.dumps(index).encode("utf-8")
+
+        # Write to a temporary file first, and then move it in place (Several processes may build it at once)
+        temp_path = path + ".tmp-" + str(os.getpid())
+
+        with open(temp_path, "wb") as file:
+
+            file.write(self.MAGIC)
+            file.write(struct.pack("<I", len(index_bytes)))
+            file.write(index_bytes)
+
+            for keys in self._keys.values():
+
+                # Stored Little-Endian
+                lengths = array("I", [len(key) for key in keys])
+                hashes = array("Q", [token_hash for key in keys for token_hash in key])
+                if sys.byteorder == "big":
+                    lengths.byteswap()
+                    hashes.byteswap()
+
+                file.write(lengths.tobytes())
+                file.write(hashes.tobytes())
+
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "PhrasePatterns":
+        """Loads the patterns from the binary file <path> (Refer save()).
+
+        Args:
+            path (str): Path to the binary file
+
+        Returns:
+            PhrasePatterns: The patterns
+        """
+        with open(path, "rb") as file:
+
+            if file.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError("Not a PhrasePatterns file: " + path)
+
+            index_length, = struct.unpack("<I", file.read(4))
+            index = json.loads(file.read(index_length).decode("utf-8"))
+
+            patterns = cls(index["attr"])
+
+            for label, num_patterns, num_hashes in index["labels"]:
+
+                lengths = array("I")
+                lengths.frombytes(file.read(num_patterns * lengths.itemsize))
+                hashes = array("Q")
+                hashes.frombytes(file.read(num_hashes * hashes.itemsize))
+                if sys.byteorder == "big":
+                    lengths.byteswap()
+                    hashes.byteswap()
+
+                keys = []
+                start = 0
+                for length in lengths:
+                    keys.append(tuple(hashes[start: start + length]))
+                    start += length
+
+                patterns._keys[label] = keys
+
+        return patterns
+
+
+class GazetteerMatcher(object):
+    """Spacy Pipeline component, tagging the names of a Gazetteer as entities, through a PhraseMatcher.
+
+    An alternative to Spacy's EntityRuler with plain-string patterns:
+        - Patterns are built in bulk through the Tokenizer only (Refer PhrasePatterns), instead of the full Pipeline
+        - Matching is case-insensitive (attr="LOWER")
+        - Its position relative to "ner" is explicit (Refer DocumentExtractor.train_entity_ruler()). Placed before
+          "ner", the matched names are kept and "ner" fills in around them. Placed after "ner", the matched names
+          only fill in where "ner" found nothing (Unless <overwrite_ents>), as the EntityRuler does
+    """
+
+    name = "gazetteer_matcher"
+
+    # The Token attribute the names are matched on
+    attr = "LOWER"
+
+    def __init__(self, nlp, gazetteer: Optional[Gazetteer] = None, overwrite_ents: bool = False,
+                 patterns: Optional[PhrasePatterns] = None, **cfg):
+        """Constructor for the class GazetteerMatcher().
+
+        Args:
+            nlp (Language): The Spacy Pipeline the component is added to
+            gazetteer (Gazetteer): The names to match (By label). Compiled through the Tokenizer of <nlp>
+            overwrite_ents (bool): Let the matched names replace overlapping entities already found
+            patterns (PhrasePatterns): The names to match, already compiled (On LOWER). Used instead of <gazetteer>.
+                                       Either can also be loaded through from_disk()
+        """
+        self.nlp = nlp
+        self.overwrite_ents = overwrite_ents
+        self.patterns = None
+        self.matcher = PhraseMatcher(nlp.vocab, attr=self.attr)
+
+        if patterns is not None:
+            self.add_patterns(patterns)
+
+        elif gazetteer is not None:
+            self.add_gazetteer(gazetteer)
+
+    def add_gazetteer(self, gazetteer: Gazetteer, batch_size: int = 1000) -> None:
+        """Adds all the names of <gazetteer> as (case-insensitive) patterns.
+
+        Args:
+            gazetteer (Gazetteer): The names to match (By label)
+            batch_size (int): Number of names tokenized at a time
+        """
+        self.add_patterns(PhrasePatterns.from_gazetteer(self.nlp, gazetteer, self.attr, batch_size))
+
+    def add_patterns(self, patterns: PhrasePatterns) -> None:
+        """Adds the compiled names of <patterns> (Which must be matched on LOWER) as patterns.
+
+        Raises:
+            ValueError: If <patterns> are matched on another Token attribute
+        """
+        if patterns.attr != self.attr:
+            raise ValueError("GazetteerMatcher patterns must be matched on " + self.attr + ", not " + patterns.attr)
+
+        self.patterns = patterns
+        patterns.add_to(self.matcher)
+
+    def __call__(self, doc):
+        """Tags the names of the Gazetteer within <doc> as entities (doc.ents).
+
+        Overlapping matches are resolved in favour of the longest (Then the first) one. Matches overlapping
+        an entity already set on <doc> are dropped, unless <self.overwrite_ents> (Then the entity is dropped).
+        """
+        matches = filter_spans([Span(doc, start, end, label=match_id) for match_id, start, end in self.matcher(doc)])
+        entities = list(doc.ents)
+
+        kept, candidates = (matches, entities) if self.overwrite_ents else (entities, matches)
+
+        covered = set()
+        for span in kept:
+            covered.update(range(span.start, span.end))
+
+        kept.extend(span for span in candidates if covered.isdisjoint(range(span.start, span.end)))
+        doc.ents = sorted(kept, key=lambda span: span.start)
+
+        return doc
+
+    def to_disk(self, path, exclude=tuple(), **kwargs) -> None:
+        """Saves the component (Its compiled patterns, and its settings) to the folder <path>."""
+
+        path = str(path)
+        os.makedirs(path, exist_ok=True)
+
+        with open(os.path.join(path, "cfg.json"), "w") as cfg_file:
+            json.dump({"overwrite_ents": self.overwrite_ents}, cfg_file)
+
+        if self.patterns is not None:
+            self.patterns.save(os.path.join(path, "patterns.bin"))
+
+    def from_disk(self, path, exclude=tuple(), **kwargs) -> "GazetteerMatcher":
+        """Loads the component from the folder <path> (Refer to_disk()). The compiled patterns are added as they
+        are (No name goes through the Tokenizer again)."""
+
+        path = str(path)
+
+        with open(os.path.join(path, "cfg.json")) as cfg_file:
+            self.overwrite_ents = json.load(cfg_file)["overwrite_ents"]
+
+        patterns_path = os.path.join(path, "patterns.bin")
+        if os.path.isfile(patterns_path):
+            self.add_patterns(PhrasePatterns.load(patterns_path))
+
+        return self
+
+
+# Lets spacy.load() rebuild the component of a Pipeline saved through nlp.to_disk()
+Language.factories[GazetteerMatcher.name] = lambda nlp, **cfg: GazetteerMatcher(nlp, **cfg)
@@ -0,0 +1,106 @@
+# General Python Imports
+from typing import Optional, Set
+import hashlib
+
+# Regex Import
+import re
+
+
+class PageFilter(object):
+    """Cheap pre-classifier, picking the pages of a Document which are not worth running Spacy's NER on.
+
+    A page is skipped (Reason in brackets) when it has:
+        - Hardly any Text: Fewer than <min_alpha_chars> letters (low_text)
+        - Mostly numbers: More than <max_numeric_ratio> of its words are numbers, Eg. Financial Tables (numeric)
+        - The same Text as an earlier page of the Document, ignoring numbers/ case/ whitespace. Eg. Repeated
+          disclaimers (duplicate)
+
+    The first <protected_pages> pages are never skipped, as the Author Name(s)/ Company Author Name(s) are
+    searched for within them (Refer DocumentExtractor.collect_name_and_org_from_doc()), and a cover page
+    often holds little more than the names.
+
+    Only the NER is skipped. The Email/ Target Price Extractors still see the full Text of every page.
+    """
+
+    # Every reason a page can be skipped for (Refer classify())
+    REASONS = ["low_text", "numeric", "duplicate"]
+
+    # A letter (Any script)
+    LETTER = re.compile(r"[^\W\d_]")
+
+    # A "number": Digits with an optional sign/ currency/ percent, decimal/ thousands separators, or brackets
+    NUMERIC_WORD = re.compile(r"[-+(]?(?:rs\.?|inr|\$)?[\d.,:/%-]*\d[\d.,:/%-]*\)?x?", re.IGNORECASE)
+
+    def __init__(self, min_alpha_chars: int = 100,
+                 max_numeric_ratio: float = 0.5,
+                 skip_duplicates: bool = True,
+                 protected_pages: int = 3):
+        """Constructor for the class PageFilter().
+
+        Args:
+            min_alpha_chars (int): Pages with fewer letters are skipped
+            max_numeric_ratio (float): Pages where a larger share of the words are numbers are skipped
+            skip_duplicates (bool): Skip the pages repeating an earlier page of the Document
+            protected_pages (int): Number of leading pages which are never skipped
+        """
+        self.min_alpha_chars = min_alpha_chars
+        self.max_numeric_ratio = max_numeric_ratio
+        self.skip_duplicates = skip_duplicates
+        self.protected_pages = protected_pages
+
+    def cache_key(self) -> str:
+        """Returns a key identifying the settings of the filter (The results of a Document depend on them)."""
+
+        return "pf-%d-%s-%d-%d" % (self.min_alpha_chars, self.max_numeric_ratio, int(self.skip_duplicates),
+                                   self.protected_pages)
+
+    @staticmethod
+    def fingerprint(text: str) -> str:
+        """Hashes the Text of a page, ignoring numbers (Eg. Page numbers/ dates), case and whitespace.
+
+        Args:
+            text (str): The Text of the page
+
+        Returns:
+            str: The fingerprint
+        """
+        normalized = " ".join(re.sub(r"\d+", "", text.lower()).split())
+
+        return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+    def classify(self, text: str, index: int, seen_fingerprints: Set[str]) -> Optional[str]:
+        """Decides whether the NER should be skipped for a page.
+
+        Args:
+            text (str): The Text of the page
+            index (int): The page index (0 based) of the page within the Document
+            seen_fingerprints (Set[str]): Fingerprints of the earlier pages of the Document. Updated in place
+
+        Returns:
+            str: The reason the page should be skipped (Refer REASONS). None if the NER should run on it
+        """
+        if index < self.protected_pages:
+            if self.skip_duplicates:
+                seen_fingerprints.add(self.fingerprint(text))
+
+            return None
+
+        if len(self.LETTER.findall(text)) < self.min_alpha_chars:
+            return "low_text"
+
+        words = text.split()
+        numeric_words = sum(1 for word in words if self.NUMERIC_WORD.fullmatch(word))
+
+        if numeric_words > self.max_numeric_ratio * len(words):
+            return "numeric"
+
+        if self.skip_duplicates:
+
+            fingerprint = self.fingerprint(text)
+
+            if fingerprint in seen_fingerprints:
+                return "duplicate"
+
+            seen_fingerprints.add(fingerprint)
+
+        return None
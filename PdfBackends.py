@@ -0,0 +1,270 @@
+# General Python Imports
+from typing import Dict, Iterator, Optional, Tuple, Type
+import argparse
+import mmap
+import time
+
+
+class PdfTextBackend(object):
+    """Interface of a PDF Text Extraction Backend.
+
+    A Backend lazily extracts the Text of a PDF Document, one page at a time (Refer iter_pages()).
+    New Backends only need to implement iter_pages(), and be registered within PDF_BACKENDS.
+    """
+
+    # Name of the Backend (As selected through get_pdf_backend())
+    name = ""
+
+    # Python package implementing the Backend (Used to report its version)
+    package = ""
+
+    def version(self) -> str:
+        """Returns the version of the Backend (Part of the cache key of the extracted Text)."""
+
+        # Imported on first use (Refer PyPDF2Backend.iter_pages())
+        from importlib import metadata
+
+        try:
+            package_version = metadata.version(self.package)
+        except metadata.PackageNotFoundError:
+            package_version = "unknown"
+
+        return self.name + "-" + package_version
+
+    def iter_pages(self, PDF_file: str, first_page: int = 0, max_pages: Optional[int] = None) -> Iterator[str]:
+        """Lazily extracts Text from the <PDF_file> Document Specified, one page at a time.
+
+        Args:
+            PDF_file (str): The full path to the PDF Document
+            first_page (int): Index (0 based) of the first page to extract
+            max_pages (int): Extract at most <max_pages> pages. None extracts upto the last page
+
+        Returns:
+            Iterator[str]: Page wise Contents of the PDF of interest.
+        """
+        raise NotImplementedError
+
+    def iter_timed_pages(self, PDF_file: str,
+                         first_page: int = 0,
+                         max_pages: Optional[int] = None) -> Iterator[Tuple[str, float]]:
+        """Same as iter_pages(), but also reports the time taken to extract every page.
+
+        Returns:
+            Iterator[Tuple[str, float]]: (Page Contents, Extraction Time in Seconds) of every page
+        """
+        pages = self.iter_pages(PDF_file, first_page, max_pages)
+
+        while True:
+
+            start_time = time.perf_counter()
+
+            try:
+                text = next(pages)
+            except StopIteration:
+                return
+
+            yield text, time.perf_counter() - start_time
+
+
+class PyPDF2Backend(PdfTextBackend):
+    """Extracts Text through PyPDF2 (PdfFileReader(...).getPage(i).extractText()). The default Backend."""
+
+    name = "pypdf2"
+    package = "PyPDF2"
+
+    def iter_pages(self, PDF_file: str, first_page: int = 0, max_pages: Optional[int] = None) -> Iterator[str]:
+        """Refer PdfTextBackend.iter_pages().
+
+        The PDF is memory-mapped (instead of being read into memory), and a page's Text is only extracted
+        when it is asked for.
+        """
+        # Imported on first use, so importing the Backends (Eg. through DocumentExtractor) stays cheap
+        import PyPDF2
+
+        with open(PDF_file, 'rb') as pdfFileObj:
+
+            try:
+                pdfStream = mmap.mmap(pdfFileObj.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be memory-mapped. Let PyPDF2 report the error on the file itself
+                pdfStream = pdfFileObj
+
+            try:
+                pdfReader = PyPDF2.PdfFileReader(pdfStream)
+
+                numPages = pdfReader.numPages
+
+                last_page = numPages
+                if max_pages is not None:
+                    last_page = min(numPages, first_page + max_pages)
+
+                for page in range(first_page, last_page):
+                    pageObj = pdfReader.getPage(page)
+
+                    yield pageObj.extractText()
+
+            finally:
+                if pdfStream is not pdfFileObj:
+                    pdfStream.close()
+
+
+class PdfMinerBackend(PdfTextBackend):
+    """Extracts Text through pdfminer.six (Layout Analysis based; slower, but keeps words apart)."""
+
+    name = "pdfminer"
+    package = "pdfminer.six"
+
+    def __init__(self):
+        """Constructor for the class PdfMinerBackend()."""
+
+        try:
+            from pdfminer.high_level import extract_pages
+            from pdfminer.layout import LTTextContainer
+        except ImportError:
+            raise ImportError("The pdfminer backend requires pdfminer.six (pip install pdfminer.six)")
+
+        self.extract_pages = extract_pages
+        self.text_container = LTTextContainer
+
+    def iter_pages(self, PDF_file: str, first_page: int = 0, max_pages: Optional[int] = None) -> Iterator[str]:
+        """Refer PdfTextBackend.iter_pages()."""
+
+        page_numbers = None
+        if max_pages is not None:
+            page_numbers = range(first_page, first_page + max_pages)
+
+        for index, page_layout in enumerate(self.extract_pages(PDF_file, page_numbers=page_numbers)):
+
+            # Without <page_numbers>, pdfminer starts from the first page
+            if page_numbers is None and index < first_page:
+                continue
+
+            yield "".join(element.get_text() for element in page_layout
+                          if isinstance(element, self.text_container))
+
+
+class PyMuPDFBackend(PdfTextBackend):
+    """Extracts Text through PyMuPDF (MuPDF, native code; usually the fastest)."""
+
+    name = "pymupdf"
+    package = "PyMuPDF"
+
+    def __init__(self):
+        """Constructor for the class PyMuPDFBackend()."""
+
+        try:
+            import fitz
+        except ImportError:
+            raise ImportError("The pymupdf backend requires PyMuPDF (pip install PyMuPDF)")
+
+        self.fitz = fitz
+
+    def iter_pages(self, PDF_file: str, first_page: int = 0, max_pages: Optional[int] = None) -> Iterator[str]:
+        """Refer PdfTextBackend.iter_pages()."""
+
+        pdf_document = self.fitz.open(PDF_file)
+
+        try:
+            last_page = pdf_document.page_count
+            if max_pages is not None:
+                last_page = min(last_page, first_page + max_pages)
+
+            for page in range(first_page, last_page):
+                yield pdf_document.load_page(page).get_text()
+
+        finally:
+            pdf_document.close()
+
+
+class PdfiumBackend(PdfTextBackend):
+    """Extracts Text through pypdfium2 (PDFium, native code)."""
+
+    name = "pdfium"
+    package = "pypdfium2"
+
+    def __init__(self):
+        """Constructor for the class PdfiumBackend()."""
+
+        try:
+            import pypdfium2
+        except ImportError:
+            raise ImportError("The pdfium backend requires pypdfium2 (pip install pypdfium2)")
+
+        self.pdfium = pypdfium2
+
+    def iter_pages(self, PDF_file: str, first_page: int = 0, max_pages: Optional[int] = None) -> Iterator[str]:
+        """Refer PdfTextBackend.iter_pages()."""
+
+        pdf_document = self.pdfium.PdfDocument(PDF_file)
+
+        try:
+            last_page = len(pdf_document)
+            if max_pages is not None:
+                last_page = min(last_page, first_page + max_pages)
+
+            for page in range(first_page, last_page):
+
+                pdf_page = pdf_document[page]
+                text_page = pdf_page.get_textpage()
+
+                try:
+                    yield text_page.get_text_range()
+                finally:
+                    text_page.close()
+                    pdf_page.close()
+
+        finally:
+            pdf_document.close()
+
+
+# All the available Backends, by name
+PDF_BACKENDS: Dict[str, Type[PdfTextBackend]] = {
+    PyPDF2Backend.name: PyPDF2Backend,
+    PdfMinerBackend.name: PdfMinerBackend,
+    PyMuPDFBackend.name: PyMuPDFBackend,
+    PdfiumBackend.name: PdfiumBackend,
+}
+
+
+def get_pdf_backend(name: str = PyPDF2Backend.name) -> PdfTextBackend:
+    """Returns the PDF Text Extraction Backend called <name> (Refer PDF_BACKENDS).
+
+    Args:
+        name (str): Name of the Backend
+
+    Returns:
+        PdfTextBackend: The Backend
+    """
+    if name not in PDF_BACKENDS:
+        raise ValueError("Unknown PDF backend: " + name + ". Available: " + ", ".join(PDF_BACKENDS))
+
+    return PDF_BACKENDS[name]()
+
+
+if __name__ == "__main__":
+
+    # Compares the per-page Extraction Time of the Backends on a Document
+    parser = argparse.ArgumentParser(description="Reports the per-page Text Extraction Time of the PDF Backends")
+    parser.add_argument("pdf_file", help="The PDF Document")
+    parser.add_argument("--backends", nargs="+", default=list(PDF_BACKENDS), choices=list(PDF_BACKENDS))
+    parser.add_argument("--max_pages", type=int, default=None)
+    args = parser.parse_args()
+
+    for backend_name in args.backends:
+
+        try:
+            backend = get_pdf_backend(backend_name)
+        except ImportError as e:
+            print(backend_name, "-", e)
+            continue
+
+        page_times = []
+        num_chars = 0
+
+        for text, page_time in backend.iter_timed_pages(args.pdf_file, max_pages=args.max_pages):
+            page_times.append(page_time)
+            num_chars += len(text)
+
+        print(backend.version(), "- Pages:", len(page_times), "Characters:", num_chars,
+              "Total Time: %.3fs" % sum(page_times),
+              "Mean Time/ Page: %.4fs" % (sum(page_times) / max(len(page_times), 1)))
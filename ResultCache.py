@@ -0,0 +1,142 @@
+# General Python Imports
+from typing import Any, Optional
+import hashlib
+import json
+import time
+import zlib
+
+# Persistent Store Import
+import sqlite3
+
+
+class ResultCache(object):
+    """Persistent, Size-Bounded cache of Extraction Results, backed by a single SQLite file.
+
+    Entries are grouped into "layers" (Eg. "page_texts" for the extracted PDF Text, "results" for the
+    outputs of the Extractors). Keys are content addressed (Refer file_content_hash()), so an unchanged
+    Document is never reprocessed, irrespective of its file name/ location.
+
+    Values are stored as zlib compressed JSON. Once the total size of the stored values exceeds
+    <max_bytes>, the Least Recently Used entries are evicted.
+    """
+
+    def __init__(self, path: str = ".extraction_cache.sqlite", max_bytes: int = 512 * 1024 * 1024):
+        """Constructor for the class ResultCache().
+
+        Args:
+            path (str): Path to the SQLite file
+            max_bytes (int): Max. total size (of the compressed values) stored in the cache
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+
+        # The connection is opened lazily, so a ResultCache can be handed over to worker processes
+        self._connection = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The SQLite connection (Opened on first use)."""
+
+        if self._connection is None:
+
+            # Several worker processes may share the same cache file. WAL lets readers and a writer work together,
+            # and the timeout makes a writer wait for another, instead of failing.
+            self._connection = sqlite3.connect(self.path, timeout=60)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS cache ("
+                                     "layer TEXT NOT NULL, "
+                                     "key TEXT NOT NULL, "
+                                     "value BLOB NOT NULL, "
+                                     "size INTEGER NOT NULL, "
+                                     "last_access REAL NOT NULL, "
+                                     "PRIMARY KEY (layer, key))")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS cache_last_access ON cache (last_access)")
+            self._connection.commit()
+
+        return self._connection
+
+    @staticmethod
+    def file_content_hash(file_path: str) -> str:
+        """Hashes the contents of the file <file_path>.
+
+        Args:
+            file_path (str): The full path to the file
+
+        Returns:
+            str: SHA-256 hex digest of the file contents
+        """
+        hasher = hashlib.sha256()
+
+        with open(file_path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                hasher.update(block)
+
+        return hasher.hexdigest()
+
+    def get(self, layer: str, key: str) -> Optional[Any]:
+        """Looks up the value stored at (<layer>, <key>).
+
+        Args:
+            layer (str): The cache layer
+            key (str): The key within the layer
+
+        Returns:
+            Any: The (JSON decoded) value. None if not found
+        """
+        row = self.connection.execute("SELECT value FROM cache WHERE layer = ? AND key = ?",
+                                      (layer, key)).fetchone()
+
+        if row is None:
+            return None
+
+        # Refresh the entry, so it is the last one to be evicted
+        self.connection.execute("UPDATE cache SET last_access = ? WHERE layer = ? AND key = ?",
+                                (time.time(), layer, key))
+        self.connection.commit()
+
+        return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+
+    def put(self, layer: str, key: str, value: Any) -> None:
+        """Stores the (JSON serializable) <value> at (<layer>, <key>), and evicts old entries if required.
+
+        Args:
+            layer (str): The cache layer
+            key (str): The key within the layer
+            value (Any): The value to store
+        """
+        blob = zlib.compress(json.dumps(value).encode("utf-8"))
+
+        self.connection.execute("INSERT OR REPLACE INTO cache (layer, key, value, size, last_access) "
+                                "VALUES (?, ?, ?, ?, ?)",
+                                (layer, key, blob, len(blob), time.time()))
+        self.connection.commit()
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Evicts the Least Recently Used entries, until the cache is within <self.max_bytes>."""
+
+        total_size = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+
+        if total_size <= self.max_bytes:
+            return
+
+        evict_keys = []
+
+        for layer, key, size in self.connection.execute("SELECT layer, key, size FROM cache "
+                                                        "ORDER BY last_access"):
+            if total_size <= self.max_bytes:
+                break
+
+            evict_keys.append((layer, key))
+            total_size -= size
+
+        self.connection.executemany("DELETE FROM cache WHERE layer = ? AND key = ?", evict_keys)
+        self.connection.commit()
+
+    def close(self) -> None:
+        """Closes the SQLite connection."""
+
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,373 @@
+# General Python Imports
+from typing import Dict, List, Optional, Set
+import csv
+import glob
+import json
+import os
+
+from DocumentExtractor import DocumentAnalysis
+
+
+# The List-of-strings fields of a result record (Refer result_record())
+LIST_FIELDS = ["author_name", "author_company", "all_companies", "canonical_companies", "email_author_names",
+               "target_prices", "recommendations"]
+
+
+def result_record(file_name: str, result: DocumentAnalysis, metrics: Optional[dict] = None) -> dict:
+    """Builds the typed record of a processed Document, as written by the JSONL/ Parquet writers.
+
+    Fields:
+        file_name (str)
+        author_name, author_company, all_companies, canonical_companies, email_author_names, target_prices,
+        recommendations (List[str])
+        company_links (List[{"name": str, "company": str, "code": str, "score": float}])
+        price_reco_mapping (List[{"target_price": str, "recommendations": List[str]}])
+        metrics (dict, Refer DocumentMetrics.to_dict(). None if not available)
+
+    Args:
+        file_name (str): Name of the Document
+        result (DocumentAnalysis): The results of the Document
+        metrics (dict): The metrics of the Document
+
+    Returns:
+        dict: The record
+    """
+    record = {"file_name": file_name}
+
+    for field in LIST_FIELDS:
+        record[field] = [str(value) for value in getattr(result, field)]
+
+    record["company_links"] = [{"name": name, "company": company, "code": code, "score": float(score)}
+                               for name, company, code, score in result.company_links]
+
+    # Every mapping is a single {Target Price: [Recommendations]} dict (Refer
+    # DocumentExtractor._collect_target_price_and_recommendation()); its key is turned into a field of its own
+    record["price_reco_mapping"] = [{"target_price": str(target_price), "recommendations": list(recommendations)}
+                                    for mapping in result.price_reco_mapping
+                                    for target_price, recommendations in mapping.items()]
+
+    record["metrics"] = metrics
+
+    return record
+
+
+class ResultWriter(object):
+    """Base class of the Result Writers (Sinks of the results of the processed Documents).
+
+    Writers are append-only: Results already within the sink are kept, and done_files() lists the Documents
+    they belong to, so an interrupted run can be resumed without reprocessing them.
+
+    Documents which could not be processed are recorded, with the reason, in Failed_Documents.csv (Common to all
+    the formats. Refer write_failure()). They are not within done_files(), so a resumed run retries them.
+    """
+
+    # Name of the writer, as used by get_result_writer()
+    name = ""
+
+    def __init__(self, results_path: str = "Results", resume: bool = False):
+        """Constructor for the class ResultWriter().
+
+        Args:
+            results_path (str): Folder the results are written to
+            resume (bool): Keep the results already within the sink (And append to them). Otherwise the sink
+                           is started afresh
+        """
+        self.results_path = results_path
+        self.resume = resume
+
+        self.failures_path = os.path.join(results_path, "Failed_Documents.csv")
+        self.failures_file = None
+        self.failures_writer = None
+
+        if not resume and os.path.exists(self.failures_path):
+            os.remove(self.failures_path)
+
+    def done_files(self) -> Set[str]:
+        """Returns the names of the Documents whose results are already within the sink."""
+
+        raise NotImplementedError
+
+    def write(self, file_name: str, result: DocumentAnalysis, metrics: Optional[dict] = None) -> None:
+        """Writes the results of a processed Document.
+
+        Args:
+            file_name (str): Name of the Document
+            result (DocumentAnalysis): The results of the Document
+            metrics (dict): The metrics of the Document (Refer DocumentMetrics.to_dict())
+        """
+        raise NotImplementedError
+
+    def write_failure(self, file_name: str, error: str) -> None:
+        """Records a Document which could not be processed.
+
+        Args:
+            file_name (str): Name of the Document
+            error (str): The reason (Eg. "timeout: ...". Refer BatchProcessor.process_batch())
+        """
+        if self.failures_file is None:
+
+            write_headers = not os.path.exists(self.failures_path)
+
+            # Line buffered (Refer CsvResultWriter), and only created once a Document fails
+            self.failures_file = open(self.failures_path, "a", buffering=1)
+            self.failures_writer = csv.writer(self.failures_file)
+
+            if write_headers:
+                self.failures_writer.writerow(['File Name', 'Error'])
+
+        self.failures_writer.writerow([file_name, error])
+
+    def flush(self) -> None:
+        """Makes the results written so far durable (As far as the format allows)."""
+
+    def close(self) -> None:
+        """Flushes and closes the sink."""
+
+        if self.failures_file is not None:
+            self.failures_file.close()
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class CsvResultWriter(ResultWriter):
+    """The legacy format: Name_Org_Results.csv and Target_Price_Reco_Results.csv, with the List fields written as
+    Python literals (str(list)). Kept for compatibility; prefer "jsonl"/ "parquet" for downstream processing."""
+
+    name = "csv"
+
+    NAME_ORG_FIELDS = ['File Name', 'Author Name - Through Email',
+                       'Author Name - Through Spacy Model',
+                       'Author Institution Through Spacy Model',
+                       'All Companies Through Spacy Model']
+
+    TARGET_PRICE_FIELDS = ['File Name', 'Target Price', 'Recommendation', 'Price - Recommendation Mapping']
+
+    def __init__(self, results_path: str = "Results", resume: bool = False):
+        super().__init__(results_path, resume)
+
+        self.name_org_path = os.path.join(results_path, "Name_Org_Results.csv")
+        self.target_price_path = os.path.join(results_path, "Target_Price_Reco_Results.csv")
+
+        write_headers = not (resume and os.path.exists(self.name_org_path))
+        mode = "a" if resume else "w"
+
+        # Line buffered, so every written Document is in the file (For resume) right away
+        self.name_org_file = open(self.name_org_path, mode, buffering=1)
+        self.name_org_writer = csv.writer(self.name_org_file)
+
+        self.target_price_file = open(self.target_price_path, mode, buffering=1)
+        self.target_price_writer = csv.writer(self.target_price_file)
+
+        if write_headers:
+            self.name_org_writer.writerow(self.NAME_ORG_FIELDS)
+            self.target_price_writer.writerow(self.TARGET_PRICE_FIELDS)
+
+    def done_files(self) -> Set[str]:
+
+        if not os.path.exists(self.name_org_path):
+            return set()
+
+        with open(self.name_org_path, newline="") as file:
+            return {row['File Name'] for row in csv.DictReader(file)}
+
+    def write(self, file_name: str, result: DocumentAnalysis, metrics: Optional[dict] = None) -> None:
+
+        self.name_org_writer.writerow([file_name, result.email_author_names, result.author_name,
+                                       result.author_company, result.all_companies])
+        self.target_price_writer.writerow([file_name, result.target_prices, result.recommendations,
+                                           result.price_reco_mapping])
+
+    def flush(self) -> None:
+        self.name_org_file.flush()
+        self.target_price_file.flush()
+
+    def close(self) -> None:
+        super().close()
+        self.name_org_file.close()
+        self.target_price_file.close()
+
+
+class JsonlResultWriter(ResultWriter):
+    """Results.jsonl: One typed JSON record per Document (Refer result_record()), streamed as they come in."""
+
+    name = "jsonl"
+
+    def __init__(self, results_path: str = "Results", resume: bool = False):
+        super().__init__(results_path, resume)
+
+        self.path = os.path.join(results_path, "Results.jsonl")
+
+        # The last line of an interrupted run may be incomplete. Start the new records on a line of their own
+        incomplete_line = False
+        if resume and os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            with open(self.path, "rb") as file:
+                file.seek(-1, os.SEEK_END)
+                incomplete_line = file.read(1) != b"\n"
+
+        # Line buffered, so every written Document is in the file (For resume) right away
+        self.file = open(self.path, "a" if resume else "w", buffering=1)
+
+        if incomplete_line:
+            self.file.write("\n")
+
+    def done_files(self) -> Set[str]:
+
+        done = set()
+
+        if not os.path.exists(self.path):
+            return done
+
+        with open(self.path) as file:
+            for line in file:
+
+                # The last line of an interrupted run may be incomplete
+                try:
+                    done.add(json.loads(line)["file_name"])
+                except (ValueError, KeyError):
+                    continue
+
+        return done
+
+    def write(self, file_name: str, result: DocumentAnalysis, metrics: Optional[dict] = None) -> None:
+        self.file.write(json.dumps(result_record(file_name, result, metrics)) + "\n")
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        super().close()
+        self.file.close()
+
+
+class ParquetResultWriter(ResultWriter):
+    """Results.parquet/: Typed records (Refer result_record()) with List columns, through pyarrow.
+
+    Records are buffered, and every <row_group_size> Documents (And on flush()/ close()) written out as a
+    complete part file of its own within the folder. Earlier part files are never rewritten, and a crash only
+    loses the records still buffered. The metrics are kept as a JSON string column.
+
+    The folder can be read as a single table, Eg. pyarrow.parquet.read_table("Results/Results.parquet").
+    """
+
+    name = "parquet"
+
+    def __init__(self, results_path: str = "Results", resume: bool = False, row_group_size: int = 1000):
+        super().__init__(results_path, resume)
+
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("The parquet result writer needs pyarrow: pip install pyarrow")
+
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+
+        self.schema = pyarrow.schema(
+            [("file_name", pyarrow.string())] +
+            [(field, pyarrow.list_(pyarrow.string())) for field in LIST_FIELDS] +
+            [("company_links", pyarrow.list_(pyarrow.struct([("name", pyarrow.string()),
+                                                             ("company", pyarrow.string()),
+                                                             ("code", pyarrow.string()),
+                                                             ("score", pyarrow.float64())]))),
+             ("price_reco_mapping", pyarrow.list_(pyarrow.struct([("target_price", pyarrow.string()),
+                                                                  ("recommendations",
+                                                                   pyarrow.list_(pyarrow.string()))]))),
+             ("metrics", pyarrow.string())])
+
+        self.path = os.path.join(results_path, "Results.parquet")
+        self.row_group_size = row_group_size
+
+        # Without <resume>, the earlier results are dropped. Otherwise, only unreadable part files are (Their
+        # Documents are not within done_files(), and are processed again), along with partly written ones
+        for part_file in self.part_files():
+            if not resume or self.part_file_names(part_file) is None:
+                os.remove(part_file)
+
+        for temp_file in glob.glob(os.path.join(self.path, "part-*.parquet.tmp")):
+            os.remove(temp_file)
+
+        os.makedirs(self.path, exist_ok=True)
+
+        self.rows: List[dict] = []
+
+    def part_files(self) -> List[str]:
+        """Returns the part files within the sink."""
+
+        return sorted(glob.glob(os.path.join(self.path, "part-*.parquet")))
+
+    def part_file_names(self, part_file: str) -> Optional[List[str]]:
+        """Returns the names of the Documents within a part file. None if the part file can not be read."""
+
+        # The part file of an interrupted run has no footer, and can not be read
+        try:
+            return self.pq.read_table(part_file, columns=["file_name"]).column("file_name").to_pylist()
+        except (OSError, self.pa.ArrowInvalid):
+            return None
+
+    def done_files(self) -> Set[str]:
+
+        done = set()
+
+        for part_file in self.part_files():
+            done.update(self.part_file_names(part_file) or [])
+
+        return done
+
+    def write(self, file_name: str, result: DocumentAnalysis, metrics: Optional[dict] = None) -> None:
+
+        record = result_record(file_name, result, metrics)
+        record["metrics"] = json.dumps(metrics) if metrics is not None else None
+
+        self.rows.append(record)
+
+        if len(self.rows) >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+
+        if len(self.rows) == 0:
+            return
+
+        # Numbered after the last part file. Written to a temporary file first, and then moved in place, so a part
+        # file is always complete (Readable, with its footer)
+        part_files = self.part_files()
+        part_number = int(os.path.basename(part_files[-1])[len("part-"):-len(".parquet")]) + 1 if part_files else 0
+
+        part_path = os.path.join(self.path, "part-%05d.parquet" % part_number)
+
+        self.pq.write_table(self.pa.Table.from_pylist(self.rows, schema=self.schema), part_path + ".tmp")
+        os.replace(part_path + ".tmp", part_path)
+
+        self.rows = []
+
+    def close(self) -> None:
+        super().close()
+
+        self.flush()
+
+
+RESULT_WRITERS: Dict[str, type] = {writer.name: writer for writer in [CsvResultWriter,
+                                                                      JsonlResultWriter,
+                                                                      ParquetResultWriter]}
+
+
+def get_result_writer(output_format: str, results_path: str = "Results", resume: bool = False) -> ResultWriter:
+    """Opens the Result Writer of the format <output_format>.
+
+    Args:
+        output_format (str): Name of the format. Refer RESULT_WRITERS
+        results_path (str): Folder the results are written to
+        resume (bool): Keep (And append to) the results already within the sink
+
+    Returns:
+        ResultWriter: The writer
+    """
+    if output_format not in RESULT_WRITERS:
+        raise ValueError("Unknown output format: " + output_format + ". Available: " + ", ".join(RESULT_WRITERS))
+
+    return RESULT_WRITERS[output_format](results_path, resume)
@@ -0,0 +1,317 @@
+# General Python Imports
+from typing import Iterable, List, Optional, Tuple, Union
+import bisect
+import hashlib
+
+# Regex Import
+import re
+
+
+# We search for the Target Price/ Recommendation "around" target price/ price target text
+DEFAULT_TARGET_PRICE_TAGS = ['target price', 'price target']
+
+# These are Potential Recommendation Tags
+DEFAULT_RECOMMENDATION_TAGS = ['buy', 'sell', 'neutral', 'add', 'reduce', 'hold', 'outperform', 'maintain',
+                               'peer perform', 'mkt perform', 'recomm list', 'equal weight']
+
+
+class TagMatcher(object):
+    """Finds every occurrence of a list of (plain text) tags within a text, in a single pass.
+
+    All the tags are compiled once (at construction) into a single alternation Reg-Exp, so scanning a text
+    is linear in the length of the text, irrespective of the number of tags.
+    """
+
+    def __init__(self, tags: List[str]):
+        """Constructor for the class TagMatcher().
+
+        Args:
+            tags (List[str]): The tags to search for. Matched as plain (lower case) text, not as Reg-Exps
+        """
+        self.tags = []
+
+        for tag in tags:
+            if len(tag) > 0 and tag.lower() not in self.tags:
+                self.tags.append(tag.lower())
+
+        # Longer tags are tried first. A tag which is a prefix of the matched tag also occurs at the same
+        # position, and is reported through self.prefix_tags
+        order = sorted(range(len(self.tags)), key=lambda ind: -len(self.tags[ind]))
+
+        # Group <n + 1> of the Reg-Exp corresponds to the tag self.tags[self.group_tags[n]]
+        self.group_tags = order
+
+        self.prefix_tags = [[other for other in order if other != ind and self.tags[ind].startswith(self.tags[other])]
+                            for ind in range(len(self.tags))]
+
+        # The look-ahead (?=...) lets the matches of different tags overlap, just like searching each tag separately
+        alternation = "|".join("(" + re.escape(self.tags[ind]) + ")" for ind in order)
+        self.pattern = re.compile("(?=(?:" + alternation + "))") if len(self.tags) > 0 else None
+
+    def find(self, text: str) -> List[Tuple[int, int, int]]:
+        """Finds every occurrence of the tags within <text>.
+
+        Args:
+            text (str): The text to search
+
+        Returns:
+            List[Tuple[int, int, int]]: (Start Index, End Index, Tag Index) of every occurrence, ordered by the
+                                        Start Index. Tag Index is the index of the tag within self.tags
+        """
+        occurrences = []
+
+        if self.pattern is None:
+            return occurrences
+
+        for match in self.pattern.finditer(text):
+
+            start = match.start()
+            tag_ind = self.group_tags[match.lastindex - 1]
+
+            occurrences.append((start, start + len(self.tags[tag_ind]), tag_ind))
+
+            for prefix_ind in self.prefix_tags[tag_ind]:
+                occurrences.append((start, start + len(self.tags[prefix_ind]), prefix_ind))
+
+        return occurrences
+
+
+class TargetPriceExtractor(object):
+    """Searches for Target Prices/ Recommendations in the Text of a Document (Financial Doc), through Reg-Exps only.
+
+    Needs nothing but the Python Standard Library, so it imports (And runs its first call) in milliseconds. Works
+    on Text already extracted (Refer extract()); DocumentExtractor delegates its Target Price/ Recommendation
+    extraction to it.
+
+    Eg. TargetPriceExtractor().extract("Target Price: Rs 1,100. We maintain BUY")
+        --> ([{'1,100': ['buy', 'maintain']}], ['1,100'], ['buy', 'maintain'])
+    """
+
+    def __init__(self, target_price_tags: Optional[List[str]] = None,
+                 recommendation_tags: Optional[List[str]] = None):
+        """Constructor for the class TargetPriceExtractor().
+
+        Args:
+            target_price_tags (List[str]): Text around which Target Prices/ Recommendations are searched for.
+                                           Defaults to DEFAULT_TARGET_PRICE_TAGS
+            recommendation_tags (List[str]): Recommendations to search for. Defaults to DEFAULT_RECOMMENDATION_TAGS
+        """
+        # All the tags are compiled once, into a single matcher; every page is scanned once for all of them
+        self.target_price_tags = TagMatcher(target_price_tags or DEFAULT_TARGET_PRICE_TAGS).tags
+        self.recommendation_tags = [tag for tag in TagMatcher(recommendation_tags or DEFAULT_RECOMMENDATION_TAGS).tags
+                                    if tag not in self.target_price_tags]
+
+        self.tag_matcher = TagMatcher(self.target_price_tags + self.recommendation_tags)
+        self.recommendation_matcher = TagMatcher(self.recommendation_tags)
+
+    def cache_key(self) -> str:
+        """Returns a key identifying the tags searched for (The results of a Document depend on them)."""
+
+        tags = "|".join(self.target_price_tags) + "||" + "|".join(self.recommendation_tags)
+
+        return "tp-" + hashlib.sha1(tags.encode("utf-8")).hexdigest()[:16]
+
+    def extract(self, pages: Union[str, Iterable[str]]) -> Tuple[List[dict], List[str], List[str]]:
+        """Searches for a Target Price/ Recommendations in the Text of a Document.
+
+        Args:
+            pages (Union[str, Iterable[str]]): The Text of the Document, as a single str, or page wise
+
+        Returns:
+            price_recommendations_list (List[dict]) : A mapping between the Target Price and
+                                                      Corresponding Recommendations
+            target_price_list (List[str]) : All Extracted Target Price from the Text
+            recommendation_list (List[str]) : All Extracted Recommendations from the Text
+        """
+        if isinstance(pages, str):
+            pages = [pages]
+
+        price_recommendations_list, target_price_list, recommendation_list = [], [], []
+
+        for text in pages:
+            self.collect(text, price_recommendations_list, target_price_list, recommendation_list)
+
+        return price_recommendations_list, target_price_list, recommendation_list
+
+    def collect(self, text: str,
+                price_recommendations_list: List[dict],
+                target_price_list: List[str],
+                recommendation_list: List[str]) -> int:
+        """Searches for a Target Price/ Recommendations in a single page of a Document
+
+        The page is scanned once for all the Target Price and Recommendation tags (Refer self.tag_matcher).
+        The Target Price/ Recommendations are then extracted around the offsets of every Target Price tag.
+
+        Args:
+            text (str): Text of the page of interest
+            price_recommendations_list (List[dict]) : Mapping between the Target Price and Recommendations
+            target_price_list (List[str]) : Extracted Target Prices
+            recommendation_list (List[str]) : Extracted Recommendations
+
+        Returns:
+            int: Number of hits on the Target Price/ Recommendation tags within the page
+        """
+        # Remove \n literals to help with text processing
+        filtered_text = text.lower().replace('\n', '')
+
+        # Search the Document for possible search hits on all the tags (target price/ price target/ buy/ sell...)
+        target_hits, reco_hits = self.find_tags(filtered_text)
+        reco_hit_starts = [hit[0] for hit in reco_hits]
+
+        # Check all Possible Target Price Tags (target price/ price target). The hits are ordered by the tag
+        # (In the order of self.target_price_tags), and then by the position within the page
+        for span in target_hits:
+
+            # For Target Price, search the Text upto 15 Characters "Right" of "target price/ price target"
+            target_price_search_start_ind = span[0]
+            target_price_search_end_ind = span[1] + 15
+
+            # For Recommendations, search the Text upto 50 Characters "Right" and "Left of
+            # "target price/ price target"
+            reco_search_start_ind = max(span[0] - 50, 0)
+            reco_search_end_ind = span[1] + 50
+
+            target_price_search_str = filtered_text[target_price_search_start_ind:
+                   target_price_search_end_ind + 1]
+
+            # Get the Target Price and Recommendations
+
+            # target_price is a single "str"
+            target_price = self.extract_target_prices_from_text(target_price_search_str)
+
+            # recommendations is a List[str]
+            recommendations = self.recommendations_within(reco_hits, reco_hit_starts,
+                                                          reco_search_start_ind,
+                                                          min(reco_search_end_ind + 1, len(filtered_text)))
+
+            # Store the Target-Price
+            if len(target_price) > 0 and target_price not in target_price_list:
+                target_price_list.append(target_price)
+
+            # Store the Recommendations
+            for recommendation in recommendations:
+
+                if recommendation not in recommendation_list:
+                    recommendation_list.append(recommendation)
+
+            # If we Found a valid Target Price; add Target Price and Recommendation Mapping to the list
+            if len(target_price) > 0:
+
+                price_recom_dict = {target_price: recommendations}
+                if price_recom_dict not in price_recommendations_list:
+
+                    price_recommendations_list.append(price_recom_dict)
+
+        return len(target_hits) + len(reco_hits)
+
+    def find_tags(self, text: str) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int, int]]]:
+        """Scans <text> once for all the Target Price and Recommendation tags.
+
+        Args:
+            text (str): Text of interest (Lower case)
+
+        Returns:
+            target_hits (List[Tuple[int, int]]): (Start, End) of every Target Price tag hit. Ordered by the tag
+                                                 (In the order of self.target_price_tags), then by the position.
+                                                 Hits of a tag do not overlap each other (Same as re.finditer())
+            reco_hits (List[Tuple[int, int, int]]): (Start, End, Tag Index) of every Recommendation tag hit,
+                                                    ordered by the position
+        """
+        num_target_tags = len(self.target_price_tags)
+
+        target_hits = [[] for _ in range(num_target_tags)]
+        reco_hits = []
+
+        for start, end, tag_ind in self.tag_matcher.find(text):
+
+            if tag_ind >= num_target_tags:
+                reco_hits.append((start, end, tag_ind))
+
+            # Skip a hit which overlaps the previous hit of the same tag
+            elif len(target_hits[tag_ind]) == 0 or target_hits[tag_ind][-1][1] <= start:
+                target_hits[tag_ind].append((start, end))
+
+        return [hit for tag_hits in target_hits for hit in tag_hits], reco_hits
+
+    def recommendations_within(self, reco_hits: List[Tuple[int, int, int]],
+                               reco_hit_starts: List[int],
+                               start: int,
+                               end: int) -> List[str]:
+        """Returns the Recommendation tags which occur (completely) within text[start: end].
+
+        Args:
+            reco_hits (List[Tuple[int, int, int]]): Recommendation tag hits within the text. Refer find_tags()
+            reco_hit_starts (List[int]): Start Index of every hit in <reco_hits>
+            start (int): Start Index of the text window of interest
+            end (int): End Index (Exclusive) of the text window of interest
+
+        Returns:
+            List[str]: The Recommendations, in the order of self.recommendation_tags
+        """
+        found_tags = set()
+
+        for hit_ind in range(bisect.bisect_left(reco_hit_starts, start), len(reco_hits)):
+
+            hit_start, hit_end, tag_ind = reco_hits[hit_ind]
+
+            if hit_start >= end:
+                break
+
+            if hit_end <= end:
+                found_tags.add(tag_ind)
+
+        return [self.tag_matcher.tags[tag_ind] for tag_ind in sorted(found_tags)]
+
+    def extract_target_prices_from_text(self, text: str) -> str:
+        """Searches for Target Price from the <text> of interest
+
+            Does a Reg-Exp search to obtain the Target Price
+
+        Args:
+            text (str): Text to Extract Target Prices from
+
+        Returns:
+            price_filtered[0] (str): The Target Price
+        """
+        # If the text is something like: "target price rs.1,1000 (24 %)"
+        # OP will be like ['target price rs.1,100', '(24']
+        prices = re.findall(r' \(*[a-zA-Z \`\~]*\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{3})*', text)
+
+        if len(prices) == 0:
+            return ""
+
+        # Work with 'target price rs.1,100' only (i.e. Text closest to "target price")
+        price = prices[0]
+
+        price_text = price.strip()
+
+        # Do one more level of Text Filtration, to obtain the Raw Number (1,100)
+        price_filtered = re.findall(r'\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{2})*', price_text)
+
+        return price_filtered[0]
+
+    def extract_recommendations_from_text(self, text: str) -> List[str]:
+        """Searches for Financial Recommendations from the <text> of interest
+
+            Does a Reg-Exp search to obtain the Financial Recommendations, and returns any
+            word that matches any of the words in <self.recommendation_tags>
+
+        Args:
+            text (str): Text to Extract Recommendations from
+
+        Returns:
+            reco_list (List[str]): The Recommendations
+        """
+        reco_list = []
+
+        # Get Any text that match with a String in self.recommendation_tags (A single scan over the text)
+        recommendations = sorted(set(tag_ind for _, _, tag_ind in self.recommendation_matcher.find(text)))
+
+        for tag_ind in recommendations:
+
+            recommendation = self.recommendation_matcher.tags[tag_ind]
+
+            if recommendation not in reco_list:
+                reco_list.append(recommendation)
+
+        return reco_list
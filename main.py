@@ -1,74 +1,112 @@
 import os
-import csv
+import json
+import argparse
 
-from DocumentExtractor import DocumentExtractor
+from BatchProcessor import add_worker_arguments, list_pdf_files, process_batch, worker_config_from_args
+from CorpusIndex import CorpusIndex
+from ResultWriters import RESULT_WRITERS, get_result_writer
 
 
 if __name__ == "__main__":
 
-    obj = DocumentExtractor()
-    obj.train_entity_ruler()
-
-    BASE_PATH = "needle_pdf_docs"
-    fields = ['File Name', 'Author Name - Through Email',
-              'Author Name - Through Spacy Model',
-              'Author Institution Through Spacy Model',
-              'All Companies Through Spacy Model']
-
-    f = open("Results//Name_Org_Results.csv", "w")
-    write = csv.writer(f)
-    write.writerow(fields)
-
-    fields2 = ['File Name', 'Target Price', 'Recommendation', 'Price - Recommendation Mapping']
-    f2 = open("Results//Target_Price_Reco_Results.csv", "w")
-    write2 = csv.writer(f2)
-    write2.writerow(fields2)
-
-    count = 0
-    for filename in os.listdir(BASE_PATH):
-        if filename.endswith(".pdf"):
-
-            pdf_file = BASE_PATH + "//" + filename
-            pdf_file = os.path.abspath(pdf_file)
-
-            try:
-
-                # Get Author/ ORG name through SPACY Model
-                author_name, author_company, all_company = obj.extract_name_and_org_from_pdf(pdf_file)
-
-                # Get Author Names through the text around EMAIL IDs, as SPACY's NER for Indian Person names dont
-                #  work great
-                email_author_names = obj.extract_name_around_email(pdf_file)
-
-                fields = [filename, email_author_names, author_name, author_company, all_company]
-
-                write.writerow(fields)
-
-                print("Count", count)
-                print("File Name", filename)
-                print("email_author_names", email_author_names)
-                print("author_name", author_name)
-                print("author_company", author_company)
-                print("all_company", all_company)
-
-                price_reco_mapping, target_price, recommendations = obj.get_target_price_and_recommendation(pdf_file)
-
-                fields_recommend = [filename, target_price, recommendations, price_reco_mapping]
-
-                write2.writerow(fields_recommend)
-                print("target_price", target_price)
-                print("recommendations", recommendations)
-                print("price_reco_mapping", price_reco_mapping)
-
-                print("\n\n")
-
-            except Exception as e:
-                print("Exception processing File", pdf_file, "\n Excepton: ", e)
+    parser = argparse.ArgumentParser(description="Processes the PDFs in <base_path>, and saves the Results")
+    parser.add_argument("--base_path", default="needle_pdf_docs", help="Folder containing the PDF Documents")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of worker processes (1 processes the Documents serially)")
+    parser.add_argument("--chunksize", type=int, default=1,
+                        help="Number of Documents handed to a worker process at a time. Their pages share SPACY's "
+                             "batches (Helps with many short PDFs)")
+    parser.add_argument("--cache_path", default=".extraction_cache.sqlite",
+                        help="SQLite file caching the Extraction Results of unchanged PDFs")
+    parser.add_argument("--no_cache", action="store_true", help="Reprocess every PDF, without using the cache")
+    add_worker_arguments(parser)
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="Wall-clock limit per PDF, in Seconds. A PDF over it has its worker killed (And "
+                             "replaced), and is recorded as failed. Turns on the supervised mode")
+    parser.add_argument("--memory_limit_mb", type=float, default=None,
+                        help="Memory a worker may use for a PDF, over the one it holds once the SPACY Model is "
+                             "loaded (Linux only). Turns on the supervised mode")
+    parser.add_argument("--max_tasks_per_worker", type=int, default=None,
+                        help="Replace every worker after this many PDFs, to bound leaks. Turns on the supervised mode")
+    parser.add_argument("--output_format", default="csv", choices=list(RESULT_WRITERS),
+                        help="Format of the Results (Refer ResultWriters.py)")
+    parser.add_argument("--results_path", default="Results", help="Folder the Results are written to")
+    parser.add_argument("--resume", action="store_true",
+                        help="Keep the Results of an earlier run, and skip the PDFs already within them")
+    parser.add_argument("--index_path", default=None,
+                        help="SQLite file of the Companies/ Authors Index, updated with every processed PDF "
+                             "(Refer CorpusIndex.py)")
+    args = parser.parse_args()
+
+    cache_path = None if args.no_cache else args.cache_path
+
+    BASE_PATH = args.base_path
+
+    # "csv" writes Results//Name_Org_Results.csv and Results//Target_Price_Reco_Results.csv (Python lists as Text),
+    # "jsonl"/ "parquet" write typed records (Refer ResultWriters.py)
+    writer = get_result_writer(args.output_format, args.results_path, args.resume)
+
+    # Every processed PDF is (Re-)indexed on its own; the rest of the Index is kept
+    index = CorpusIndex(args.index_path) if args.index_path is not None else None
+
+    pdf_files = list_pdf_files(BASE_PATH)
+
+    # Documents whose results are already within the sink (From an earlier, interrupted run) are not reprocessed
+    if args.resume:
+        done_files = writer.done_files()
+        pdf_files = [pdf_file for pdf_file in pdf_files if os.path.basename(pdf_file) not in done_files]
+
+    # The Results written so far are kept (And the sink closed properly) even if the run is interrupted
+    try:
+
+        # The Documents are fanned out to <workers> processes; the results stream back in order.
+        # Each worker warms up its own SPACY Model once (Refer BatchProcessor.init_worker())
+        count = 0
+        worker_config = worker_config_from_args(args, cache_path)
+        for pdf_file, result, error, metrics in process_batch(pdf_files, args.workers, args.chunksize,
+                                                              timeout=args.timeout,
+                                                              memory_limit_mb=args.memory_limit_mb,
+                                                              max_tasks_per_worker=args.max_tasks_per_worker,
+                                                              **worker_config):
+
+            filename = os.path.basename(pdf_file)
+
+            # One JSON line per Document: The results, and the timings/ counters of the Document
+            # (Refer DocumentMetrics)
+            record = {"count": count, "file_name": filename}
+
+            # Failed PDFs (Exceptions, and within the supervised mode: timeouts/ memory limits/ crashed workers)
+            # are recorded with the reason, in Results//Failed_Documents.csv
+            if error is not None:
+                record["error"] = error
+                writer.write_failure(filename, error)
+
+                # The Index no longer reflects a Document which now fails (Eg. Its PDF got corrupted)
+                if index is not None:
+                    index.remove_document(pdf_file)
+
+            else:
+
+                # Author/ ORG name through SPACY Model, Author Names through the text around EMAIL IDs,
+                # Target Price/ Recommendations through Reg-Exp
+                writer.write(filename, result, metrics)
+
+                # Keyed on the full path: Same-named PDFs of different folders are different Documents
+                if index is not None:
+                    index.add_document(pdf_file, result.entity_pages, metrics["content_hash"])
+
+                record.update(result.to_dict())
+                record["metrics"] = metrics
+
+            print(json.dumps(record), flush=True)
 
             count += 1
 
-    f.close()
-    f2.close()
+    finally:
+        writer.close()
+
+        if index is not None:
+            index.close()
 
 
 
@@ -82,3 +120,6 @@ if __name__ == "__main__":
 # email_names = obj.extract_name_around_email(pdf_file)
 #
 # price_reco_mapping, all_prices, all_reco = obj.get_target_price_and_recommendation(pdf_file)
+#
+# Or, all of the above in a single pass over the PDF:
+# result = obj.analyze(pdf_file)
@@ -0,0 +1,266 @@
+# Tests of the bounded-memory mode of DocumentExtractor (Refer DocumentExtractor(memory_bounded=True)).
+#
+# Spacy is replaced by a stand-in Pipeline (FakeNLP), and the PDF by a Backend generating text-heavy pages
+# (SyntheticBackend), so the tests only exercise the page windows/ splitting/ release logic of the Extractor.
+# The page windows are also checked against a real PDF of the corpus (When PyPDF2 is installed).
+import multiprocessing
+import os
+import tempfile
+
+import pytest
+
+from DocumentExtractor import MEMORY_BOUNDED_MAX_PAGE_CHARS, MEMORY_BOUNDED_PAGE_WINDOW, DocumentExtractor, \
+    current_rss_mb
+from PdfBackends import PdfTextBackend, PyPDF2Backend
+from ResultCache import ResultCache
+
+
+NUM_PAGES = 1000
+
+# ~100 KB of Text per page (Longer than MEMORY_BOUNDED_MAX_PAGE_CHARS); ~100 MB for the whole Document
+SENTENCE = "Net interest income of IndusInd Bank grew %d per cent over the quarter, as asset quality held. "
+SENTENCES_PER_PAGE = 1000
+
+# Max. RSS growth (Over the RSS of the process before the Document) allowed while processing the Document in the
+# bounded-memory mode. Not DocumentExtractor(rss_budget_mb=...), which bounds the RSS itself (Refer
+# test_rss_budget_reloads_the_pipeline())
+RSS_GROWTH_BOUND_MB = 64
+
+# Multi-page PDF of the corpus, read in several (Smaller than the default) page windows
+CORPUS_PDF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "needle_pdf_docs",
+                          "Citi - India Budget.pdf")
+CORPUS_PDF_WINDOW = 5
+
+
+def page_text(page: int) -> str:
+    return "".join(SENTENCE % (page * SENTENCES_PER_PAGE + ind) for ind in range(SENTENCES_PER_PAGE))
+
+
+class SyntheticBackend(PdfTextBackend):
+    """PDF Text Extraction Backend generating the pages of a synthetic <NUM_PAGES> page Document."""
+
+    name = "synthetic"
+    package = "synthetic-pdf-backend"
+
+    def __init__(self, num_pages: int = NUM_PAGES):
+        self.num_pages = num_pages
+        self.calls = []
+
+    def iter_pages(self, PDF_file, first_page=0, max_pages=None):
+
+        self.calls.append((first_page, max_pages))
+
+        last_page = self.num_pages if max_pages is None else min(self.num_pages, first_page + max_pages)
+
+        for page in range(first_page, last_page):
+            yield page_text(page)
+
+
+class RecordingPyPDF2Backend(PyPDF2Backend):
+    """The PyPDF2 Backend, recording the (First Page, Number of Pages) of every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def iter_pages(self, PDF_file, first_page=0, max_pages=None):
+
+        self.calls.append((first_page, max_pages))
+
+        yield from super().iter_pages(PDF_file, first_page, max_pages)
+
+
+class FakeSpan(object):
+
+    def __init__(self, label, text):
+        self.label_ = label
+        self.text = text
+
+
+class FakeDoc(object):
+
+    def __init__(self, text, entities=False):
+        self.text = text
+        self.tokens = text.split()
+        self.ents = [FakeSpan("ORG", "IndusInd Bank")] if entities and "IndusInd Bank" in text else []
+
+
+class FakeNLP(object):
+    """Stand-in for the Spacy Pipeline: Builds a Doc (Holding its Tokens) per Text, and samples the RSS.
+
+    With <entities> set, every Text mentioning "IndusInd Bank" gets it as an ORG.
+    """
+
+    def __init__(self, entities: bool = False):
+        self.entities = entities
+        self.texts = []
+        self.peak_rss_mb = 0.0
+
+    def pipe(self, items, as_tuples=False, **kwargs):
+
+        for text, context in items:
+
+            self.texts.append(len(text))
+            self.peak_rss_mb = max(self.peak_rss_mb, current_rss_mb())
+
+            yield FakeDoc(text, self.entities), context
+
+
+def analyze_synthetic(memory_bounded: bool, result_cache_path: str = None):
+    """Runs analyze() over the synthetic Document. Returns the Extractor, its Backend, FakeNLP and metrics."""
+
+    backend = SyntheticBackend()
+
+    result_cache = ResultCache(result_cache_path) if result_cache_path is not None else None
+
+    extractor = DocumentExtractor(result_cache=result_cache, pdf_backend=backend, memory_bounded=memory_bounded)
+    extractor.entity_model = nlp = FakeNLP()
+
+    # The key of the (Fake) Spacy Pipeline, within the ResultCache key
+    extractor._entity_ruler_cache_key = "fake-pipeline"
+
+    metrics = []
+    extractor.hooks.append(metrics.append)
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as pdf_file:
+        extractor.analyze(pdf_file.name, email_names=False, target_price=False)
+
+    return extractor, backend, nlp, metrics[0]
+
+
+def rss_growth_mb(memory_bounded: bool) -> float:
+    """Peak RSS growth (MB) of analyze() over the synthetic Document, with the (Page Text) ResultCache on."""
+
+    with tempfile.TemporaryDirectory() as temp_path:
+
+        start_rss_mb = current_rss_mb()
+        _, _, nlp, _ = analyze_synthetic(memory_bounded, os.path.join(temp_path, "cache.sqlite"))
+
+        return nlp.peak_rss_mb - start_rss_mb
+
+
+def run_in_fresh_process(function, *args):
+    """Runs <function> within a process of its own, so the RSS of one run does not carry over to the next."""
+
+    with multiprocessing.get_context("fork").Pool(1) as pool:
+        return pool.apply(function, args)
+
+
+requires_proc = pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="Needs the RSS from /proc")
+
+
+def test_split_page_text_covers_the_page():
+
+    text = page_text(7)
+    chunks = DocumentExtractor.split_page_text(text, MEMORY_BOUNDED_MAX_PAGE_CHARS)
+
+    assert "".join(chunks) == text
+    assert all(len(chunk) <= MEMORY_BOUNDED_MAX_PAGE_CHARS for chunk in chunks)
+
+    # Every chunk but the last ends at a sentence boundary
+    assert all(chunk.endswith(".") for chunk in chunks[:-1])
+
+
+def test_split_page_text_without_boundaries():
+
+    assert DocumentExtractor.split_page_text("x" * 25, 10) == ["x" * 10, "x" * 10, "x" * 5]
+    assert DocumentExtractor.split_page_text("ab cd ef", 5) == ["ab", " cd", " ef"]
+    assert DocumentExtractor.split_page_text("short", 10) == ["short"]
+
+
+def test_windows_and_chunks_cover_every_page():
+
+    extractor, backend, nlp, metrics = analyze_synthetic(memory_bounded=True)
+
+    # The pages are extracted window by window, in order, without gaps
+    assert all(max_pages <= MEMORY_BOUNDED_PAGE_WINDOW for _, max_pages in backend.calls)
+    assert [first_page for first_page, _ in backend.calls] == list(range(0, NUM_PAGES, MEMORY_BOUNDED_PAGE_WINDOW))
+    assert len(extractor.page_extraction_times) == NUM_PAGES
+
+    # Every page is split, and every character goes through the NER exactly once
+    assert metrics.pages == NUM_PAGES
+    assert metrics.split_pages == NUM_PAGES
+    assert max(nlp.texts) <= MEMORY_BOUNDED_MAX_PAGE_CHARS
+    assert sum(nlp.texts) == metrics.characters == sum(len(page_text(page)) for page in range(NUM_PAGES))
+
+
+@requires_proc
+def test_rss_growth_is_bounded():
+
+    assert run_in_fresh_process(rss_growth_mb, True) < RSS_GROWTH_BOUND_MB
+
+
+@requires_proc
+def test_rss_growth_is_not_bounded_without_the_mode():
+
+    # The Text of the whole (~100 MB) Document is held for the ResultCache, and every page is a single Doc
+    assert run_in_fresh_process(rss_growth_mb, False) > RSS_GROWTH_BOUND_MB
+
+
+@requires_proc
+def test_rss_budget_reloads_the_pipeline():
+
+    # Any process is over a 1 MB budget, so the Pipeline is reloaded before every Document but the first
+    extractor = DocumentExtractor(pdf_backend=SyntheticBackend(num_pages=5), rss_budget_mb=1)
+
+    pipelines = []
+
+    def train_entity_ruler(use_cache: bool = True) -> None:
+        pipelines.append(FakeNLP(entities=True))
+        extractor.entity_model = pipelines[-1]
+
+    extractor.train_entity_ruler = train_entity_ruler
+
+    metrics = []
+    extractor.hooks.append(metrics.append)
+
+    reference = DocumentExtractor(pdf_backend=SyntheticBackend(num_pages=5))
+    reference.entity_model = FakeNLP(entities=True)
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as pdf_file:
+
+        expected = reference.analyze(pdf_file.name, email_names=False, target_price=False).to_dict()
+        results = [extractor.analyze(pdf_file.name, email_names=False, target_price=False).to_dict()
+                   for _ in range(3)]
+
+    assert len(pipelines) == 3
+    assert all(document_metrics.over_rss_budget for document_metrics in metrics)
+    assert all(document_metrics.rss_mb > 1 for document_metrics in metrics)
+
+    # Every Document went through a Pipeline of its own, with the same results
+    assert all(len(nlp.texts) == 5 for nlp in pipelines)
+    assert expected["all_companies"] == ["indusind bank"]
+    assert results == [expected] * 3
+
+
+def test_windows_cover_every_page_of_a_corpus_pdf():
+
+    pytest.importorskip("PyPDF2")
+
+    def analyze_corpus_pdf(memory_bounded: bool):
+
+        backend = RecordingPyPDF2Backend()
+
+        extractor = DocumentExtractor(pdf_backend=backend, memory_bounded=memory_bounded)
+        extractor.entity_model = nlp = FakeNLP()
+
+        if memory_bounded:
+            extractor.page_window = CORPUS_PDF_WINDOW
+
+        metrics = []
+        extractor.hooks.append(metrics.append)
+
+        extractor.analyze(CORPUS_PDF, email_names=False, target_price=False)
+
+        return backend, nlp, metrics[0]
+
+    backend, nlp, metrics = analyze_corpus_pdf(memory_bounded=True)
+    reference_backend, reference_nlp, reference_metrics = analyze_corpus_pdf(memory_bounded=False)
+
+    # A 22 page PDF: Windows of 5, 5, 5, 5 and 2 pages
+    assert reference_metrics.pages == 22
+    assert reference_backend.calls == [(0, None)]
+    assert backend.calls == [(first_page, CORPUS_PDF_WINDOW) for first_page in range(0, 22, CORPUS_PDF_WINDOW)]
+
+    # The same pages, and the same Text, as when the PDF is read at once
+    assert metrics.pages == reference_metrics.pages
+    assert metrics.characters == reference_metrics.characters == sum(nlp.texts)
@@ -0,0 +1,101 @@
+# Tests of the compiled Name/ Company patterns (Refer GazetteerMatcher.PhrasePatterns), which restore the
+# EntityRuler without building a Doc per name.
+#
+# Runs on a blank English Pipeline (Tokenizer only), so no trained Model is needed.
+import os
+import tempfile
+
+import pytest
+
+spacy = pytest.importorskip("spacy")
+
+from Gazetteer import Gazetteer  # noqa: E402
+from GazetteerMatcher import PhrasePatterns  # noqa: E402
+
+
+TEXT = ("Rahul Sharma of IndusInd Bank Ltd. met Aarti Gupta, and later the board of Tata Motors Ltd. "
+        "indusind bank ltd. and RAHUL SHARMA are written in another case.")
+
+
+def build_gazetteer() -> Gazetteer:
+
+    gazetteer = Gazetteer()
+    gazetteer.add_names("PERSON", ["Rahul Sharma", "Aarti Gupta", "Sharma"])
+    gazetteer.add_names("ORG", ["IndusInd Bank Ltd.", "Tata Motors Ltd.", "Tata Motors"])
+
+    return gazetteer
+
+
+def entities(doc):
+    return [(span.start, span.end, span.label_) for span in doc.ents]
+
+
+def test_save_load_round_trip():
+
+    nlp = spacy.blank("en")
+    patterns = PhrasePatterns.from_gazetteer(nlp, build_gazetteer(), "LOWER")
+
+    with tempfile.TemporaryDirectory() as temp_path:
+
+        path = os.path.join(temp_path, "patterns.bin")
+        patterns.save(path)
+        loaded = PhrasePatterns.load(path)
+
+    assert loaded.attr == "LOWER"
+    assert len(loaded) == len(patterns) == 6
+    assert {label: loaded.keys(label) for label in loaded.labels()} == \
+           {label: patterns.keys(label) for label in patterns.labels()}
+
+
+def test_entity_ruler_from_patterns_matches_add_patterns():
+
+    from spacy.pipeline import EntityRuler
+
+    gazetteer = build_gazetteer()
+
+    # Reference: The EntityRuler built from plain-string patterns
+    reference_nlp = spacy.blank("en")
+    reference_ruler = EntityRuler(reference_nlp)
+    reference_ruler.add_patterns(list(gazetteer.patterns()))
+    reference_nlp.add_pipe(reference_ruler)
+
+    # The EntityRuler restored from the compiled (Saved, then loaded) patterns
+    nlp = spacy.blank("en")
+
+    with tempfile.TemporaryDirectory() as temp_path:
+
+        path = os.path.join(temp_path, "patterns.bin")
+        PhrasePatterns.from_gazetteer(nlp, gazetteer, "ORTH").save(path)
+
+        ruler = EntityRuler(nlp)
+        PhrasePatterns.load(path).add_to(ruler.phrase_matcher)
+        nlp.add_pipe(ruler)
+
+    expected = entities(reference_nlp(TEXT))
+
+    assert len(expected) == 4
+    assert entities(nlp(TEXT)) == expected
+
+
+def test_gazetteer_matcher_from_disk_skips_the_tokenizer():
+
+    from GazetteerMatcher import GazetteerMatcher
+
+    nlp = spacy.blank("en")
+    matcher = GazetteerMatcher(nlp, gazetteer=build_gazetteer())
+    expected = entities(matcher(nlp.make_doc(TEXT)))
+
+    with tempfile.TemporaryDirectory() as temp_path:
+
+        matcher.to_disk(temp_path)
+
+        # Loading the component must not tokenize any name again
+        loaded_nlp = spacy.blank("en")
+        tokenizer = loaded_nlp.tokenizer
+        loaded_nlp.tokenizer = None
+        loaded = GazetteerMatcher(loaded_nlp).from_disk(temp_path)
+        loaded_nlp.tokenizer = tokenizer
+
+    # Case-insensitive: "RAHUL SHARMA" is tagged too
+    assert (23, 25, "PERSON") in expected
+    assert entities(loaded(loaded_nlp.make_doc(TEXT))) == expected